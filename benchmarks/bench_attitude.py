@@ -0,0 +1,59 @@
+"""
+Cached versus per-call construction of the attitude rotation matrix.
+
+Every detection of a frame is rotated from the body frame into the world frame, either with the matrix
+cached on the `Attitude` or with a matrix rebuilt from the angles for each detection. The batched
+`detections_to_global_coordinates_3d` is shown for reference.
+
+Run from the repository root with: python -m benchmarks.bench_attitude
+"""
+import timeit
+
+import numpy as np
+
+from uprm_gps_utils import Attitude, Location, detections_to_global_coordinates_3d
+from uprm_gps_utils.uprm_gps_utils import _rotation_matrix
+
+
+VEHICLE = Location.from_gps(lat=18.211042912960064, lon=-67.14093251407316)
+ATTITUDE = Attitude.from_deg(yaw=75, roll=8, pitch=-3)
+DETECTIONS = 10000
+
+_rng = np.random.default_rng(0)
+DISTANCES = _rng.uniform(1, 100, DETECTIONS)
+ANGLES = _rng.uniform(-180, 180, DETECTIONS)
+ELEVATIONS = _rng.uniform(-5, 5, DETECTIONS)
+BODY_POINTS = list(zip(_rng.uniform(-50, 50, DETECTIONS).tolist(), _rng.uniform(-50, 50, DETECTIONS).tolist(),
+                       _rng.uniform(-2, 2, DETECTIONS).tolist()))
+
+
+def per_call_matrix():
+    for forward, right, down in BODY_POINTS:
+        (r11, r12, r13), (r21, r22, r23), (r31, r32, r33) = _rotation_matrix(ATTITUDE.yaw_rad, ATTITUDE.pitch_rad,
+                                                                             ATTITUDE.roll_rad)
+        (r11 * forward + r12 * right + r13 * down,
+         r21 * forward + r22 * right + r23 * down,
+         r31 * forward + r32 * right + r33 * down)
+
+
+def cached_matrix():
+    for forward, right, down in BODY_POINTS:
+        ATTITUDE.body_to_world(forward, right, down)
+
+
+def batched():
+    detections_to_global_coordinates_3d(VEHICLE, ATTITUDE, DISTANCES, ANGLES, ELEVATIONS)
+
+
+def best_time(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+if __name__ == "__main__":
+    print(f"{DETECTIONS} detections per frame\n")
+    print(f"{'method':<24} | {'frame (ms)':>10} | {'per detection (ns)':>18}")
+    for name, func, number in (("per-call matrix", per_call_matrix, 5),
+                               ("cached matrix", cached_matrix, 5),
+                               ("batched, cached matrix", batched, 50)):
+        seconds = best_time(func, number)
+        print(f"{name:<24} | {seconds * 1e3:>10.2f} | {seconds / DETECTIONS * 1e9:>18.1f}")
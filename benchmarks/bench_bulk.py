@@ -0,0 +1,63 @@
+"""
+Scaling of `bulk_from_gps` with the number of workers, against a `Location.from_gps` loop and a single
+`LocationArray` pass.
+
+Thread and process pools run with 1 up to N workers, N being the number of CPUs by default. The speedup is
+relative to one worker of the same kind, and the results are checked against the single pass.
+
+Run from the repository root with: python -m benchmarks.bench_bulk [points] [max workers]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+from uprm_gps_utils import Location, LocationArray, bulk_from_gps
+
+
+POINTS = 5000000
+LOOP_POINTS = 100000
+CHUNK_SIZE = 1 << 18
+
+
+def seconds(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def report(name: str, workers, elapsed: float, points: int, speedup: str=""):
+    print(f"{name:<32} | {workers:>7} | {elapsed * 1e3:>10.1f} | {points / elapsed / 1e6:>9.2f} | {speedup:>7}")
+
+
+if __name__ == "__main__":
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else POINTS
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    rng = np.random.default_rng(0)
+    lat = rng.uniform(17.9, 18.5, points)
+    lon = rng.uniform(-67.3, -65.2, points)
+
+    print(f"{points} points, {os.cpu_count()} CPUs, chunks of {CHUNK_SIZE}")
+    print(f"{'conversion':<32} | {'workers':>7} | {'time (ms)':>10} | {'M points/s':>9} | {'speedup':>7}")
+
+    loop_points = min(points, LOOP_POINTS)
+    pairs = list(zip(lat[:loop_points].tolist(), lon[:loop_points].tolist()))
+    report(f"Location.from_gps loop ({loop_points})", 1,
+           seconds(lambda: [Location.from_gps(la, lo).easting for la, lo in pairs]), loop_points)
+
+    expected = LocationArray.from_gps(lat, lon)
+    report("LocationArray.from_gps", 1, seconds(lambda: expected.easting), points)
+
+    worker_counts = sorted({1, *(2 ** i for i in range(max_workers.bit_length())), max_workers})
+    for processes in (False, True):
+        name = "bulk_from_gps, " + ("processes" if processes else "threads")
+        single = None
+        for workers in worker_counts:
+            result = []
+            elapsed = seconds(lambda: result.append(bulk_from_gps(lat, lon, workers=workers, chunk_size=CHUNK_SIZE,
+                                                                  processes=processes)))
+            single = single or elapsed
+            report(name, workers, elapsed, points, f"{single / elapsed:.2f}x")
+            assert np.array_equal(result[0].easting, expected.easting)
+            assert np.array_equal(result[0].zone_letter, expected.zone_letter)
@@ -0,0 +1,44 @@
+"""
+Repeated-waypoint workload with the conversion cache on and off.
+
+Every "frame" rebuilds a fixed course of waypoints from GPS, rotates offsets about each of them
+and reads the results back as GPS, the way a mission planner re-plans on every perception update.
+
+Run from the repository root with: python -m benchmarks.bench_conversion_cache
+"""
+import timeit
+
+from uprm_gps_utils import Location, disable_conversion_cache, enable_conversion_cache
+
+
+COURSE = [(18.211042912960064 + i * 1e-4, -67.14093251407316 + (i % 4) * 1e-4) for i in range(20)]
+OFFSETS = [(0, 5), (5, 0), (0, -5), (-5, 0)]
+FRAMES = 50
+
+
+def plan_course():
+    for _ in range(FRAMES):
+        for lat, lon in COURSE:
+            waypoint = Location.from_gps(lat, lon)
+            for dx, dy in OFFSETS:
+                target = waypoint.translate(dx, dy).rotate(pivot=waypoint, angle_cw_deg=90)
+                target.lat, target.lon
+
+
+def best_time() -> float:
+    return min(timeit.repeat(plan_course, number=1, repeat=5))
+
+
+if __name__ == "__main__":
+    disable_conversion_cache()
+    uncached = best_time()
+
+    cache = enable_conversion_cache(maxsize=1024)
+    cached = best_time()
+    stats = cache.stats()
+    disable_conversion_cache()
+
+    print(f"{'cache':<8} | {'time (ms)':>9}")
+    print(f"{'off':<8} | {uncached * 1e3:>9.1f}")
+    print(f"{'on':<8} | {cached * 1e3:>9.1f}")
+    print(f"\nspeedup: {uncached / cached:.1f}x, hit rate: {stats['hit_rate']:.1%}, entries: {stats['size']}")
@@ -0,0 +1,56 @@
+"""
+Projection of a frame of detections to world coordinates, per detection versus batched.
+
+The per-detection path is what a perception node used to do: `relative_angle_to_cardinal_angle` and then
+`relative_radial_to_global_coordinates` for each detection, reading every result back as GPS.
+The batched path is `detections_to_global_coordinates`, with and without reusable output buffers.
+
+Run from the repository root with: python -m benchmarks.bench_detections
+"""
+import timeit
+
+import numpy as np
+
+from uprm_gps_utils import (Attitude, Location, detections_to_global_coordinates, relative_angle_to_cardinal_angle,
+                            relative_radial_to_global_coordinates)
+
+
+VEHICLE = Location.from_gps(lat=18.211042912960064, lon=-67.14093251407316)
+ATTITUDE = Attitude.from_deg(yaw=75)
+DETECTIONS = 10000
+TARGET_HZ = 30
+
+_rng = np.random.default_rng(0)
+DISTANCES = _rng.uniform(1, 100, DETECTIONS)
+ANGLES = _rng.uniform(-180, 180, DETECTIONS)
+OUT = np.empty((2, DETECTIONS))
+
+
+def per_detection():
+    for distance, angle in zip(DISTANCES.tolist(), ANGLES.tolist()):
+        cardinal_angle = relative_angle_to_cardinal_angle(angle, ATTITUDE.yaw_deg)
+        location = relative_radial_to_global_coordinates(VEHICLE, distance, cardinal_angle)
+        location.lat, location.lon
+
+
+def batched():
+    locations = detections_to_global_coordinates(VEHICLE, ATTITUDE, DISTANCES, ANGLES)
+    locations.lat, locations.lon
+
+
+def batched_utm_only():
+    detections_to_global_coordinates(VEHICLE, ATTITUDE, DISTANCES, ANGLES, out=OUT)
+
+
+def best_time(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+if __name__ == "__main__":
+    print(f"{DETECTIONS} detections per frame, target {TARGET_HZ} Hz\n")
+    print(f"{'method':<30} | {'frame (ms)':>10} | {'frames/s':>9}")
+    for name, func, number in (("per detection, with GPS", per_detection, 1),
+                               ("batched, with GPS", batched, 20),
+                               ("batched, UTM into out buffers", batched_utm_only, 200)):
+        seconds = best_time(func, number)
+        print(f"{name:<30} | {seconds * 1e3:>10.2f} | {1 / seconds:>9.0f}")
@@ -0,0 +1,81 @@
+"""
+Throughput and accuracy of the distance methods in `uprm_gps_utils.distance`.
+
+Throughput is measured for one-to-many and many-to-many (distance matrix) queries.
+Accuracy is measured against Vincenty's formula on the WGS84 ellipsoid.
+
+Run from the repository root with: python -m benchmarks.bench_distance
+"""
+import timeit
+
+import numpy as np
+
+from uprm_gps_utils import Location, LocationArray, distance_between_locations, distance_matrix, distances_between_locations
+from uprm_gps_utils.distance import METHODS
+
+
+ORIGIN = Location.from_gps(lat=18.211042912960064, lon=-67.14093251407316)
+POINTS = 100000
+MATRIX_SIZE = (300, 1000)
+RANGES_METERS = [10, 100, 1000, 10000, 100000, 1000000]
+
+_rng = np.random.default_rng(0)
+
+
+def random_locations(count: int, radius_meters: float=2000) -> LocationArray:
+    """
+    Random points around `ORIGIN`, with both representations already computed so that
+    every method is timed on the math alone.
+    """
+    locations = LocationArray.from_utm(ORIGIN.easting + _rng.uniform(-radius_meters, radius_meters, count),
+                                       ORIGIN.northing + _rng.uniform(-radius_meters, radius_meters, count),
+                                       ORIGIN.zone_number, ORIGIN.zone_letter)
+    locations.lat
+    return locations
+
+
+def throughput():
+    locations = random_locations(POINTS)
+    rows, columns = random_locations(MATRIX_SIZE[0]), random_locations(MATRIX_SIZE[1])
+    pairs = MATRIX_SIZE[0] * MATRIX_SIZE[1]
+
+    print(f"{'method':<16} | {'one-to-many (pairs/s)':>22} | {'matrix (pairs/s)':>17}")
+    for method in METHODS:
+        one_to_many = min(timeit.repeat(lambda: distances_between_locations(ORIGIN, locations, method=method), number=1, repeat=5))
+        matrix = min(timeit.repeat(lambda: distance_matrix(rows, columns, method=method), number=1, repeat=5))
+        print(f"{method:<16} | {POINTS / one_to_many:>22,.0f} | {pairs / matrix:>17,.0f}")
+
+    scalar_pairs = 10000
+    scalar_locations = list(locations[:scalar_pairs])
+    scalar = min(timeit.repeat(lambda: [distance_between_locations(ORIGIN, location) for location in scalar_locations],
+                               number=1, repeat=5))
+    print(f"{'scalar loop':<16} | {scalar_pairs / scalar:>22,.0f} |")
+
+
+def accuracy():
+    """
+    Worst relative error of every method against Vincenty, over every bearing, at several ranges.
+    Targets are placed with the spherical destination formula; the longest ranges leave the origin's UTM zone.
+    """
+    bearings = np.radians(np.arange(0, 360, 5))
+    lat0, lon0 = np.radians(ORIGIN.lat), np.radians(ORIGIN.lon)
+    print(f"{'range (m)':>10} | " + " | ".join(f"{method:>15}" for method in METHODS if method != "vincenty"))
+    for range_meters in RANGES_METERS:
+        angular_distance = range_meters / 6371000
+        lat = np.arcsin(np.sin(lat0) * np.cos(angular_distance) + np.cos(lat0) * np.sin(angular_distance) * np.cos(bearings))
+        lon = lon0 + np.arctan2(np.sin(bearings) * np.sin(angular_distance) * np.cos(lat0),
+                                np.cos(angular_distance) - np.sin(lat0) * np.sin(lat))
+        targets = LocationArray.from_gps(np.degrees(lat), np.degrees(lon))
+        reference = distances_between_locations(ORIGIN, targets, method="vincenty")
+        errors = []
+        for method in METHODS:
+            if method != "vincenty":
+                relative_error = np.abs(distances_between_locations(ORIGIN, targets, method=method) - reference) / reference
+                errors.append(f"{relative_error.max():>15.1e}")
+        print(f"{range_meters:>10} | " + " | ".join(errors))
+
+
+if __name__ == "__main__":
+    throughput()
+    print()
+    accuracy()
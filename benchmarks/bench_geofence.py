@@ -0,0 +1,72 @@
+"""
+Point-in-polygon and distance-to-boundary throughput of `Polygon` and `Geofence`.
+
+Polygons are irregular course boundaries with thousands of vertices, queried with batches of up to
+millions of points around them, and per point with single `Location`s for comparison. A `Geofence`
+of many small no-go zones shows the effect of the bounding box index and of splitting batches into tiles.
+
+Run from the repository root with: python -m benchmarks.bench_geofence
+"""
+import time
+
+import numpy as np
+
+from uprm_gps_utils import Geofence, Location, LocationArray, Polygon
+
+
+ORIGIN = Location.from_gps(lat=18.211042912960064, lon=-67.14093251407316)
+VERTICES = [1000, 5000]
+POINTS = [10000, 1000000]
+SINGLE_POINTS = 1000
+NO_GO_ZONES = 500
+
+_rng = np.random.default_rng(0)
+
+
+def boundary(vertices: int) -> Polygon:
+    angles = np.linspace(0, 2 * np.pi, vertices, endpoint=False)
+    radii = 1000 + 150 * np.sin(7 * angles) + _rng.uniform(-20, 20, vertices)
+    return Polygon(LocationArray.from_utm(ORIGIN.easting + radii * np.sin(angles), ORIGIN.northing + radii * np.cos(angles),
+                                          ORIGIN.zone_number, ORIGIN.zone_letter))
+
+
+def random_locations(count: int, radius_meters: float=1500) -> LocationArray:
+    return LocationArray.from_utm(ORIGIN.easting + _rng.uniform(-radius_meters, radius_meters, count),
+                                  ORIGIN.northing + _rng.uniform(-radius_meters, radius_meters, count),
+                                  ORIGIN.zone_number, ORIGIN.zone_letter)
+
+
+def seconds(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def report(name: str, count: int, elapsed: float):
+    print(f"{name:<40} | {count:>9} | {elapsed * 1e3:>10.1f} | {elapsed / count * 1e9:>12.0f}")
+
+
+if __name__ == "__main__":
+    print(f"{'query':<40} | {'points':>9} | {'time (ms)':>10} | {'per point (ns)':>12}")
+    for vertices in VERTICES:
+        polygon = boundary(vertices)
+        report(f"{vertices} vertices: build", 1, seconds(lambda: boundary(vertices)))
+        report(f"{vertices} vertices: distance grid", 1, seconds(polygon._build_grid))
+
+        singles = list(random_locations(SINGLE_POINTS))
+        report(f"{vertices} vertices: contains, per Location", SINGLE_POINTS,
+               seconds(lambda: [polygon.contains(location) for location in singles]))
+        report(f"{vertices} vertices: distance, per Location", SINGLE_POINTS,
+               seconds(lambda: [polygon.distance_to_boundary(location) for location in singles]))
+        for count in POINTS:
+            locations = random_locations(count)
+            report(f"{vertices} vertices: contains", count, seconds(lambda: polygon.contains(locations)))
+            report(f"{vertices} vertices: distance", count, seconds(lambda: polygon.distance_to_boundary(locations)))
+
+    centers = random_locations(NO_GO_ZONES, radius_meters=5000)
+    geofence = Geofence(Polygon([center.translate(x, y) for x, y in [(0, 0), (30, 0), (30, 30), (0, 30)]])
+                        for center in centers)
+    for count in POINTS:
+        locations = random_locations(count, radius_meters=5000)
+        report(f"{NO_GO_ZONES} no-go zones: contains", count, seconds(lambda: geofence.contains(locations)))
+        report(f"{NO_GO_ZONES} no-go zones: distance", count, seconds(lambda: geofence.distance_to_boundary(locations)))
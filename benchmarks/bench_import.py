@@ -0,0 +1,85 @@
+"""
+Cold-start cost of importing `uprm_gps_utils`, plainly and with `from uprm_gps_utils import *`, and of the
+first use of each of its lazily loaded subsystems.
+
+Every scenario runs in a fresh interpreter under `python -X importtime`, and only the imports done by the
+scenario itself are counted, not the interpreter's startup. The subsystems are read from the package's lazy
+attributes, so new ones are tracked as they are added. The best of several runs is kept.
+
+Pass `--budget-ms` to fail, with exit status 1, when the bare package import is slower than the budget.
+
+Run from the repository root with: python -m benchmarks.bench_import [--repeat 5] [--budget-ms 50]
+"""
+import argparse
+import re
+import subprocess
+import sys
+
+from uprm_gps_utils import _LAZY_ATTRIBUTES
+
+
+MARKER = "-- scenario --"
+PACKAGE_IMPORT = "import uprm_gps_utils"
+# "import time: self [us] | cumulative | <indentation>name"
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)")
+
+
+def scenarios() -> dict:
+    """
+    Returns (dict): The package import statement of each scenario, and the code run after it.
+    """
+    result = {"import uprm_gps_utils": (PACKAGE_IMPORT, ""),
+              "from uprm_gps_utils import *": ("from uprm_gps_utils import *", ""),
+              "first projection (utm)": (PACKAGE_IMPORT, "uprm_gps_utils.Location.from_gps(18.2, -67.1).easting")}
+    modules = {}
+    for name, module in _LAZY_ATTRIBUTES.items():
+        modules.setdefault(module, name)
+    for module, name in modules.items():
+        result[f"{module} ({name})"] = (PACKAGE_IMPORT, f"uprm_gps_utils.{name}")
+    return result
+
+
+def import_time(statement: str, code: str) -> tuple:
+    """
+    Returns (tuple): The total time in seconds of the imports done by `code` after the package is imported
+    with `statement`, or by `statement` itself when `code` is empty, and the heaviest top-level module imported.
+    """
+    script = f"import sys; sys.stderr.write({MARKER!r} + '\\n'); {statement}"
+    if code:
+        script += f"; sys.stderr.write({MARKER!r} + '\\n'); {code}"
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", script],
+                            capture_output=True, text=True, check=True).stderr
+    lines = stderr.split(MARKER + "\n")[-1].splitlines()
+
+    total, heaviest = 0, ("", 0)
+    for match in filter(None, map(LINE.match, lines)):
+        cumulative, depth, module = int(match.group(2)), (len(match.group(3)) - 1) // 2, match.group(4)
+        if depth == 0:
+            total += cumulative
+            if cumulative > heaviest[1]:
+                heaviest = (module, cumulative)
+    return total / 1e6, heaviest[0]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs per scenario (default: 5)")
+    parser.add_argument("--budget-ms", type=float, help="fail when the package import takes longer than this")
+    args = parser.parse_args(argv)
+
+    print(f"{'scenario':<48} | {'time (ms)':>10} | heaviest import")
+    package_seconds = None
+    for name, (statement, code) in scenarios().items():
+        runs = [import_time(statement, code) for _ in range(args.repeat)]
+        seconds, heaviest = min(runs)
+        package_seconds = package_seconds if package_seconds is not None else seconds
+        print(f"{name:<48} | {seconds * 1e3:>10.1f} | {heaviest}")
+
+    if args.budget_ms is not None and package_seconds * 1e3 > args.budget_ms:
+        print(f"\nimport uprm_gps_utils took {package_seconds * 1e3:.1f} ms, over the {args.budget_ms:g} ms budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Overhead of `enable_instrumentation` on the most frequent single-point operations: per call, before
+instrumentation is ever enabled, while it is enabled and after it is disabled again. Before and after,
+each instrumented call only pays for the check of whether instrumentation is enabled.
+
+Run from the repository root with: python -m benchmarks.bench_instrumentation
+"""
+import timeit
+
+from uprm_gps_utils import (Location, disable_instrumentation, distance_between_locations, enable_instrumentation,
+                            relative_angle_to_cardinal_angle)
+
+
+CALLS = 100000
+ORIGIN = Location.from_gps(lat=18.211042912960064, lon=-67.14093251407316)
+OTHER = ORIGIN.translate(30, 40)
+ORIGIN.lat, OTHER.lat
+
+WORKLOADS = {
+    "Location.translate": lambda: ORIGIN.translate(1, 2),
+    "Location.rotate": lambda: OTHER.rotate(ORIGIN, 30),
+    "distance_between_locations": lambda: distance_between_locations(ORIGIN, OTHER),
+    "relative_angle_to_cardinal_angle": lambda: relative_angle_to_cardinal_angle(25, 75),
+    "Location.from_gps(...).easting": lambda: Location.from_gps(18.2, -67.1).easting,
+}
+
+
+def per_call(workload) -> float:
+    return min(timeit.repeat(workload, number=CALLS, repeat=5)) / CALLS
+
+
+if __name__ == "__main__":
+    results = {name: [per_call(workload)] for name, workload in WORKLOADS.items()}
+    instrumentation = enable_instrumentation()
+    for name, workload in WORKLOADS.items():
+        results[name].append(per_call(workload))
+    disable_instrumentation()
+    for name, workload in WORKLOADS.items():
+        results[name].append(per_call(workload))
+
+    print(f"{'operation':<34} | {'never enabled (ns)':>18} | {'enabled (ns)':>12} | {'disabled (ns)':>13}")
+    for name, (pristine, enabled, disabled) in results.items():
+        print(f"{name:<34} | {pristine * 1e9:>18.0f} | {enabled * 1e9:>12.0f} | {disabled * 1e9:>13.0f}")
+
+    print("\nrecorded while enabled:")
+    for name, stats in instrumentation.stats()["operations"].items():
+        if stats["count"]:
+            print(f"  {name:<44} {stats['count']:>9} calls, p50 {stats['p50_seconds'] * 1e9:>7.0f} ns, "
+                  f"p99 {stats['p99_seconds'] * 1e9:>7.0f} ns")
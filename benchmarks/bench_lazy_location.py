@@ -0,0 +1,46 @@
+"""
+Micro-benchmark for long `translate`/`rotate` chains.
+
+Compares the lazy `Location` (only the last point of the chain is converted back to GPS)
+against forcing a GPS conversion after every step, which is what the library used to do.
+
+Run from the repository root with: python -m benchmarks.bench_lazy_location
+"""
+import timeit
+
+from uprm_gps_utils import Location
+
+
+START = Location.from_gps(lat=18.211042912960064, lon=-67.14093251407316)
+CHAIN_LENGTHS = [1, 10, 100, 1000]
+REPEAT = 5
+
+
+def lazy_chain(length: int) -> float:
+    location = START
+    for _ in range(length):
+        location = location.translate(1, 1).rotate(pivot=START, angle_cw_deg=1)
+    return location.lat
+
+
+def eager_chain(length: int) -> float:
+    location = START
+    for _ in range(length):
+        location = location.translate(1, 1)
+        location.lat  # force the conversion, like the eager implementation did
+        location = location.rotate(pivot=START, angle_cw_deg=1)
+        location.lat
+    return location.lat
+
+
+def best_time(func, length: int) -> float:
+    number = max(1, 1000 // length)
+    return min(timeit.repeat(lambda: func(length), number=number, repeat=REPEAT)) / number
+
+
+if __name__ == "__main__":
+    print(f"{'chain length':>12} | {'eager (ms)':>10} | {'lazy (ms)':>10} | {'speedup':>7}")
+    for length in CHAIN_LENGTHS:
+        eager = best_time(eager_chain, length)
+        lazy = best_time(lazy_chain, length)
+        print(f"{length:>12} | {eager * 1e3:>10.3f} | {lazy * 1e3:>10.3f} | {eager / lazy:>6.1f}x")
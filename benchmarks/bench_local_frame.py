@@ -0,0 +1,68 @@
+"""
+Throughput of GPS <-> UTM conversions through a `LocalFrame` versus the exact UTM path.
+
+Run from the repository root with: python -m benchmarks.bench_local_frame
+"""
+import timeit
+
+import numpy as np
+
+from uprm_gps_utils import LocalFrame, Location, LocationArray
+
+
+ORIGIN = Location.from_gps(lat=18.211042912960064, lon=-67.14093251407316)
+POINTS = 10000
+RADIUS_METERS = 3000
+
+FRAME = LocalFrame(ORIGIN)
+EXACT_FRAME = LocalFrame(ORIGIN, exact=True)
+
+_rng = np.random.default_rng(0)
+X = _rng.uniform(-RADIUS_METERS, RADIUS_METERS, POINTS)
+Y = _rng.uniform(-RADIUS_METERS, RADIUS_METERS, POINTS)
+LAT, LON = EXACT_FRAME.local_to_gps(X, Y)
+LAT_LIST, LON_LIST, X_LIST, Y_LIST = LAT.tolist(), LON.tolist(), X.tolist(), Y.tolist()
+
+
+def scalar_utm_gps_to_local():
+    for lat, lon in zip(LAT_LIST, LON_LIST):
+        Location.from_gps(lat, lon).easting
+
+
+def scalar_frame_gps_to_local():
+    for lat, lon in zip(LAT_LIST, LON_LIST):
+        FRAME.gps_to_local(lat, lon)
+
+
+def scalar_utm_local_to_gps():
+    for x, y in zip(X_LIST, Y_LIST):
+        ORIGIN.translate(x, y).lat
+
+
+def scalar_frame_local_to_gps():
+    for x, y in zip(X_LIST, Y_LIST):
+        FRAME.local_to_gps(x, y)
+
+
+CASES = {
+    "gps -> local, scalar, UTM": scalar_utm_gps_to_local,
+    "gps -> local, scalar, LocalFrame": scalar_frame_gps_to_local,
+    "gps -> local, array, UTM": lambda: LocationArray.from_gps(LAT, LON).easting,
+    "gps -> local, array, LocalFrame": lambda: FRAME.gps_to_local(LAT, LON),
+    "local -> gps, scalar, UTM": scalar_utm_local_to_gps,
+    "local -> gps, scalar, LocalFrame": scalar_frame_local_to_gps,
+    "local -> gps, array, UTM": lambda: EXACT_FRAME.local_to_gps(X, Y),
+    "local -> gps, array, LocalFrame": lambda: FRAME.local_to_gps(X, Y),
+}
+
+
+if __name__ == "__main__":
+    print(f"{POINTS} points within {RADIUS_METERS} m of the origin\n")
+    print(f"{'case':<34} | {'points/s':>12}")
+    for name, func in CASES.items():
+        seconds = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:<34} | {POINTS / seconds:>12,.0f}")
+
+    print(f"\n{'radius (m)':>10} | {'error bound (m)':>15}")
+    for radius in [100, 1000, 2000, 5000, 10000, 20000]:
+        print(f"{radius:>10} | {FRAME.error_bound(radius):>15.2e}")
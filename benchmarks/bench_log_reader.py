@@ -0,0 +1,63 @@
+"""
+Throughput, in fixes per second, of `read_nmea` and `read_csv` on synthetic multi-million-line logs.
+
+Run from the repository root with: python -m benchmarks.bench_log_reader [lines]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from uprm_gps_utils import read_csv, read_nmea
+
+
+LINES = 2000000
+BATCH_SIZE = 65536
+
+
+def nmea_sentence(i: int) -> bytes:
+    minutes = 12.6626 + (i % 10000) * 1e-4
+    body = f"GPGGA,{i % 240000:06d},18{minutes:07.4f},N,06708.4560,W,1,08,0.9,10.0,M,-40.0,M,,"
+    checksum = 0
+    for char in body:
+        checksum ^= ord(char)
+    return f"${body}*{checksum:02X}\r\n".encode()
+
+
+def write_logs(directory: str, lines: int):
+    nmea_path = os.path.join(directory, "log.nmea")
+    csv_path = os.path.join(directory, "log.csv")
+    with open(nmea_path, "wb") as nmea, open(csv_path, "wb") as csv:
+        csv.write(b"time,lat,lon\n")
+        for i in range(lines):
+            nmea.write(nmea_sentence(i))
+            csv.write(f"{i},{18.211 + (i % 10000) * 1e-7:.7f},{-67.1409 - (i % 7000) * 1e-7:.7f}\n".encode())
+    return nmea_path, csv_path
+
+
+def count_fixes(reader, batched: bool) -> int:
+    if batched:
+        return sum(len(batch) for batch in reader)
+    return sum(1 for _ in reader)
+
+
+if __name__ == "__main__":
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else LINES
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"writing {lines:,} line logs...")
+        nmea_path, csv_path = write_logs(directory, lines)
+
+        cases = {
+            "NMEA -> Location": (lambda: read_nmea(nmea_path), False),
+            f"NMEA -> LocationArray({BATCH_SIZE})": (lambda: read_nmea(nmea_path, batch_size=BATCH_SIZE), True),
+            "NMEA, no checksum -> LocationArray": (lambda: read_nmea(nmea_path, batch_size=BATCH_SIZE, validate_checksum=False), True),
+            "CSV -> Location": (lambda: read_csv(csv_path), False),
+            f"CSV -> LocationArray({BATCH_SIZE})": (lambda: read_csv(csv_path, batch_size=BATCH_SIZE), True),
+        }
+        print(f"{'case':<36} | {'fixes/s':>12}")
+        for name, (make_reader, batched) in cases.items():
+            start = time.perf_counter()
+            fixes = count_fixes(make_reader(), batched)
+            seconds = time.perf_counter() - start
+            assert fixes == lines
+            print(f"{name:<36} | {fixes / seconds:>12,.0f}")
@@ -0,0 +1,78 @@
+"""
+Memory benchmark for `Location` and `Attitude`.
+
+Compares bytes per instance of the slotted classes against the previous layout,
+which kept every attribute in a per-instance `__dict__`.
+
+Run from the repository root with: python -m benchmarks.bench_memory
+"""
+import tracemalloc
+
+from uprm_gps_utils import Attitude, Location
+
+
+INSTANCES = 100000
+FLOATS = [18.0 + i * 1e-6 for i in range(1000)]
+
+
+class DictLocation:
+    """
+    The `Location` layout before `__slots__`.
+    """
+    def __init__(self, lat, lon, easting, northing, zone_number, zone_letter):
+        self.lat = lat
+        self.lon = lon
+        self.easting = easting
+        self.northing = northing
+        self.zone_number = zone_number
+        self.zone_letter = zone_letter
+
+
+class DictAttitude:
+    """
+    The `Attitude` layout before `__slots__`.
+    """
+    def __init__(self, yaw_deg, roll_deg, pitch_deg, yaw_rad, roll_rad, pitch_rad):
+        self.yaw_deg = yaw_deg
+        self.roll_deg = roll_deg
+        self.pitch_deg = pitch_deg
+        self.yaw_rad = yaw_rad
+        self.roll_rad = roll_rad
+        self.pitch_rad = pitch_rad
+
+
+def bytes_per_instance(factory) -> float:
+    """
+    Average number of bytes allocated by `factory(i)`, excluding the list that holds the instances.
+    """
+    tracemalloc.start()
+    instances = [None] * INSTANCES
+    baseline, _ = tracemalloc.get_traced_memory()
+    for i in range(INSTANCES):
+        instances[i] = factory(i)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (current - baseline) / INSTANCES
+
+
+def shared_float(i: int) -> float:
+    """
+    Floats are allocated by both layouts alike, so the benchmark reuses a small pool of them
+    to measure only the per-object overhead.
+    """
+    return FLOATS[i % len(FLOATS)]
+
+
+CASES = {
+    "Location (dict, both representations)": lambda i: DictLocation(shared_float(i), -66.0, 800000.0, 2000000.0, 19, "Q"),
+    "Location (slots, both representations)": lambda i: Location(shared_float(i), -66.0, 800000.0, 2000000.0, 19, "Q"),
+    "Location (slots, from_gps only)": lambda i: Location.from_gps(shared_float(i), -66.0),
+    "Attitude (dict)": lambda i: DictAttitude(shared_float(i), 0.0, 0.0, 0.3, 0.0, 0.0),
+    "Attitude (slots)": lambda i: Attitude(shared_float(i), 0.0, 0.0, 0.3, 0.0, 0.0),
+}
+
+
+if __name__ == "__main__":
+    print(f"{'layout':<40} | {'bytes/instance':>14}")
+    for name, factory in CASES.items():
+        print(f"{name:<40} | {bytes_per_instance(factory):>14.1f}")
@@ -0,0 +1,67 @@
+"""
+Query latency of `SpatialIndex` versus a linear scan with `distance_between_locations`.
+
+Points are spread at a constant density (one per 100 m²), so the area grows with the index.
+The brute force scan is only timed up to `BRUTE_FORCE_LIMIT` points, beyond that it takes seconds per query.
+
+Run from the repository root with: python -m benchmarks.bench_spatial_index [sizes...]
+"""
+import sys
+import time
+
+import numpy as np
+
+from uprm_gps_utils import Location, LocationArray, SpatialIndex, distance_between_locations
+
+
+ORIGIN = Location.from_gps(lat=18.211042912960064, lon=-67.14093251407316)
+SIZES = [100, 1000, 10000, 100000, 1000000]
+QUERIES = 200
+BRUTE_FORCE_LIMIT = 100000
+METERS_SQUARED_PER_POINT = 100
+
+_rng = np.random.default_rng(0)
+
+
+def random_locations(count: int, half_side_meters: float) -> list:
+    locations = LocationArray.from_utm(ORIGIN.easting + _rng.uniform(-half_side_meters, half_side_meters, count),
+                                       ORIGIN.northing + _rng.uniform(-half_side_meters, half_side_meters, count),
+                                       ORIGIN.zone_number, ORIGIN.zone_letter)
+    return list(locations)
+
+
+def mean_latency(func, queries) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        func(query)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def brute_force_nearest(locations, query):
+    return min(locations, key=lambda location: distance_between_locations(location, query))
+
+
+if __name__ == "__main__":
+    sizes = [int(size) for size in sys.argv[1:]] or SIZES
+    print(f"{'points':>8} | {'build (s)':>9} | {'nearest (µs)':>12} | {'k=10 (µs)':>10} | {'within 20 m (µs)':>16} | {'brute force (µs)':>16}")
+    for size in sizes:
+        half_side = (size * METERS_SQUARED_PER_POINT)**0.5 / 2
+        locations = random_locations(size, half_side)
+        queries = random_locations(QUERIES, half_side)
+        for query in queries:
+            query.lat  # keep the inverse projection out of the timings
+
+        start = time.perf_counter()
+        index = SpatialIndex(locations, cell_size_meters=10)
+        build = time.perf_counter() - start
+
+        nearest = mean_latency(lambda query: index.nearest(query), queries)
+        nearest_10 = mean_latency(lambda query: index.nearest(query, k=10), queries)
+        within = mean_latency(lambda query: index.within(query, 20), queries)
+        if size <= BRUTE_FORCE_LIMIT:
+            for location in locations:
+                location.lat
+            brute_force = f"{mean_latency(lambda query: brute_force_nearest(locations, query), queries[:10]) * 1e6:>16,.0f}"
+        else:
+            brute_force = f"{'skipped':>16}"
+        print(f"{size:>8} | {build:>9.2f} | {nearest * 1e6:>12.1f} | {nearest_10 * 1e6:>10.1f} | {within * 1e6:>16.1f} | {brute_force}")
@@ -0,0 +1,62 @@
+"""
+Odometry over a stream of GPS fixes: the previous `Location` plus `distance_between_locations`
+on every fix, versus `Track.add` and `Track.add_many`. The baseline only computes the distance and
+speed, while `Track` also keeps the heading, bounding box and a history of recent fixes.
+
+Run from the repository root with: python -m benchmarks.bench_track
+"""
+import timeit
+
+import numpy as np
+
+from uprm_gps_utils import Location, LocationArray, Track, distance_between_locations
+
+
+START = Location.from_gps(lat=18.211042912960064, lon=-67.14093251407316)
+FIXES = 100000
+BATCH_SIZE = 1000
+
+_rng = np.random.default_rng(0)
+LATS = START.lat + np.cumsum(_rng.normal(0, 1e-5, FIXES))
+LONS = START.lon + np.cumsum(_rng.normal(0, 1e-5, FIXES))
+TIMESTAMPS = np.arange(FIXES) * 0.1
+LOCATIONS = [Location.from_gps(lat, lon) for lat, lon in zip(LATS.tolist(), LONS.tolist())]
+BATCHES = [(LocationArray.from_gps(LATS[i:i + BATCH_SIZE], LONS[i:i + BATCH_SIZE]), TIMESTAMPS[i:i + BATCH_SIZE])
+           for i in range(0, FIXES, BATCH_SIZE)]
+
+
+def previous_location():
+    previous, previous_time = None, None
+    distance = 0
+    for location, timestamp in zip(LOCATIONS, TIMESTAMPS.tolist()):
+        if previous is not None:
+            segment = distance_between_locations(previous, location)
+            distance += segment
+            segment / (timestamp - previous_time)
+        previous, previous_time = location, timestamp
+
+
+def track_add():
+    track = Track()
+    for location, timestamp in zip(LOCATIONS, TIMESTAMPS.tolist()):
+        track.add(location, timestamp)
+
+
+def track_add_many():
+    track = Track()
+    for locations, timestamps in BATCHES:
+        track.add_many(locations, timestamps)
+
+
+def best_time(func) -> float:
+    return min(timeit.repeat(func, number=1, repeat=5))
+
+
+if __name__ == "__main__":
+    print(f"{FIXES} fixes\n")
+    print(f"{'method':<36} | {'time (ms)':>9} | {'per fix (ns)':>12}")
+    for name, func in (("previous Location + distance", previous_location),
+                       ("Track.add", track_add),
+                       (f"Track.add_many, batches of {BATCH_SIZE}", track_add_many)):
+        seconds = best_time(func)
+        print(f"{name:<36} | {seconds * 1e3:>9.1f} | {seconds / FIXES * 1e9:>12.0f}")
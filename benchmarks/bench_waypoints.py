@@ -0,0 +1,51 @@
+"""
+Generation time of waypoint patterns with thousands of waypoints, read back as GPS.
+
+The baseline builds each waypoint by hand with `translate(...).rotate(...)`, as in the README;
+the pattern functions compute every waypoint in one vectorized pass.
+
+Run from the repository root with: python -m benchmarks.bench_waypoints
+"""
+import timeit
+
+import numpy as np
+
+from uprm_gps_utils import Location, lawnmower_waypoints, offset_waypoints, orbit_waypoints
+
+
+CENTER = Location.from_gps(lat=18.211042912960064, lon=-67.14093251407316)
+HEADING = 75
+SIZES = [100, 1000, 10000]
+
+
+def chained_orbit(count: int):
+    waypoints = []
+    for i in range(count):
+        waypoint = CENTER.translate(0, 20).rotate(CENTER, i * 360 / count)
+        waypoint.lat, waypoint.lon
+        waypoints.append(waypoint)
+    return waypoints
+
+
+def vectorized(pattern):
+    waypoints = pattern()
+    waypoints.lat, waypoints.lon
+    return waypoints
+
+
+def best_time(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+if __name__ == "__main__":
+    print(f"{'pattern':<24} | {'waypoints':>9} | {'time (ms)':>9}")
+    for size in SIZES:
+        forward, right = np.random.default_rng(size).uniform(-50, 50, (2, size))
+        lanes = size // 10
+        for name, func, number in (
+                ("orbit, chained", lambda: chained_orbit(size), 1),
+                ("orbit", lambda: vectorized(lambda: orbit_waypoints(CENTER, 20, size)), 20),
+                ("offsets", lambda: vectorized(lambda: offset_waypoints(CENTER, HEADING, forward, right)), 20),
+                ("lawnmower", lambda: vectorized(lambda: lawnmower_waypoints(CENTER, HEADING, 200, lanes - 1, 1,
+                                                                             points_per_lane=10)), 20)):
+            print(f"{name:<24} | {size:>9} | {best_time(func, number) * 1e3:>9.2f}")
@@ -0,0 +1,54 @@
+"""
+Cost of the zone check in `Location.translate` and `LocationArray.translate`.
+
+Compares translations that stay inside their zone against the bare `Location.from_utm` they used to be,
+and against translations that cross into the next zone, which need a reprojection.
+
+Run from the repository root with: python -m benchmarks.bench_zones
+"""
+import timeit
+
+import numpy as np
+
+from uprm_gps_utils import Location, LocationArray
+
+
+IN_ZONE = Location.from_gps(18.211042912960064, -67.14093251407316)
+NEAR_BOUNDARY = Location.from_gps(18, -66.0005)
+SIZE = 100000
+
+
+def baseline():
+    Location.from_utm(IN_ZONE.easting + 10, IN_ZONE.northing + 5, IN_ZONE.zone_number, IN_ZONE.zone_letter)
+
+
+def in_zone():
+    IN_ZONE.translate(10, 5)
+
+
+def crossing():
+    NEAR_BOUNDARY.translate(200, 0)
+
+
+def best_time(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+if __name__ == "__main__":
+    print(f"{'Location':<22} | {'time (us)':>9}")
+    for name, func in (("from_utm (baseline)", baseline), ("translate in zone", in_zone),
+                       ("translate crossing", crossing)):
+        print(f"{name:<22} | {best_time(func, 20000) * 1e6:>9.2f}")
+
+    rng = np.random.default_rng(0)
+    in_zone_array = LocationArray.from_gps(np.full(SIZE, IN_ZONE.lat), np.full(SIZE, IN_ZONE.lon))
+    boundary_array = LocationArray.from_gps(np.full(SIZE, NEAR_BOUNDARY.lat), np.full(SIZE, NEAR_BOUNDARY.lon))
+    forced_array = boundary_array.to_zone()
+    dx = rng.uniform(0, 200, SIZE)
+    for array in (in_zone_array, boundary_array, forced_array):
+        array.easting
+
+    print(f"\n{'LocationArray (' + str(SIZE) + ')':<22} | {'time (ms)':>9}")
+    for name, array in (("translate in zone", in_zone_array), ("translate crossing", boundary_array),
+                        ("translate forced zone", forced_array)):
+        print(f"{name:<22} | {best_time(lambda: array.translate(dx, 0), 5) * 1e3:>9.2f}")
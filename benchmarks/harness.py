@@ -0,0 +1,300 @@
+"""
+Benchmark suite and regression harness for the core operations of `uprm_gps_utils`.
+
+Every operation is timed at several scales: single `Location` calls are looped 1 and 1,000 times, and the
+batch equivalents on `LocationArray`s and NumPy arrays run on 1,000 up to 1,000,000 points. The best of
+several repeats is kept, so background load on the machine only makes the numbers noisier, not worse.
+
+Results can be saved as a baseline and later runs compared against it. The comparison fails, with exit
+status 1, when any benchmark is slower than its baseline by more than the threshold. Baselines only mean
+something on the hardware they were recorded on, so record one on the boat's computer and keep it there.
+
+Run from the repository root with:
+    python -m benchmarks.harness --save                   record benchmarks/baseline.json
+    python -m benchmarks.harness --compare                fail on a >25% regression against it
+    python -m benchmarks.harness --compare --threshold 0.1 --filter translate --max-scale 1000
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import sys
+import timeit
+
+import numpy as np
+
+from uprm_gps_utils import (Location, LocationArray, distance_between_locations, distances_between_locations,
+                            normalize_angle, relative_angle_to_cardinal_angle, relative_radial_to_global_coordinates)
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+
+SCALAR_SCALES = (1, 1000)
+BATCH_SCALES = (1000, 100000, 1000000)
+
+ORIGIN = Location.from_gps(lat=18.211042912960064, lon=-67.14093251407316)
+
+# name -> (scales, setup(scale) -> workload)
+BENCHMARKS = {}
+
+
+def benchmark(name: str, scales: tuple):
+    """
+    Registers `setup(scale)`, which prepares the inputs for one scale and returns the workload to time.
+    """
+    def register(setup):
+        BENCHMARKS[name] = (scales, setup)
+        return setup
+    return register
+
+
+def _inputs(count: int) -> dict:
+    """
+    Reproducible points within 1 km of `ORIGIN`, with both representations computed.
+    """
+    rng = np.random.default_rng(count)
+    easting = ORIGIN.easting + rng.uniform(-1000, 1000, count)
+    northing = ORIGIN.northing + rng.uniform(-1000, 1000, count)
+    locations = LocationArray.from_utm(easting, northing, ORIGIN.zone_number, ORIGIN.zone_letter)
+    return {
+        "easting": easting,
+        "northing": northing,
+        "lat": locations.lat,
+        "lon": locations.lon,
+        "locations": locations,
+        "dx": rng.uniform(-50, 50, count),
+        "dy": rng.uniform(-50, 50, count),
+        "angles": rng.uniform(-720, 720, count),
+        "distances": rng.uniform(0, 50, count),
+    }
+
+
+def _points(inputs: dict) -> list:
+    return list(inputs["locations"])
+
+
+@benchmark("Location.from_gps", SCALAR_SCALES)
+def _location_from_gps(scale):
+    inputs = _inputs(scale)
+    coordinates = list(zip(inputs["lat"].tolist(), inputs["lon"].tolist()))
+
+    def run():
+        for lat, lon in coordinates:
+            Location.from_gps(lat, lon).easting
+    return run
+
+
+@benchmark("Location.from_utm", SCALAR_SCALES)
+def _location_from_utm(scale):
+    inputs = _inputs(scale)
+    coordinates = list(zip(inputs["easting"].tolist(), inputs["northing"].tolist()))
+    zone_number, zone_letter = ORIGIN.zone_number, ORIGIN.zone_letter
+
+    def run():
+        for easting, northing in coordinates:
+            Location.from_utm(easting, northing, zone_number, zone_letter).lat
+    return run
+
+
+@benchmark("Location.translate", SCALAR_SCALES)
+def _location_translate(scale):
+    inputs = _inputs(scale)
+    work = list(zip(_points(inputs), inputs["dx"].tolist(), inputs["dy"].tolist()))
+
+    def run():
+        for location, dx, dy in work:
+            location.translate(dx, dy)
+    return run
+
+
+@benchmark("Location.rotate", SCALAR_SCALES)
+def _location_rotate(scale):
+    inputs = _inputs(scale)
+    work = list(zip(_points(inputs), inputs["angles"].tolist()))
+
+    def run():
+        for location, angle in work:
+            location.rotate(ORIGIN, angle)
+    return run
+
+
+@benchmark("relative_radial_to_global_coordinates", SCALAR_SCALES)
+def _relative_radial_to_global_coordinates(scale):
+    inputs = _inputs(scale)
+    work = list(zip(_points(inputs), inputs["distances"].tolist(), inputs["angles"].tolist()))
+
+    def run():
+        for location, distance, angle in work:
+            relative_radial_to_global_coordinates(location, distance, angle)
+    return run
+
+
+@benchmark("distance_between_locations", SCALAR_SCALES)
+def _distance_between_locations(scale):
+    points = _points(_inputs(scale))
+
+    def run():
+        for location in points:
+            distance_between_locations(ORIGIN, location)
+    return run
+
+
+@benchmark("normalize_angle", SCALAR_SCALES)
+def _normalize_angle(scale):
+    angles = _inputs(scale)["angles"].tolist()
+
+    def run():
+        for angle in angles:
+            normalize_angle(angle)
+    return run
+
+
+@benchmark("relative_angle_to_cardinal_angle", SCALAR_SCALES)
+def _relative_angle_to_cardinal_angle(scale):
+    angles = _inputs(scale)["angles"].tolist()
+
+    def run():
+        for angle in angles:
+            relative_angle_to_cardinal_angle(angle, 75, 90)
+    return run
+
+
+@benchmark("LocationArray.from_gps", BATCH_SCALES)
+def _array_from_gps(scale):
+    inputs = _inputs(scale)
+    return lambda: LocationArray.from_gps(inputs["lat"], inputs["lon"]).easting
+
+
+@benchmark("LocationArray.from_utm", BATCH_SCALES)
+def _array_from_utm(scale):
+    inputs = _inputs(scale)
+    return lambda: LocationArray.from_utm(inputs["easting"], inputs["northing"], ORIGIN.zone_number, ORIGIN.zone_letter).lat
+
+
+@benchmark("LocationArray.translate", BATCH_SCALES)
+def _array_translate(scale):
+    inputs = _inputs(scale)
+    return lambda: inputs["locations"].translate(inputs["dx"], inputs["dy"])
+
+
+@benchmark("LocationArray.rotate", BATCH_SCALES)
+def _array_rotate(scale):
+    inputs = _inputs(scale)
+    return lambda: inputs["locations"].rotate(ORIGIN, inputs["angles"])
+
+
+@benchmark("distances_between_locations", BATCH_SCALES)
+def _distances_between_locations(scale):
+    inputs = _inputs(scale)
+    return lambda: distances_between_locations(ORIGIN, inputs["locations"])
+
+
+@benchmark("normalize_angle (array)", BATCH_SCALES)
+def _normalize_angle_array(scale):
+    angles = _inputs(scale)["angles"]
+    return lambda: normalize_angle(angles)
+
+
+@benchmark("relative_angle_to_cardinal_angle (array)", BATCH_SCALES)
+def _relative_angle_to_cardinal_angle_array(scale):
+    angles = _inputs(scale)["angles"]
+    return lambda: relative_angle_to_cardinal_angle(angles, 75, 90)
+
+
+def measure(workload, repeat: int) -> float:
+    """
+    Returns (float): The best time, in seconds, of one call of `workload`.
+    """
+    timer = timeit.Timer(workload)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(pattern: str="", max_scale: int=None, repeat: int=5) -> dict:
+    """
+    Runs every benchmark whose name contains the glob `pattern`, at every scale up to `max_scale`.
+
+    Returns (dict): The best time in seconds of each "name[scale]".
+    """
+    results = {}
+    for name, (scales, setup) in BENCHMARKS.items():
+        if not fnmatch.fnmatch(name, f"*{pattern}*"):
+            continue
+        for scale in scales:
+            if max_scale is not None and scale > max_scale:
+                continue
+            results[f"{name}[{scale}]"] = {"seconds": measure(setup(scale), repeat), "scale": scale}
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Returns (list): The (key, ratio) of every result slower than its baseline by more than `threshold`.
+    Results missing from the baseline are not compared.
+    """
+    regressions = []
+    for key, result in results.items():
+        if key in baseline:
+            ratio = result["seconds"] / baseline[key]["seconds"]
+            if ratio > 1 + threshold:
+                regressions.append((key, ratio))
+    return regressions
+
+
+def machine() -> dict:
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, metavar="PATH",
+                        help=f"save the results as a baseline (default: {DEFAULT_BASELINE})")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, metavar="PATH",
+                        help="compare the results against a baseline and fail on regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"allowed slowdown before failing, as a fraction (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--filter", default="", help="only run the benchmarks whose name contains this glob pattern")
+    parser.add_argument("--max-scale", type=int, help="skip the scales above this one")
+    parser.add_argument("--repeat", type=int, default=5, help="number of repeats per benchmark (default: 5)")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+
+    results = run(args.filter, args.max_scale, args.repeat)
+
+    print(f"{'benchmark':<48} | {'time (ms)':>10} | {'per point (ns)':>14} | {'vs baseline':>11}")
+    for key, result in results.items():
+        vs_baseline = ""
+        if baseline is not None and key in baseline:
+            vs_baseline = f"{result['seconds'] / baseline[key]['seconds']:.2f}x"
+        print(f"{key:<48} | {result['seconds'] * 1e3:>10.3f} | "
+              f"{result['seconds'] / result['scale'] * 1e9:>14.1f} | {vs_baseline:>11}")
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"machine": machine(), "results": results}, file, indent=2)
+        print(f"\nbaseline saved to {args.save}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for key, ratio in regressions:
+                print(f"  {key}: {ratio:.2f}x")
+            return 1
+        print(f"\nno regression over {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
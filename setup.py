@@ -2,7 +2,7 @@ from setuptools import setup, find_packages
 
 PACKAGE_VERSION = "1.1"
 
-MINIMUM_PYTHON_VERSION = 3.6
+MINIMUM_PYTHON_VERSION = 3.7
 
 
 PACKAGES = find_packages()
@@ -0,0 +1,87 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from uprm_gps_utils import *
+from uprm_gps_utils import LocationArray, bulk_from_gps, bulk_from_gps_async, bulk_from_utm, bulk_from_utm_async
+
+
+class TestBulkConversion(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # across zones 19 and 20, and both hemispheres
+        self.lat = rng.uniform(-5, 20, 10000)
+        self.lon = rng.uniform(-70, -62, 10000)
+        self.expected = LocationArray.from_gps(self.lat, self.lon)
+
+    def assert_same_locations(self, locations, expected):
+        np.testing.assert_array_equal(locations.lat, expected.lat)
+        np.testing.assert_array_equal(locations.lon, expected.lon)
+        np.testing.assert_array_equal(locations.easting, expected.easting)
+        np.testing.assert_array_equal(locations.northing, expected.northing)
+        np.testing.assert_array_equal(locations.zone_number, expected.zone_number)
+        np.testing.assert_array_equal(locations.zone_letter, expected.zone_letter)
+
+    def test_from_gps_keeps_order(self):
+        for workers in (1, 4):
+            locations = bulk_from_gps(self.lat, self.lon, workers=workers, chunk_size=999)
+            self.assert_same_locations(locations, self.expected)
+
+    def test_from_gps_with_processes(self):
+        locations = bulk_from_gps(self.lat, self.lon, workers=2, chunk_size=3000, processes=True)
+        self.assert_same_locations(locations, self.expected)
+
+    def test_from_utm(self):
+        expected = LocationArray.from_utm(self.expected.easting, self.expected.northing,
+                                          self.expected.zone_number, self.expected.zone_letter)
+        locations = bulk_from_utm(expected.easting, expected.northing, expected.zone_number, expected.zone_letter,
+                                  workers=3, chunk_size=1234)
+        self.assert_same_locations(locations, expected)
+
+        location = Location.from_gps(18.211042912960064, -67.14093251407316)
+        locations = bulk_from_utm([location.easting] * 3, [location.northing] * 3, location.zone_number,
+                                  location.zone_letter, chunk_size=2)
+        np.testing.assert_allclose(locations.lat, location.lat)
+
+    def test_existing_executor(self):
+        with ThreadPoolExecutor(2) as executor:
+            locations = bulk_from_gps(self.lat, self.lon, chunk_size=1000, executor=executor)
+        self.assert_same_locations(locations, self.expected)
+
+    def test_async(self):
+        async def convert():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            ticker = asyncio.ensure_future(tick())
+            locations = await bulk_from_gps_async(self.lat, self.lon, workers=2, chunk_size=500)
+            back = await bulk_from_utm_async(locations.easting, locations.northing, locations.zone_number,
+                                             locations.zone_letter, workers=2, chunk_size=500)
+            ticker.cancel()
+            return locations, back, ticks
+
+        locations, back, ticks = asyncio.run(convert())
+        self.assert_same_locations(locations, self.expected)
+        np.testing.assert_allclose(back.lat, self.lat)
+        self.assertGreater(ticks, 0)
+
+    def test_empty(self):
+        locations = bulk_from_gps([], [])
+        self.assertEqual(len(locations), 0)
+        self.assertEqual(len(locations.easting), 0)
+        self.assertEqual(len(asyncio.run(bulk_from_gps_async([], [], workers=2))), 0)
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            bulk_from_gps(self.lat, self.lon, chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import threading
+import unittest
+from unittest import mock
+
+import utm
+
+from uprm_gps_utils import *
+
+
+class TestConversionCache(unittest.TestCase):
+    def test_hits_and_misses(self):
+        cache = ConversionCache(maxsize=10)
+        first = cache.from_latlon(18.2, -67.1)
+        self.assertEqual(cache.from_latlon(18.2, -67.1), first)
+        self.assertEqual(first, utm.from_latlon(18.2, -67.1))
+        cache.to_latlon(*first)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (1, 2, 2))
+        self.assertAlmostEqual(stats["hit_rate"], 1 / 3)
+
+    def test_lru_eviction(self):
+        cache = ConversionCache(maxsize=2, eviction="lru")
+        cache.from_latlon(18.0, -67.0)
+        cache.from_latlon(18.1, -67.0)
+        cache.from_latlon(18.0, -67.0)
+        cache.from_latlon(18.2, -67.0)  # evicts 18.1, the least recently used
+        cache.from_latlon(18.0, -67.0)
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_fifo_eviction(self):
+        cache = ConversionCache(maxsize=2, eviction="fifo")
+        cache.from_latlon(18.0, -67.0)
+        cache.from_latlon(18.1, -67.0)
+        cache.from_latlon(18.0, -67.0)
+        cache.from_latlon(18.2, -67.0)  # evicts 18.0, the oldest
+        cache.from_latlon(18.0, -67.0)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_quantization(self):
+        cache = ConversionCache(latlon_quantum=1e-7, utm_quantum=0.01)
+        self.assertEqual(cache.from_latlon(18.20000001, -67.1), cache.from_latlon(18.19999999, -67.1))
+        self.assertEqual(cache.to_latlon(800000.001, 2000000, 19, "Q"), cache.to_latlon(799999.999, 2000000, 19, "Q"))
+        self.assertEqual(cache.stats()["hits"], 2)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ConversionCache(eviction="random")
+        with self.assertRaises(ValueError):
+            ConversionCache(maxsize=0)
+
+    def test_thread_safety(self):
+        cache = ConversionCache(maxsize=50)
+
+        def worker():
+            for i in range(200):
+                cache.from_latlon(18 + (i % 100) * 1e-4, -67.1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = cache.stats()
+        self.assertEqual(stats["hits"] + stats["misses"], 8 * 200)
+        self.assertLessEqual(stats["size"], 50)
+
+
+class TestLocationConversionCache(unittest.TestCase):
+    def tearDown(self):
+        disable_conversion_cache()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(get_conversion_cache())
+
+    def test_factories_use_cache(self):
+        cache = enable_conversion_cache(maxsize=100)
+        self.assertIs(get_conversion_cache(), cache)
+        with mock.patch("utm.from_latlon", wraps=utm.from_latlon) as from_latlon:
+            for _ in range(5):
+                Location.from_gps(18.2, -67.1).easting
+            self.assertEqual(from_latlon.call_count, 1)
+        with mock.patch("utm.to_latlon", wraps=utm.to_latlon) as to_latlon:
+            for _ in range(5):
+                Location.from_utm(800000, 2000000, 19, "Q").lat
+            self.assertEqual(to_latlon.call_count, 1)
+        self.assertEqual(cache.stats()["hits"], 8)
+
+    def test_results_match_uncached(self):
+        expected = Location.from_gps(18.2, -67.1)
+        enable_conversion_cache()
+        for _ in range(2):
+            self.assertEqual(Location.from_gps(18.2, -67.1), expected)
+        disable_conversion_cache()
+        self.assertIsNone(get_conversion_cache())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+import numpy as np
+
+from uprm_gps_utils import *
+from uprm_gps_utils import (body_to_global_coordinates, detections_to_global_coordinates,
+                            detections_to_global_coordinates_3d)
+
+
+class TestDetectionsToGlobalCoordinates(unittest.TestCase):
+    VEHICLE = Location.from_gps(18.211042912960064, -67.14093251407316)
+    ATTITUDE = Attitude.from_deg(yaw=75)
+    DISTANCES = np.array([0, 5, 12.5, 40, 100])
+    ANGLES = np.array([0, 90, 180, 270, -30])
+
+    def test_matches_per_detection_functions(self):
+        objects = detections_to_global_coordinates(self.VEHICLE, self.ATTITUDE, self.DISTANCES, self.ANGLES, rel_north=90)
+        for i, (distance, angle) in enumerate(zip(self.DISTANCES, self.ANGLES)):
+            cardinal_angle = relative_angle_to_cardinal_angle(angle, self.ATTITUDE.yaw_deg, rel_north=90)
+            expected = relative_radial_to_global_coordinates(self.VEHICLE, distance, cardinal_angle)
+            self.assertAlmostEqual(objects.easting[i], expected.easting, places=6)
+            self.assertAlmostEqual(objects.northing[i], expected.northing, places=6)
+            self.assertAlmostEqual(objects.lat[i], expected.lat, places=9)
+            self.assertAlmostEqual(objects.lon[i], expected.lon, places=9)
+
+    def test_writes_into_out_buffers(self):
+        out = np.empty((2, len(self.DISTANCES)))
+        objects = detections_to_global_coordinates(self.VEHICLE, self.ATTITUDE, self.DISTANCES, self.ANGLES, out=out)
+        self.assertTrue(np.shares_memory(objects.easting, out[0]))
+        self.assertTrue(np.shares_memory(objects.northing, out[1]))
+        expected = detections_to_global_coordinates(self.VEHICLE, self.ATTITUDE, self.DISTANCES, self.ANGLES)
+        np.testing.assert_array_equal(out[0], expected.easting)
+        np.testing.assert_array_equal(out[1], expected.northing)
+
+    def test_detections_across_zone_boundary(self):
+        vehicle = Location.from_gps(18, -66.0005)
+        objects = detections_to_global_coordinates(vehicle, Attitude.from_deg(yaw=90), [10, 200], [0, 0])
+        self.assertEqual(list(objects.zone_number), [19, 20])
+        for i, distance in enumerate([10, 200]):
+            expected = relative_radial_to_global_coordinates(vehicle, distance, 90)
+            self.assertAlmostEqual(objects.easting[i], expected.easting, places=5)
+            self.assertAlmostEqual(objects.northing[i], expected.northing, places=5)
+
+    def test_no_detections(self):
+        self.assertEqual(len(detections_to_global_coordinates(self.VEHICLE, self.ATTITUDE, [], [])), 0)
+
+
+class TestDetectionsToGlobalCoordinates3D(unittest.TestCase):
+    VEHICLE = Location.from_gps(18.211042912960064, -67.14093251407316)
+    DISTANCES = np.array([5, 12.5, 40, 100])
+    ANGLES = np.array([0, 90, 225, -30])
+
+    def test_level_vehicle_matches_2d(self):
+        attitude = Attitude.from_deg(yaw=75)
+        flat = detections_to_global_coordinates(self.VEHICLE, attitude, self.DISTANCES, self.ANGLES, rel_north=90)
+        objects = detections_to_global_coordinates_3d(self.VEHICLE, attitude, self.DISTANCES, self.ANGLES, rel_north=90)
+        np.testing.assert_allclose(objects.easting, flat.easting, rtol=0, atol=1e-6)
+        np.testing.assert_allclose(objects.northing, flat.northing, rtol=0, atol=1e-6)
+
+    def test_heeled_vehicle(self):
+        # Heeled 20º to starboard, a buoy on the horizon to starboard appears 20º above the deck plane.
+        attitude = Attitude.from_deg(yaw=0, roll=20)
+        objects = detections_to_global_coordinates_3d(self.VEHICLE, attitude, [50], [90], elevation_angles_degrees=[20])
+        self.assertAlmostEqual(objects.easting[0], self.VEHICLE.easting + 50, places=6)
+        self.assertAlmostEqual(objects.northing[0], self.VEHICLE.northing, places=6)
+
+    def test_body_to_global_coordinates(self):
+        attitude = Attitude.from_deg(yaw=90, pitch=90)
+        out = np.empty((2, 2))
+        objects = body_to_global_coordinates(self.VEHICLE, attitude, [0, 10], [3, 0], [-10, 0], out=out)
+        self.assertTrue(np.shares_memory(objects.easting, out[0]))
+        np.testing.assert_allclose(objects.easting - self.VEHICLE.easting, [-10, 0], atol=1e-9)
+        np.testing.assert_allclose(objects.northing - self.VEHICLE.northing, [-3, 0], atol=1e-9)
+
+    def test_body_to_global_coordinates_with_scratch_buffer(self):
+        attitude = Attitude.from_deg(yaw=30, roll=10, pitch=-5)
+        forward, right, down = np.array([0.0, 10, 4]), np.array([3.0, 0, -2]), np.array([-10.0, 0, 1])
+        expected = body_to_global_coordinates(self.VEHICLE, attitude, forward, right, down)
+        out = np.empty((3, 3))
+        objects = body_to_global_coordinates(self.VEHICLE, attitude, forward, right, down, out=out)
+        self.assertTrue(np.shares_memory(objects.northing, out[1]))
+        np.testing.assert_array_equal(objects.easting, expected.easting)
+        np.testing.assert_array_equal(objects.northing, expected.northing)
+
+
+if __name__ == "__main__":
+    unittest.main()
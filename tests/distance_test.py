@@ -0,0 +1,89 @@
+import unittest
+
+import numpy as np
+
+from uprm_gps_utils import *
+from uprm_gps_utils import LocationArray, distance_matrix, distances_between_locations
+from uprm_gps_utils.distance import METHODS
+
+
+class TestDistances(unittest.TestCase):
+    def test_element_wise_matches_scalar(self):
+        locationsA = LocationArray.from_gps([0, 24.27609, -79.09289], [0, 54.98268, 12.121234])
+        locationsB = LocationArray.from_gps([1, 78.20945, 83.293834], [0, 63.23442, -61.273658])
+        distances = distances_between_locations(locationsA, locationsB)
+        for i in range(3):
+            self.assertAlmostEqual(distances[i], distance_between_locations(locationsA[i], locationsB[i]), places=5)
+
+    def test_one_to_many(self):
+        locations = LocationArray.from_gps([1, 0, -1], [0, 1, 0])
+        np.testing.assert_allclose(distances_between_locations(Location.from_gps(0, 0), locations), 111195, atol=1)
+
+    def test_matrix(self):
+        locationsA = LocationArray.from_gps([0, 2], [0, 2])
+        locationsB = LocationArray.from_gps([1, 2.00001, 0], [0, 2, 0])
+        matrix = distance_matrix(locationsA, locationsB)
+        self.assertEqual(matrix.shape, (2, 3))
+        for i in range(2):
+            for j in range(3):
+                self.assertAlmostEqual(matrix[i, j], distance_between_locations(locationsA[i], locationsB[j]), places=5)
+
+    def test_matrix_with_single_location(self):
+        location = Location.from_gps(0, 0)
+        locations = LocationArray.from_gps([1, 0, -1], [0, 1, 0])
+        for method in METHODS:
+            row = distance_matrix(location, locations, method=method)
+            self.assertEqual(row.shape, (1, 3))
+            np.testing.assert_allclose(row[0], distances_between_locations(location, locations, method=method))
+            self.assertEqual(distance_matrix(locations, location, method=method).shape, (3, 1))
+
+
+class TestDistanceMethods(unittest.TestCase):
+    ORIGIN = Location.from_gps(18.211042912960064, -67.14093251407316)
+
+    def test_vincenty_reference(self):
+        # Flinders Peak to Buninyong, from Vincenty's original paper
+        flinders_peak = Location.from_gps(-37.95103341666667, 144.42486788888889)
+        buninyong = Location.from_gps(-37.65282113888889, 143.92649552777778)
+        self.assertAlmostEqual(float(distances_between_locations(flinders_peak, buninyong, method="vincenty")), 54972.271, places=3)
+
+    def test_methods_agree_at_short_range(self):
+        bearings = np.arange(0, 360, 15)
+        for range_meters in [10, 100, 1000]:
+            targets = LocationArray.from_utm(self.ORIGIN.easting + range_meters * np.sin(np.radians(bearings)),
+                                             self.ORIGIN.northing + range_meters * np.cos(np.radians(bearings)),
+                                             self.ORIGIN.zone_number, self.ORIGIN.zone_letter)
+            reference = distances_between_locations(self.ORIGIN, targets, method="vincenty")
+            for method in ["utm", "equirectangular"]:
+                np.testing.assert_allclose(distances_between_locations(self.ORIGIN, targets, method=method), reference,
+                                           rtol=1e-5, atol=1e-3)
+            np.testing.assert_allclose(distances_between_locations(self.ORIGIN, targets, method="haversine"), reference,
+                                       rtol=5e-3)
+
+    def test_matrix_matches_element_wise(self):
+        locationsA = LocationArray.from_gps([18.21, 18.22, 18.0], [-67.14, -67.13, -66.0])
+        locationsB = LocationArray.from_gps([18.2, 18.25], [-67.1, -67.2])
+        for method in METHODS:
+            matrix = distance_matrix(locationsA, locationsB, method=method)
+            self.assertEqual(matrix.shape, (3, 2))
+            for i in range(3):
+                np.testing.assert_allclose(matrix[i], distances_between_locations(locationsA[i], locationsB, method=method))
+
+    def test_utm_across_zones_falls_back(self):
+        west = Location.from_gps(18.2, -66.001)
+        east = Location.from_gps(18.2, -65.999)
+        self.assertNotEqual(west.zone_number, east.zone_number)
+        expected = distances_between_locations(west, east, method="vincenty")
+        self.assertAlmostEqual(float(distances_between_locations(west, east, method="utm")), float(expected), places=2)
+
+    def test_vincenty_antipodal_falls_back(self):
+        distance = distances_between_locations(Location.from_gps(0, 0), Location.from_gps(0.5, 179.7), method="vincenty")
+        self.assertTrue(np.isfinite(distance))
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            distances_between_locations(self.ORIGIN, self.ORIGIN, method="manhattan")
+
+
+if __name__ == "__main__":
+    unittest.main()
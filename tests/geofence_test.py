@@ -0,0 +1,106 @@
+import unittest
+
+import numpy as np
+
+from uprm_gps_utils import *
+from uprm_gps_utils import Geofence, LocationArray, Polygon
+
+
+class TestPolygon(unittest.TestCase):
+    ORIGIN = Location.from_gps(18.211042912960064, -67.14093251407316)
+
+    def square(self, x: float=0, y: float=0, side: float=100) -> Polygon:
+        return Polygon([self.ORIGIN.translate(x, y), self.ORIGIN.translate(x + side, y),
+                        self.ORIGIN.translate(x + side, y + side), self.ORIGIN.translate(x, y + side)])
+
+    def test_contains(self):
+        square = self.square()
+        self.assertTrue(square.contains(self.ORIGIN.translate(50, 50)))
+        self.assertFalse(square.contains(self.ORIGIN.translate(150, 50)))
+        self.assertFalse(square.contains(self.ORIGIN.translate(50, -1)))
+        locations = LocationArray.from_locations([self.ORIGIN.translate(1, 99), self.ORIGIN.translate(-1, 50),
+                                                  self.ORIGIN.translate(99, 1)])
+        np.testing.assert_array_equal(square.contains(locations), [True, False, True])
+
+    def test_concave_polygon(self):
+        # U shape, open to the north
+        polygon = Polygon([self.ORIGIN.translate(x, y) for x, y in
+                           [(0, 0), (30, 0), (30, 30), (20, 30), (20, 10), (10, 10), (10, 30), (0, 30)]])
+        self.assertTrue(polygon.contains(self.ORIGIN.translate(5, 20)))
+        self.assertFalse(polygon.contains(self.ORIGIN.translate(15, 20)))
+        self.assertTrue(polygon.contains(self.ORIGIN.translate(15, 5)))
+
+    def test_distance_to_boundary(self):
+        square = self.square()
+        self.assertAlmostEqual(square.distance_to_boundary(self.ORIGIN.translate(50, 40)), 40, places=6)
+        self.assertAlmostEqual(square.distance_to_boundary(self.ORIGIN.translate(-30, -40)), 50, places=6)
+        self.assertAlmostEqual(square.distance_to_boundary(self.ORIGIN.translate(5000, 50)), 4900, places=6)
+
+    def test_batches_match_single_points(self):
+        rng = np.random.default_rng(0)
+        angles = np.sort(rng.uniform(0, 2 * np.pi, 300))
+        radii = rng.uniform(200, 400, 300)
+        polygon = Polygon(LocationArray.from_utm(self.ORIGIN.easting + radii * np.sin(angles),
+                                                 self.ORIGIN.northing + radii * np.cos(angles),
+                                                 self.ORIGIN.zone_number, self.ORIGIN.zone_letter))
+        locations = LocationArray.from_utm(self.ORIGIN.easting + rng.uniform(-1500, 1500, 200),
+                                           self.ORIGIN.northing + rng.uniform(-1500, 1500, 200),
+                                           self.ORIGIN.zone_number, self.ORIGIN.zone_letter)
+        contains = polygon.contains(locations)
+        distances = polygon.distance_to_boundary(locations)
+        for i in range(len(locations)):
+            self.assertEqual(contains[i], polygon.contains(locations[i]))
+            self.assertAlmostEqual(distances[i], polygon.distance_to_boundary(locations[i]), places=6)
+
+    def test_gps_locations_are_projected(self):
+        square = self.square()
+        location = self.ORIGIN.translate(50, 40)
+        self.assertTrue(square.contains(Location.from_gps(location.lat, location.lon)))
+        self.assertAlmostEqual(square.distance_to_boundary(Location.from_gps(location.lat, location.lon)), 40, places=3)
+
+
+class TestGeofence(unittest.TestCase):
+    ORIGIN = TestPolygon.ORIGIN
+
+    def setUp(self):
+        square = TestPolygon.square
+        self.near = square(self, 0, 0, 100)
+        self.far = square(self, 1000, 0, 100)
+        self.geofence = Geofence([self.near, self.far])
+
+    def test_contains(self):
+        locations = LocationArray.from_locations([self.ORIGIN.translate(50, 50), self.ORIGIN.translate(1050, 50),
+                                                  self.ORIGIN.translate(500, 50)])
+        np.testing.assert_array_equal(self.geofence.contains(locations), [True, True, False])
+        self.assertEqual(self.geofence.containing(self.ORIGIN.translate(1050, 50)), [self.far])
+        self.assertEqual(self.geofence.containing(self.ORIGIN.translate(500, 50)), [])
+
+    def test_distance_to_boundary(self):
+        self.assertAlmostEqual(self.geofence.distance_to_boundary(self.ORIGIN.translate(500, 50)), 400, places=6)
+        self.assertAlmostEqual(self.geofence.distance_to_boundary(self.ORIGIN.translate(1090, 50)), 10, places=6)
+
+    def test_many_polygons_match_each_polygon(self):
+        rng = np.random.default_rng(0)
+        zones = [TestPolygon.square(self, x, y, 20) for x, y in rng.uniform(-2000, 2000, (100, 2))]
+        geofence = Geofence(zones)
+        locations = LocationArray.from_utm(self.ORIGIN.easting + rng.uniform(-2500, 2500, 5000),
+                                           self.ORIGIN.northing + rng.uniform(-2500, 2500, 5000),
+                                           self.ORIGIN.zone_number, self.ORIGIN.zone_letter)
+        np.testing.assert_array_equal(geofence.contains(locations),
+                                      np.any([zone.contains(locations) for zone in zones], axis=0))
+        np.testing.assert_allclose(geofence.distance_to_boundary(locations),
+                                   np.min([zone.distance_to_boundary(locations) for zone in zones], axis=0))
+        self.assertEqual(geofence.distance_to_boundary(locations[7]), geofence.distance_to_boundary(locations)[7])
+
+    def test_empty(self):
+        self.assertFalse(Geofence().contains(self.ORIGIN))
+        self.assertEqual(Geofence().distance_to_boundary(self.ORIGIN), float("inf"))
+
+    def test_rejects_other_zones(self):
+        other = Location.from_gps(18, -65)
+        with self.assertRaises(ValueError):
+            self.geofence.add(Polygon([other, other.translate(10, 0), other.translate(0, 10)]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import json
+import unittest
+
+import numpy as np
+
+import uprm_gps_utils
+from uprm_gps_utils import *
+from uprm_gps_utils import (LocationArray, disable_instrumentation, distances_between_locations, enable_instrumentation,
+                            get_instrumentation)
+from uprm_gps_utils import hooks, uprm_gps_utils as core
+
+
+class TestInstrumentation(unittest.TestCase):
+    ORIGIN = Location.from_gps(18.211042912960064, -67.14093251407316)
+
+    def tearDown(self):
+        disable_instrumentation()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(get_instrumentation())
+        self.assertIsNone(hooks.operations)
+
+    def test_counts_operations(self):
+        # also builds the zone box of the origin's zone, which takes projections of its own
+        self.ORIGIN.translate(1, 2)
+        instrumentation = enable_instrumentation()
+        self.assertIs(get_instrumentation(), instrumentation)
+        for _ in range(3):
+            Location.from_gps(18.2, -67.1).easting
+        self.ORIGIN.translate(1, 2).rotate(self.ORIGIN, 30)
+        uprm_gps_utils.distance_between_locations(self.ORIGIN, self.ORIGIN.translate(5, 0))
+        relative_angle_to_cardinal_angle(10, 20)
+        locations = LocationArray.from_gps([18.2, 18.3], [-67.1, -67.2])
+        uprm_gps_utils.distances_between_locations(self.ORIGIN, locations)
+        locations.easting
+
+        operations = instrumentation.stats()["operations"]
+        self.assertEqual(operations["conversion.from_latlon"]["count"], 3)
+        self.assertEqual(operations["transform.translate"]["count"], 2)
+        self.assertEqual(operations["transform.rotate"]["count"], 1)
+        self.assertEqual(operations["distance.distance_between_locations"]["count"], 1)
+        self.assertEqual(operations["distance.distances_between_locations"]["count"], 1)
+        # called by relative_angle_to_cardinal_angle through the core module
+        self.assertEqual(operations["angle.normalize_angle"]["count"], 1)
+        self.assertEqual(operations["conversion.array_from_latlon"]["count"], 1)
+
+    def test_latencies(self):
+        instrumentation = enable_instrumentation("transform.*", sample_size=10)
+        for _ in range(25):
+            self.ORIGIN.translate(1, 2)
+        stats = instrumentation.stats()["operations"]["transform.translate"]
+        self.assertEqual(stats["count"], 25)
+        self.assertGreater(stats["total_seconds"], 0)
+        self.assertLessEqual(stats["min_seconds"], stats["p50_seconds"])
+        self.assertLessEqual(stats["p50_seconds"], stats["p90_seconds"])
+        self.assertLessEqual(stats["p99_seconds"], stats["max_seconds"])
+        self.assertAlmostEqual(stats["mean_seconds"], stats["total_seconds"] / 25)
+        self.assertNotIn("conversion.from_latlon", instrumentation.stats()["operations"])
+
+    def test_names_imported_before_enabling_are_instrumented(self):
+        instrumentation = enable_instrumentation()
+        normalize_angle(365)
+        distances_between_locations(self.ORIGIN, self.ORIGIN)
+        operations = instrumentation.stats()["operations"]
+        self.assertEqual(operations["angle.normalize_angle"]["count"], 1)
+        self.assertEqual(operations["distance.distances_between_locations"]["count"], 1)
+
+    def test_counts_reprojections(self):
+        self.ORIGIN.translate(1, 2)
+        locations = LocationArray.from_locations([self.ORIGIN, self.ORIGIN])
+        locations.easting
+        instrumentation = enable_instrumentation("conversion.*")
+        # 150 km east of the origin is in zone 20
+        self.assertEqual(self.ORIGIN.translate(150000, 0).zone_number, 20)
+        self.assertEqual(list(locations.translate([0, 150000], [0, 0]).zone_number), [19, 20])
+        operations = instrumentation.stats()["operations"]
+        self.assertEqual(operations["conversion.to_latlon"]["count"], 1)
+        self.assertEqual(operations["conversion.from_latlon"]["count"], 1)
+        self.assertEqual(operations["conversion.array_to_latlon"]["count"], 1)
+        self.assertEqual(operations["conversion.array_from_latlon"]["count"], 1)
+
+    def test_disable_stops_recording(self):
+        instrumentation = enable_instrumentation()
+        disable_instrumentation()
+        self.assertIsNone(hooks.operations)
+        self.ORIGIN.translate(1, 2)
+        core.distance_between_locations(self.ORIGIN, self.ORIGIN)
+        self.assertEqual(instrumentation.stats()["operations"]["transform.translate"]["count"], 0)
+        self.assertEqual(instrumentation.stats()["operations"]["distance.distance_between_locations"]["count"], 0)
+
+    def test_reenabling_replaces_instrumentation(self):
+        previous = enable_instrumentation()
+        instrumentation = enable_instrumentation()
+        self.ORIGIN.translate(1, 2)
+        self.assertEqual(instrumentation.stats()["operations"]["transform.translate"]["count"], 1)
+        self.assertEqual(previous.stats()["operations"]["transform.translate"]["count"], 0)
+
+    def test_context_manager(self):
+        with enable_instrumentation() as instrumentation:
+            uprm_gps_utils.normalize_angle(np.arange(10))
+        self.assertIsNone(get_instrumentation())
+        self.assertEqual(instrumentation.stats()["operations"]["angle.normalize_angle"]["count"], 1)
+
+    def test_cache_hit_rates(self):
+        cache = enable_conversion_cache()
+        try:
+            for _ in range(3):
+                Location.from_gps(18.2, -67.1).easting
+            instrumentation = enable_instrumentation()
+            for _ in range(4):
+                Location.from_gps(18.2, -67.1).easting
+            caches = instrumentation.stats()["caches"]
+            # only the lookups made while instrumentation is enabled
+            self.assertEqual(caches["conversion_cache"]["hits"], 4)
+            self.assertEqual(caches["conversion_cache"]["misses"], 0)
+            self.assertEqual(caches["conversion_cache"]["hit_rate"], 1.0)
+            self.assertEqual(cache.stats()["hits"], 6)
+            self.assertIn("hit_rate", caches["zone_box"])
+        finally:
+            disable_conversion_cache()
+
+    def test_conversion_cache_enabled_later(self):
+        instrumentation = enable_instrumentation()
+        cache = enable_conversion_cache()
+        try:
+            for _ in range(2):
+                Location.from_gps(18.3, -67.1).easting
+            self.assertEqual(instrumentation.stats()["caches"]["conversion_cache"], cache.stats())
+        finally:
+            disable_conversion_cache()
+
+    def test_json_export(self):
+        instrumentation = enable_instrumentation()
+        self.ORIGIN.translate(1, 2)
+        exported = json.loads(instrumentation.to_json(indent=2))
+        self.assertEqual(exported["operations"]["transform.translate"]["count"], 1)
+        self.assertEqual(set(exported), {"elapsed_seconds", "operations", "caches"})
+        self.assertEqual(set(exported["operations"]), set(instrumentation.operations))
+
+    def test_invalid_sample_size(self):
+        with self.assertRaises(ValueError):
+            enable_instrumentation(sample_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
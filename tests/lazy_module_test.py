@@ -0,0 +1,54 @@
+import subprocess
+import sys
+import unittest
+
+import uprm_gps_utils
+from uprm_gps_utils import LocationArray
+from uprm_gps_utils.lazy_module import LazyModule
+
+
+class TestLazyModule(unittest.TestCase):
+    def test_replaces_itself_on_first_use(self):
+        namespace = {}
+        namespace["json"] = LazyModule("json", namespace)
+        self.assertEqual(namespace["json"].dumps([1]), "[1]")
+        import json
+        self.assertIs(namespace["json"], json)
+
+    def test_alias(self):
+        namespace = {}
+        namespace["decoder"] = LazyModule("json.decoder", namespace, alias="decoder")
+        self.assertTrue(namespace["decoder"].JSONDecodeError)
+        self.assertEqual(namespace["decoder"].__name__, "json.decoder")
+
+
+class TestPackage(unittest.TestCase):
+    def test_public_api(self):
+        for name in [*uprm_gps_utils.__all__, *uprm_gps_utils._LAZY_ATTRIBUTES]:
+            self.assertTrue(hasattr(uprm_gps_utils, name), name)
+            self.assertIn(name, dir(uprm_gps_utils))
+        self.assertIs(uprm_gps_utils.LocationArray, LocationArray)
+        self.assertFalse(set(uprm_gps_utils.__all__) & set(uprm_gps_utils._LAZY_ATTRIBUTES))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            uprm_gps_utils.not_an_attribute
+
+    def test_import_does_not_load_heavy_backends(self):
+        code = ("import sys, uprm_gps_utils; "
+                "assert 'numpy' not in sys.modules and 'utm' not in sys.modules; "
+                "uprm_gps_utils.Location.from_gps(18.2, -67.1).easting; "
+                "assert 'utm' in sys.modules and 'uprm_gps_utils.location_array' not in sys.modules; "
+                "uprm_gps_utils.Track; "
+                "assert 'uprm_gps_utils.track' in sys.modules")
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=uprm_gps_utils.__path__[0] + "/..")
+
+    def test_star_import_does_not_load_subsystems(self):
+        code = ("import sys; from uprm_gps_utils import *; "
+                "assert 'numpy' not in sys.modules and 'uprm_gps_utils.location_array' not in sys.modules; "
+                "Location.from_gps(18.2, -67.1)")
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=uprm_gps_utils.__path__[0] + "/..")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+import utm
+
+from uprm_gps_utils import *
+from uprm_gps_utils import LocalFrame
+
+
+class TestLocalFrame(unittest.TestCase):
+    ORIGIN = Location.from_gps(18.211042912960064, -67.14093251407316)
+
+    def setUp(self):
+        self.frame = LocalFrame(self.ORIGIN)
+        self.exact_frame = LocalFrame(self.ORIGIN, exact=True)
+
+    def test_origin_is_zero(self):
+        x, y = self.frame.gps_to_local(self.ORIGIN.lat, self.ORIGIN.lon)
+        self.assertAlmostEqual(x, 0, places=6)
+        self.assertAlmostEqual(y, 0, places=6)
+
+    def test_gps_to_local_matches_utm(self):
+        for lat, lon in [(18.22, -67.13), (18.19, -67.16), (18.2111, -67.1409)]:
+            easting, northing, _, _ = utm.from_latlon(lat, lon)
+            for frame in (self.frame, self.exact_frame):
+                x, y = frame.gps_to_local(lat, lon)
+                self.assertAlmostEqual(x, easting - self.ORIGIN.easting, places=2)
+                self.assertAlmostEqual(y, northing - self.ORIGIN.northing, places=2)
+
+    def test_local_to_gps_matches_utm(self):
+        for x, y in [(1000, 2000), (-3000, 500), (0, -4000)]:
+            lat, lon = utm.to_latlon(self.ORIGIN.easting + x, self.ORIGIN.northing + y, 19, "Q")
+            for frame in (self.frame, self.exact_frame):
+                obtained_lat, obtained_lon = frame.local_to_gps(x, y)
+                self.assertAlmostEqual(obtained_lat, lat, places=7)
+                self.assertAlmostEqual(obtained_lon, lon, places=7)
+
+    def test_arrays(self):
+        lat = np.array([18.22, 18.19, 18.2111])
+        lon = np.array([-67.13, -67.16, -67.1409])
+        x, y = self.frame.gps_to_local(lat, lon)
+        obtained_lat, obtained_lon = self.frame.local_to_gps(x, y)
+        np.testing.assert_allclose(obtained_lat, lat, atol=1e-8)
+        np.testing.assert_allclose(obtained_lon, lon, atol=1e-8)
+
+    def test_transforms_match_location(self):
+        location = Location.from_gps(18.22, -67.13)
+        pivot = self.ORIGIN.translate(50, -20)
+        pairs = [
+            (self.frame.translate(location, 10, 5), location.translate(10, 5)),
+            (self.frame.rotate(location, pivot, 75), location.rotate(pivot, 75)),
+            (self.frame.relative_radial_to_global_coordinates(location, 100, 45),
+             relative_radial_to_global_coordinates(location, 100, 45)),
+        ]
+        for obtained, expected in pairs:
+            self.assertAlmostEqual(obtained.easting, expected.easting, places=2)
+            self.assertAlmostEqual(obtained.northing, expected.northing, places=2)
+            self.assertAlmostEqual(obtained.lat, expected.lat, places=7)
+            self.assertAlmostEqual(obtained.lon, expected.lon, places=7)
+
+    def test_error_bound(self):
+        self.assertEqual(self.exact_frame.error_bound(5000), 0)
+        self.assertLess(self.frame.error_bound(1000), 1e-3)
+        self.assertLess(self.frame.error_bound(5000), 1e-2)
+        self.assertLess(self.frame.error_bound(1000), self.frame.error_bound(10000))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+
+import numpy as np
+
+from uprm_gps_utils import *
+from uprm_gps_utils import LocationArray
+
+
+class TestLocationArray(unittest.TestCase):
+    LATS = np.array([18.211042912960064, 18.2, -35.363262, 60.0, 78.0, 0.5])
+    LONS = np.array([-67.14093251407316, -65.9, 149.165337, 5.0, 15.0, -0.5])
+
+    def test_from_gps_matches_location(self):
+        locations = LocationArray.from_gps(self.LATS, self.LONS)
+        for i, (lat, lon) in enumerate(zip(self.LATS, self.LONS)):
+            expected = Location.from_gps(lat, lon)
+            self.assertAlmostEqual(locations.easting[i], expected.easting, places=5)
+            self.assertAlmostEqual(locations.northing[i], expected.northing, places=5)
+            self.assertEqual(locations.zone_number[i], expected.zone_number)
+            self.assertEqual(locations.zone_letter[i], expected.zone_letter)
+
+    def test_from_utm_matches_location(self):
+        expected = [Location.from_gps(lat, lon) for lat, lon in zip(self.LATS, self.LONS)]
+        locations = LocationArray.from_utm([loc.easting for loc in expected],
+                                           [loc.northing for loc in expected],
+                                           [loc.zone_number for loc in expected],
+                                           [loc.zone_letter for loc in expected])
+        np.testing.assert_allclose(locations.lat, self.LATS, atol=1e-7)
+        np.testing.assert_allclose(locations.lon, self.LONS, atol=1e-7)
+
+    def test_translate_matches_location(self):
+        location = Location.from_gps(18.211042912960064, -67.14093251407316)
+        locations = LocationArray.from_locations([location] * 3).translate([5, 0, 100], [0, 5, -100])
+        for i, (dx, dy) in enumerate([(5, 0), (0, 5), (100, -100)]):
+            expected = location.translate(dx, dy)
+            self.assertAlmostEqual(locations.lat[i], expected.lat, places=7)
+            self.assertAlmostEqual(locations.lon[i], expected.lon, places=7)
+
+    def test_rotate_matches_location(self):
+        origin = Location.from_utm(100000, 100000, 19, "Q")
+        locations = LocationArray.from_utm(100000, 200000, 19, "Q").rotate(origin, np.array([0, 45, 90, -90]))
+        for i, angle in enumerate([0, 45, 90, -90]):
+            expected = Location.from_utm(100000, 200000, 19, "Q").rotate(origin, angle)
+            self.assertAlmostEqual(locations.easting[i], expected.easting, places=5)
+            self.assertAlmostEqual(locations.northing[i], expected.northing, places=5)
+
+    def test_translate_across_zones_matches_location(self):
+        locations = LocationArray.from_gps([18, 18, 0.0005, 15.9995], [-66.0005, -67, -67, -67])
+        offsets = [(200, 0), (5, 5), (0, -200), (0, 200)]
+        moved = locations.translate([dx for dx, _ in offsets], [dy for _, dy in offsets])
+        for i, (dx, dy) in enumerate(offsets):
+            expected = locations[i].translate(dx, dy)
+            self.assertEqual(moved.zone_number[i], expected.zone_number)
+            self.assertEqual(moved.zone_letter[i], expected.zone_letter)
+            self.assertAlmostEqual(moved.easting[i], expected.easting, places=5)
+            self.assertAlmostEqual(moved.northing[i], expected.northing, places=5)
+
+    def test_to_zone_keeps_a_common_zone(self):
+        locations = LocationArray.from_gps([18, 18], [-66.0005, -65.9995]).to_zone()
+        self.assertEqual(list(locations.zone_number), [19, 19])
+        moved = locations.translate(200, 0)
+        self.assertEqual(list(moved.zone_number), [19, 19])
+        np.testing.assert_allclose(moved.easting, locations.easting + 200)
+
+    def test_to_zone_number_keeps_each_hemisphere(self):
+        locations = LocationArray.from_gps([-18.0, 18.0], [-65.5, -65.5]).to_zone(20)
+        self.assertEqual(list(locations.zone_number), [20, 20])
+        self.assertEqual(list(locations.zone_letter), ["K", "Q"])
+        moved = locations.translate(1, 0)
+        np.testing.assert_allclose(moved.lat, [-18.0, 18.0], atol=1e-4)
+        np.testing.assert_allclose(locations.lon, [-65.5, -65.5])
+        expected = Location.from_gps(-18.0, -65.5)
+        self.assertAlmostEqual(locations.northing[0], expected.northing, places=5)
+
+    def test_to_zone_reads_gps_far_from_the_zone(self):
+        # the second point is two zones east of zone 19, past the easting range of strict UTM
+        moved = LocationArray.from_gps([18.0, 18.0], [-67.0, -58.0]).to_zone(19).translate(1, 0)
+        self.assertGreater(moved.easting[1], 999999)
+        np.testing.assert_allclose(moved.lat, [18.0, 18.0], atol=1e-4)
+        np.testing.assert_allclose(moved.lon, [-67.0, -58.0], atol=1e-4)
+
+    def test_indexing(self):
+        locations = LocationArray.from_gps(self.LATS, self.LONS)
+        self.assertIsInstance(locations[0], Location)
+        self.assertEqual(locations[1].lat, self.LATS[1])
+        self.assertEqual(len(locations[1:4]), 3)
+        self.assertEqual(len(list(locations)), len(self.LATS))
+
+
+if __name__ == "__main__":
+    unittest.main()
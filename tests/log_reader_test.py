@@ -0,0 +1,94 @@
+import io
+import os
+import tempfile
+import unittest
+
+from uprm_gps_utils import LocationArray, read_csv, read_nmea
+
+
+NMEA_LOG = b"""$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,*47\r
+$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W*6A\r
+$GPGGA,123520,1812.6626,N,06708.4560,W,0,00,,,M,,M,,*5B\r
+$GPRMC,123520,V,1812.6626,N,06708.4560,W,,,230394,,*0D\r
+$GPGSV,3,1,11,03,03,111,00,04,15,270,00,06,01,010,00,13,06,292,00*74\r
+$GNGGA,123521,1812.6626,N,06708.4560,W,1,08,0.9,10.0,M,-40.0,M,,*4C\r
+$GPGGA,123522,1812.6626,N,06708.4560,W,1,08,0.9,10.0,M,-40.0,M,,*00\r
+$GPGGA,123523,3521.7957,S,14909.9202,E,2,08,0.9,10.0,M,-40.0,M,,*7C\r
+"""
+
+
+def with_checksum(sentence: str) -> bytes:
+    checksum = 0
+    for char in sentence[1:]:
+        checksum ^= ord(char)
+    return f"{sentence}*{checksum:02X}\r\n".encode()
+
+
+class TestReadNmea(unittest.TestCase):
+    def setUp(self):
+        # recompute checksums so the log only has one deliberately wrong sentence (123522)
+        lines = []
+        for line in NMEA_LOG.splitlines():
+            sentence = line.decode().split("*")[0]
+            lines.append(line + b"\n" if "123522" in sentence else with_checksum(sentence))
+        self.log = b"".join(lines)
+
+    def test_reads_valid_fixes(self):
+        locations = list(read_nmea(self.log))
+        self.assertEqual(len(locations), 4)
+        self.assertAlmostEqual(locations[0].lat, 48.1173)
+        self.assertAlmostEqual(locations[0].lon, 11.516666666666667)
+        self.assertAlmostEqual(locations[1].lat, 48.1173)
+        self.assertAlmostEqual(locations[2].lat, 18.21104333333333)
+        self.assertAlmostEqual(locations[2].lon, -67.14093333333334)
+        self.assertAlmostEqual(locations[3].lat, -35.363261666666666)
+        self.assertAlmostEqual(locations[3].lon, 149.16533666666666)
+
+    def test_sentence_selection_and_checksums(self):
+        self.assertEqual(len(list(read_nmea(self.log, sentences=("RMC",)))), 1)
+        self.assertEqual(len(list(read_nmea(self.log, sentences=("GGA",)))), 3)
+        self.assertEqual(len(list(read_nmea(self.log, validate_checksum=False))), 5)
+
+    def test_sources_and_chunks(self):
+        expected = [(location.lat, location.lon) for location in read_nmea(self.log)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "log.nmea")
+            with open(path, "wb") as file:
+                file.write(self.log)
+            sources = [
+                lambda: read_nmea(path),
+                lambda: read_nmea(path, memory_map=False, chunk_size=7),
+                lambda: read_nmea(io.BytesIO(self.log), chunk_size=13),
+                lambda: read_nmea(bytearray(self.log), chunk_size=1),
+            ]
+            for read in sources:
+                self.assertEqual([(location.lat, location.lon) for location in read()], expected)
+
+    def test_batches(self):
+        batches = list(read_nmea(self.log, batch_size=3))
+        self.assertEqual([len(batch) for batch in batches], [3, 1])
+        self.assertIsInstance(batches[0], LocationArray)
+        self.assertAlmostEqual(batches[1].lat[0], -35.363261666666666)
+
+
+class TestReadCsv(unittest.TestCase):
+    CSV_LOG = b"time,lat,lon\n0,18.2110,-67.1409\n1,18.2111,-67.1408\n\n2,bad,-67.1407\n3,18.2113,-67.1406"
+
+    def test_header_columns(self):
+        locations = list(read_csv(self.CSV_LOG))
+        self.assertEqual([(location.lat, location.lon) for location in locations],
+                         [(18.2110, -67.1409), (18.2111, -67.1408), (18.2113, -67.1406)])
+
+    def test_index_columns_and_delimiter(self):
+        log = b"18.2110;-67.1409\r\n18.2111;-67.1408\r\n"
+        locations = list(read_csv(log, lat_column=0, lon_column=1, delimiter=";"))
+        self.assertEqual([(location.lat, location.lon) for location in locations], [(18.2110, -67.1409), (18.2111, -67.1408)])
+
+    def test_batches(self):
+        batches = list(read_csv(self.CSV_LOG, batch_size=2, chunk_size=5))
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertEqual(list(batches[0].lon), [-67.1409, -67.1408])
+
+
+if __name__ == "__main__":
+    unittest.main()
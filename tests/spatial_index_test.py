@@ -0,0 +1,67 @@
+import random
+import unittest
+
+from uprm_gps_utils import *
+from uprm_gps_utils import LocationArray
+
+
+class TestSpatialIndex(unittest.TestCase):
+    ORIGIN = Location.from_gps(18.211042912960064, -67.14093251407316)
+
+    def setUp(self):
+        rng = random.Random(0)
+        self.locations = [self.ORIGIN.translate(rng.uniform(-500, 500), rng.uniform(-500, 500)) for _ in range(300)]
+        self.index = SpatialIndex(self.locations, cell_size_meters=25)
+
+    def brute_force(self, query: Location):
+        return sorted(((location, ((location.easting - query.easting)**2 + (location.northing - query.northing)**2)**0.5)
+                       for location in self.locations), key=lambda pair: pair[1])
+
+    def test_nearest_matches_brute_force(self):
+        for query in [self.ORIGIN, self.ORIGIN.translate(400, -300), self.ORIGIN.translate(2000, 2000)]:
+            expected = self.brute_force(query)[:5]
+            obtained = self.index.nearest(query, k=5)
+            self.assertEqual([location for location, _ in obtained], [location for location, _ in expected])
+            for (_, obtained_distance), (_, expected_distance) in zip(obtained, expected):
+                self.assertAlmostEqual(obtained_distance, expected_distance, places=6)
+
+    def test_within_matches_brute_force(self):
+        for radius in [0, 30, 120, 5000]:
+            expected = [location for location, distance in self.brute_force(self.ORIGIN) if distance <= radius]
+            self.assertEqual([location for location, _ in self.index.within(self.ORIGIN, radius)], expected)
+
+    def test_insert_and_remove(self):
+        dock = self.ORIGIN.translate(1, 1)
+        self.index.insert(dock)
+        self.index.insert(dock)
+        self.assertEqual(len(self.index), 301)
+        self.assertIn(dock, self.index)
+        self.assertEqual(self.index.nearest(self.ORIGIN.translate(1, 1))[0][0], dock)
+
+        self.index.remove(dock)
+        self.assertNotIn(dock, self.index)
+        self.assertNotEqual(self.index.nearest(self.ORIGIN.translate(1, 1))[0][0], dock)
+        with self.assertRaises(KeyError):
+            self.index.remove(dock)
+
+    def test_batch_queries(self):
+        queries = LocationArray.from_locations([self.ORIGIN, self.ORIGIN.translate(100, 100)])
+        self.assertEqual(self.index.nearest_many(queries, k=3),
+                         [self.index.nearest(query, k=3) for query in queries])
+        self.assertEqual(self.index.within_many(queries, 50),
+                         [self.index.within(query, 50) for query in queries])
+
+    def test_other_zone(self):
+        index = SpatialIndex([Location.from_gps(18.2, -66.0005)])
+        east = Location.from_gps(18.2, -65.9995)
+        self.assertNotEqual(east.zone_number, 19)
+        (_, distance), = index.nearest(east)
+        self.assertAlmostEqual(distance, 105.7, places=0)
+
+    def test_empty(self):
+        self.assertEqual(SpatialIndex().nearest(self.ORIGIN), [])
+        self.assertEqual(SpatialIndex().within(self.ORIGIN, 10), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+
+import numpy as np
+
+from uprm_gps_utils import *
+from uprm_gps_utils import LocationArray, Track
+
+
+class TestTrack(unittest.TestCase):
+    START = Location.from_gps(18.211042912960064, -67.14093251407316)
+
+    def fixes(self, count: int=50):
+        rng = np.random.default_rng(0)
+        return LocationArray.from_utm(self.START.easting + np.cumsum(rng.uniform(-5, 5, count)),
+                                      self.START.northing + np.cumsum(rng.uniform(0, 5, count)),
+                                      self.START.zone_number, self.START.zone_letter)
+
+    def test_distance_matches_distance_between_locations(self):
+        fixes = self.fixes()
+        track = Track()
+        for location in fixes:
+            track.add(location)
+        expected = sum(distance_between_locations(fixes[i], fixes[i + 1]) for i in range(len(fixes) - 1))
+        self.assertAlmostEqual(track.distance_meters, expected, places=6)
+        self.assertEqual(track.count, len(fixes))
+        self.assertEqual(track.bounding_box, (fixes.lat.min(), fixes.lon.min(), fixes.lat.max(), fixes.lon.max()))
+
+    def test_speed_and_heading(self):
+        east = Location.from_gps(self.START.lat, self.START.lon + 2e-4)
+        south_east = Location.from_gps(self.START.lat - 2e-4, self.START.lon + 2e-4)
+        track = Track()
+        track.add(self.START, timestamp=10)
+        self.assertIsNone(track.speed_mps)
+        self.assertIsNone(track.heading_deg)
+        track.add(east, timestamp=12)
+        self.assertAlmostEqual(track.speed_mps, distance_between_locations(self.START, east) / 2)
+        self.assertAlmostEqual(track.heading_deg, 90, places=3)
+        track.add(south_east, timestamp=16)
+        self.assertAlmostEqual(track.speed_mps, distance_between_locations(east, south_east) / 4)
+        self.assertAlmostEqual(track.heading_deg, 180)
+        self.assertEqual(track.duration_seconds, 6)
+        self.assertAlmostEqual(track.average_speed_mps, track.distance_meters / 6)
+
+    def test_batches_match_single_fixes(self):
+        fixes = self.fixes()
+        timestamps = np.arange(len(fixes), dtype=float)
+        single = Track(history_size=16)
+        for location, timestamp in zip(fixes, timestamps):
+            single.add(location, timestamp)
+        batched = Track(history_size=16)
+        batched.add_many(fixes[:7], timestamps[:7])
+        batched.add_many(fixes[7:30], timestamps[7:30])
+        batched.add_many(fixes[30:], timestamps[30:])
+
+        self.assertAlmostEqual(batched.distance_meters, single.distance_meters, places=6)
+        self.assertAlmostEqual(batched.speed_mps, single.speed_mps)
+        self.assertAlmostEqual(batched.heading_deg, single.heading_deg)
+        self.assertEqual(batched.bounding_box, single.bounding_box)
+        self.assertEqual(batched.count, single.count)
+        self.assertEqual(batched.last, single.last)
+        np.testing.assert_array_equal(batched.history()[1], single.history()[1])
+
+    def test_speed_skips_fixes_without_timestamp(self):
+        fixes = self.fixes(3)
+        single = Track()
+        single.add(fixes[0], timestamp=0)
+        single.add(fixes[1])
+        single.add(fixes[2], timestamp=10)
+        # no fix pairs two timestamps, so there is no speed rather than the distance from fixes[1] over 10 s
+        self.assertIsNone(single.speed_mps)
+        batched = Track()
+        batched.add_many(fixes[:2], [0, np.nan])
+        batched.add_many(fixes[2:], [10])
+        self.assertIsNone(batched.speed_mps)
+
+    def test_batches_with_missing_and_repeated_timestamps(self):
+        fixes = self.fixes(12)
+        timestamps = [0, 1, np.nan, 3, 3, np.nan, np.nan, 6, 7, 7, 8, np.nan]
+        single = Track()
+        speeds = []
+        for location, timestamp in zip(fixes, timestamps):
+            single.add(location, None if np.isnan(timestamp) else timestamp)
+            speeds.append(single.speed_mps)
+        for split in ([3], [1, 6], [4, 10], [2, 5, 8, 11]):
+            batched = Track()
+            for start, stop in zip([0, *split], [*split, len(fixes)]):
+                batched.add_many(fixes[start:stop], timestamps[start:stop])
+                if speeds[stop - 1] is None:
+                    self.assertIsNone(batched.speed_mps, (split, stop))
+                else:
+                    self.assertAlmostEqual(batched.speed_mps, speeds[stop - 1], msg=(split, stop))
+
+    def test_history_is_bounded(self):
+        fixes = self.fixes()
+        track = Track(history_size=10)
+        track.add_many(fixes, np.arange(len(fixes), dtype=float))
+        history, timestamps = track.history()
+        self.assertEqual(len(history), 10)
+        np.testing.assert_array_equal(timestamps, np.arange(len(fixes) - 10, len(fixes)))
+        np.testing.assert_allclose(history.lat, fixes.lat[-10:])
+
+        track = Track(history_size=10)
+        track.add(fixes[0])
+        history, timestamps = track.history()
+        self.assertEqual(len(history), 1)
+        self.assertTrue(np.isnan(timestamps[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
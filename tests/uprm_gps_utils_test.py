@@ -1,7 +1,6 @@
-from os import system
-system("pip install .")
-
+from math import pi
 import unittest
+from unittest import mock
 import utm
 
 from uprm_gps_utils import *
@@ -64,6 +63,109 @@ class TestLocationWrapper(unittest.TestCase):
         self.assertEqual(rotated_location.easting, expected.easting)
         self.assertEqual(rotated_location.northing, expected.northing)
 
+    def test_chain_is_converted_lazily(self):
+        origin = Location.from_utm(500000, 2000000, 19, "Q")
+        with mock.patch("utm.to_latlon", wraps=utm.to_latlon) as to_latlon:
+            location = origin
+            for _ in range(10):
+                location = location.translate(5, 0).rotate(pivot=origin, angle_cw_deg=10)
+            self.assertEqual(to_latlon.call_count, 0)
+            location.lat
+            location.lon
+            self.assertEqual(to_latlon.call_count, 1)
+
+    def test_lazy_conversion_matches_utm(self):
+        location = Location.from_gps(18.211042912960064, -67.14093251407316)
+        easting, northing, zone_number, zone_letter = utm.from_latlon(18.211042912960064, -67.14093251407316)
+        self.assertEqual(location.easting, easting)
+        self.assertEqual(location.northing, northing)
+        self.assertEqual(location.zone_number, zone_number)
+        self.assertEqual(location.zone_letter, zone_letter)
+
+    def test_is_immutable(self):
+        location = Location.from_gps(18, -66)
+        with self.assertRaises(AttributeError):
+            location.lat = 19
+        with self.assertRaises(AttributeError):
+            location.altitude = 0
+
+    def test_equality_and_hash(self):
+        location = Location.from_gps(18, -66)
+        same = Location.from_utm(location.easting, location.northing, location.zone_number, location.zone_letter)
+        other = location.translate(1, 0)
+        self.assertEqual(location, same)
+        self.assertNotEqual(location, other)
+        self.assertEqual(hash(location), hash(same))
+        self.assertEqual(len({location, same, other}), 2)
+        self.assertEqual({location: "dock"}[same], "dock")
+
+
+class TestZoneCrossing(unittest.TestCase):
+    def test_translate_across_zone_boundary(self):
+        location = Location.from_gps(18, -66.0005)
+        moved = location.translate(200, 0)
+        self.assertEqual((location.zone_number, moved.zone_number), (19, 20))
+        self.assertAlmostEqual(moved.lon, -65.99861, places=5)
+        self.assertAlmostEqual(distance_between_locations(location, moved), 200, delta=1)
+        self.assertEqual(moved, Location.from_gps(moved.lat, moved.lon))
+
+    def test_translate_across_equator(self):
+        moved = Location.from_gps(0.0005, -67).translate(0, -200)
+        self.assertEqual(moved.zone_letter, "M")
+        self.assertLess(moved.lat, 0)
+        self.assertGreater(moved.northing, 9000000)
+
+    def test_translate_across_band_keeps_utm_coordinates(self):
+        location = Location.from_gps(15.9995, -67)
+        moved = location.translate(0, 200)
+        self.assertEqual((location.zone_letter, moved.zone_letter), ("P", "Q"))
+        self.assertEqual(moved.easting, location.easting)
+        self.assertEqual(moved.northing, location.northing + 200)
+
+    def test_rotate_across_zone_boundary(self):
+        pivot = Location.from_gps(18, -66.0005)
+        moved = pivot.translate(0, 200).rotate(pivot, 90)
+        self.assertEqual(moved.zone_number, 20)
+        self.assertAlmostEqual(distance_between_locations(pivot, moved), 200, delta=1)
+
+
+class TestAttitude(unittest.TestCase):
+    def test_deg_and_rad_agree(self):
+        attitude = Attitude.from_deg(yaw=90, roll=-45, pitch=180)
+        self.assertAlmostEqual(attitude.yaw_rad, pi / 2)
+        self.assertAlmostEqual(attitude.roll_rad, -pi / 4)
+        self.assertAlmostEqual(attitude.pitch_rad, pi)
+        self.assertEqual(attitude, Attitude.from_rad(yaw=pi / 2, roll=-pi / 4, pitch=pi))
+
+    def test_is_immutable_and_hashable(self):
+        attitude = Attitude.from_deg(yaw=10)
+        with self.assertRaises(AttributeError):
+            attitude.yaw_deg = 20
+        self.assertEqual(len({attitude, Attitude.from_deg(yaw=10), Attitude.from_deg(yaw=20)}), 2)
+
+    def test_rotation_matrix_is_cached_and_orthonormal(self):
+        attitude = Attitude.from_deg(yaw=30, roll=-12, pitch=7)
+        matrix = attitude.rotation_matrix
+        self.assertIs(attitude.rotation_matrix, matrix)
+        for i in range(3):
+            for j in range(3):
+                dot = sum(matrix[i][k] * matrix[j][k] for k in range(3))
+                self.assertAlmostEqual(dot, 1 if i == j else 0)
+
+    def test_body_to_world(self):
+        north, east, down = Attitude.from_deg(yaw=90).body_to_world(1, 0, 0)
+        self.assertAlmostEqual(north, 0)
+        self.assertAlmostEqual(east, 1)
+        self.assertAlmostEqual(down, 0)
+        # starboard side down
+        north, east, down = Attitude.from_deg(roll=90).body_to_world(0, 1, 0)
+        self.assertAlmostEqual(east, 0)
+        self.assertAlmostEqual(down, 1)
+        # bow up
+        north, east, down = Attitude.from_deg(pitch=90).body_to_world(1, 0, 0)
+        self.assertAlmostEqual(north, 0)
+        self.assertAlmostEqual(down, -1)
+
 
 class TestNormalizeAngle(unittest.TestCase):
     def test_angles_from_0_to_360(self):
@@ -0,0 +1,48 @@
+import unittest
+
+import numpy as np
+
+from uprm_gps_utils import *
+from uprm_gps_utils import LocationArray, gate_waypoints, lawnmower_waypoints, offset_waypoints, orbit_waypoints
+
+
+class TestWaypoints(unittest.TestCase):
+    CENTER = Location.from_gps(18.211042912960064, -67.14093251407316)
+
+    def test_offsets_match_translate_and_rotate(self):
+        heading = 75
+        waypoints = offset_waypoints(self.CENTER, heading, [5, 0, -5, 0], [0, 5, 0, -5])
+        for i, (forward, right) in enumerate([(5, 0), (0, 5), (-5, 0), (0, -5)]):
+            expected = self.CENTER.translate(right, forward).rotate(self.CENTER, heading)
+            self.assertAlmostEqual(waypoints.easting[i], expected.easting, places=6)
+            self.assertAlmostEqual(waypoints.northing[i], expected.northing, places=6)
+            self.assertAlmostEqual(waypoints[i].lat, expected.lat, places=9)
+
+    def test_orbit(self):
+        waypoints = orbit_waypoints(self.CENTER, 10, 4)
+        np.testing.assert_allclose(waypoints.easting - self.CENTER.easting, [0, 10, 0, -10], atol=1e-9)
+        np.testing.assert_allclose(waypoints.northing - self.CENTER.northing, [10, 0, -10, 0], atol=1e-9)
+        counterclockwise = orbit_waypoints(self.CENTER, 10, 4, start_angle_deg=90, clockwise=False)
+        np.testing.assert_allclose(counterclockwise.easting - self.CENTER.easting, [10, 0, -10, 0], atol=1e-9)
+
+    def test_gate(self):
+        # A gate across the north-south axis, with the left buoy to the west, is passed going north.
+        left, right = self.CENTER, self.CENTER.translate(10, 0)
+        waypoints = gate_waypoints(left, right, 5)
+        np.testing.assert_allclose(waypoints.easting - self.CENTER.easting, [5, 5], atol=1e-9)
+        np.testing.assert_allclose(waypoints.northing - self.CENTER.northing, [-5, 5], atol=1e-9)
+
+        lefts = LocationArray.from_locations([left, self.CENTER.translate(0, 50)])
+        rights = LocationArray.from_locations([right, self.CENTER.translate(0, 60)])
+        self.assertEqual(len(gate_waypoints(lefts, rights, 5)), 4)
+
+    def test_lawnmower(self):
+        waypoints = lawnmower_waypoints(self.CENTER, 0, length_meters=100, width_meters=10, spacing_meters=3)
+        np.testing.assert_allclose(waypoints.easting - self.CENTER.easting, [0, 0, 3, 3, 6, 6, 9, 9, 10, 10], atol=1e-9)
+        np.testing.assert_allclose(waypoints.northing - self.CENTER.northing,
+                                   [0, 100, 100, 0, 0, 100, 100, 0, 0, 100], atol=1e-9)
+        self.assertEqual(len(lawnmower_waypoints(self.CENTER, 30, 100, 20, 5, points_per_lane=11)), 55)
+
+
+if __name__ == "__main__":
+    unittest.main()
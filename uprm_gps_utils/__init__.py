@@ -1 +1,75 @@
-from .uprm_gps_utils import *
\ No newline at end of file
+"""
+GPS, UTM and angle utilities for autonomous vehicles.
+
+The pure-Python core (`Location`, `Attitude`, the angle and distance functions and the conversion cache) is
+imported with the package. The NumPy-backed subsystems are only imported when one of their names is first
+used, so that nodes which only need the core start quickly. `utm` itself is loaded on the first projection.
+`from uprm_gps_utils import *` only brings in the core; the lazy names are imported explicitly, e.g.
+`from uprm_gps_utils import LocationArray`.
+"""
+from importlib import import_module
+
+from .conversion_cache import ConversionCache
+from .spatial_index import SpatialIndex
+from .uprm_gps_utils import (Attitude, Location, disable_conversion_cache, distance_between_locations,
+                             enable_conversion_cache, get_conversion_cache, normalize_angle,
+                             relative_angle_to_cardinal_angle, relative_radial_to_global_coordinates)
+
+
+# public name -> submodule it is lazily imported from. They are left out of `__all__`, as a star import would
+# otherwise load every subsystem.
+_LAZY_ATTRIBUTES = {
+    "LocationArray": "location_array",
+    "distances_between_locations": "distance",
+    "distance_matrix": "distance",
+    "LocalFrame": "local_frame",
+    "read_csv": "log_reader",
+    "read_nmea": "log_reader",
+    "body_to_global_coordinates": "detections",
+    "detections_to_global_coordinates": "detections",
+    "detections_to_global_coordinates_3d": "detections",
+    "gate_waypoints": "waypoints",
+    "lawnmower_waypoints": "waypoints",
+    "offset_waypoints": "waypoints",
+    "orbit_waypoints": "waypoints",
+    "Track": "track",
+    "Geofence": "geofence",
+    "Polygon": "geofence",
+    "bulk_from_gps": "bulk",
+    "bulk_from_gps_async": "bulk",
+    "bulk_from_utm": "bulk",
+    "bulk_from_utm_async": "bulk",
+    "Instrumentation": "instrumentation",
+    "enable_instrumentation": "instrumentation",
+    "disable_instrumentation": "instrumentation",
+    "get_instrumentation": "instrumentation",
+}
+
+__all__ = [
+    "Attitude",
+    "ConversionCache",
+    "Location",
+    "SpatialIndex",
+    "disable_conversion_cache",
+    "distance_between_locations",
+    "enable_conversion_cache",
+    "get_conversion_cache",
+    "normalize_angle",
+    "relative_angle_to_cardinal_angle",
+    "relative_radial_to_global_coordinates",
+]
+
+
+def __getattr__(name: str):
+    """
+    Imports the submodule of a lazy public name on first use, and caches the name in the package.
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,166 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from .location_array import LocationArray
+
+
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+
+def _gps_chunk_to_utm(lat: np.ndarray, lon: np.ndarray) -> tuple:
+    """
+    Projects one chunk. Defined at module level so that process pools can pickle it.
+    """
+    locations = LocationArray.from_gps(lat, lon)
+    return locations.easting, locations.northing, locations.zone_number, locations.zone_letter
+
+
+def _utm_chunk_to_gps(easting: np.ndarray, northing: np.ndarray, zone_number: np.ndarray,
+                      zone_letter: np.ndarray) -> tuple:
+    """
+    Unprojects one chunk. Defined at module level so that process pools can pickle it.
+    """
+    locations = LocationArray.from_utm(easting, northing, zone_number, zone_letter)
+    return locations.lat, locations.lon
+
+
+def _chunks(arrays: tuple, chunk_size: int) -> list:
+    """
+    Returns (list): The tuples of consecutive `chunk_size` slices of every array, in order.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    count = len(arrays[0])
+    return [tuple(array[start:start + chunk_size] for array in arrays) for start in range(0, count, chunk_size)]
+
+
+def _gps_arrays(lat, lon) -> tuple:
+    lat, lon = np.broadcast_arrays(np.asarray(lat, dtype=float), np.asarray(lon, dtype=float))
+    return lat.ravel(), lon.ravel()
+
+
+def _utm_arrays(easting, northing, zone_number, zone_letter) -> tuple:
+    locations = LocationArray.from_utm(np.ravel(easting), np.ravel(northing),
+                                       np.ravel(zone_number) if np.ndim(zone_number) else zone_number,
+                                       np.ravel(zone_letter) if np.ndim(zone_letter) else zone_letter)
+    return locations._easting, locations._northing, locations._zone_number, locations._zone_letter
+
+
+def _from_gps_results(lat: np.ndarray, lon: np.ndarray, results: list) -> LocationArray:
+    locations = LocationArray.from_gps(lat, lon)
+    if results:
+        locations._easting, locations._northing, locations._zone_number, locations._zone_letter = \
+            (np.concatenate(columns) for columns in zip(*results))
+    else:
+        locations._easting, locations._northing = np.empty(0), np.empty(0)
+        locations._zone_number, locations._zone_letter = np.empty(0, dtype=np.int64), np.empty(0, dtype="<U1")
+    return locations
+
+
+def _from_utm_results(arrays: tuple, results: list) -> LocationArray:
+    locations = LocationArray.from_utm(*arrays)
+    if results:
+        locations._lat, locations._lon = (np.concatenate(columns) for columns in zip(*results))
+    else:
+        locations._lat, locations._lon = np.empty(0), np.empty(0)
+    return locations
+
+
+def _make_executor(workers: int, processes: bool) -> Executor:
+    return ProcessPoolExecutor(workers) if processes else ThreadPoolExecutor(workers)
+
+
+def _workers(workers: int) -> int:
+    return workers if workers is not None else os.cpu_count() or 1
+
+
+def _map(function, chunks: list, workers: int, processes: bool, executor: Executor) -> list:
+    """
+    Runs `function` on every chunk and returns the results in the order of the chunks.
+    A single chunk or worker runs in the calling thread, without a pool.
+    """
+    if executor is not None:
+        return list(executor.map(function, *zip(*chunks))) if chunks else []
+    workers = _workers(workers)
+    if workers <= 1 or len(chunks) <= 1:
+        return [function(*chunk) for chunk in chunks]
+    with _make_executor(min(workers, len(chunks)), processes) as pool:
+        return list(pool.map(function, *zip(*chunks)))
+
+
+async def _map_async(function, chunks: list, workers: int, processes: bool, executor: Executor) -> list:
+    """
+    Awaitable version of `_map`: every chunk runs in the pool, never in the event loop's thread.
+    """
+    loop = asyncio.get_running_loop()
+    if executor is not None:
+        return await asyncio.gather(*(loop.run_in_executor(executor, function, *chunk) for chunk in chunks))
+    pool = _make_executor(max(1, min(_workers(workers), len(chunks))), processes)
+    try:
+        return await asyncio.gather(*(loop.run_in_executor(pool, function, *chunk) for chunk in chunks))
+    finally:
+        pool.shutdown(wait=False)
+
+
+def bulk_from_gps(lat, lon, workers: int=None, chunk_size: int=DEFAULT_CHUNK_SIZE, processes: bool=False,
+                  executor: Executor=None) -> LocationArray:
+    """
+    Projects a large dataset of GPS coordinates to UTM, such as a whole mission log, spreading chunks of
+    points across a pool of workers. Each chunk is projected in one vectorized pass, like `LocationArray`.
+
+    Threads are cheap to start and share the input without copying it; NumPy releases the GIL during most of
+    the projection, so they scale on large chunks. Processes avoid the GIL entirely, but every chunk and result
+    is pickled, which only pays off for tens of millions of points.
+
+    Parameters:
+        lat (np.ndarray): The latitudes in decimal degrees.
+        lon (np.ndarray): The longitudes in decimal degrees.
+        workers (int): The number of workers. Defaults to the number of CPUs; 1 runs in the calling thread.
+        chunk_size (int): The number of points per chunk.
+        processes (bool): Use a process pool instead of a thread pool.
+        executor (Executor): An existing pool to run the chunks in, instead of starting one per call.
+            `workers` and `processes` are then ignored.
+
+    Returns (LocationArray): The locations in input order, with both their GPS and UTM coordinates computed.
+    """
+    lat, lon = _gps_arrays(lat, lon)
+    return _from_gps_results(lat, lon, _map(_gps_chunk_to_utm, _chunks((lat, lon), chunk_size),
+                                            workers, processes, executor))
+
+
+def bulk_from_utm(easting, northing, zone_number, zone_letter, workers: int=None,
+                  chunk_size: int=DEFAULT_CHUNK_SIZE, processes: bool=False, executor: Executor=None) -> LocationArray:
+    """
+    Unprojects a large dataset of UTM coordinates to GPS. Same as `bulk_from_gps` in the other direction.
+    `zone_number` and `zone_letter` may be scalars shared by every point.
+
+    Returns (LocationArray): The locations in input order, with both their GPS and UTM coordinates computed.
+    """
+    arrays = _utm_arrays(easting, northing, zone_number, zone_letter)
+    return _from_utm_results(arrays, _map(_utm_chunk_to_gps, _chunks(arrays, chunk_size),
+                                          workers, processes, executor))
+
+
+async def bulk_from_gps_async(lat, lon, workers: int=None, chunk_size: int=DEFAULT_CHUNK_SIZE,
+                              processes: bool=False, executor: Executor=None) -> LocationArray:
+    """
+    Awaitable version of `bulk_from_gps`. Every chunk runs in the pool, so the event loop keeps running
+    other tasks, such as the callbacks of an async node, during the conversion.
+    """
+    lat, lon = _gps_arrays(lat, lon)
+    return _from_gps_results(lat, lon, await _map_async(_gps_chunk_to_utm, _chunks((lat, lon), chunk_size),
+                                                        workers, processes, executor))
+
+
+async def bulk_from_utm_async(easting, northing, zone_number, zone_letter, workers: int=None,
+                              chunk_size: int=DEFAULT_CHUNK_SIZE, processes: bool=False,
+                              executor: Executor=None) -> LocationArray:
+    """
+    Awaitable version of `bulk_from_utm`. See `bulk_from_gps_async`.
+    """
+    arrays = _utm_arrays(easting, northing, zone_number, zone_letter)
+    return _from_utm_results(arrays, await _map_async(_utm_chunk_to_gps, _chunks(arrays, chunk_size),
+                                                      workers, processes, executor))
@@ -0,0 +1,117 @@
+from collections import OrderedDict
+import threading
+
+from . import hooks
+
+
+EVICTION_POLICIES = ("lru", "fifo")
+
+
+class ConversionCache:
+    """
+    Size-bounded, thread-safe memo of `utm.from_latlon` and `utm.to_latlon` results.
+
+    With a quantum, coordinates are snapped to the nearest multiple of it before being converted,
+    so every coordinate within half a quantum of another one shares its cache entry. Results are
+    then only as precise as the quantum, but they do not depend on the order of the calls.
+
+    Attributes:
+        maxsize (int): the maximum number of cached conversions
+        eviction (str): "lru" evicts the least recently used entry, "fifo" the oldest one
+        latlon_quantum (float): the GPS quantization step in degrees, or None for exact keys
+        utm_quantum (float): the UTM quantization step in meters, or None for exact keys
+    """
+    def __init__(self, maxsize: int=4096, eviction: str="lru", latlon_quantum: float=None, utm_quantum: float=None):
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"unknown eviction policy '{eviction}' (must be one of {', '.join(EVICTION_POLICIES)})")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.eviction = eviction
+        self.latlon_quantum = latlon_quantum
+        self.utm_quantum = utm_quantum
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _get(self, key):
+        """
+        Returns the cached value for `key`, or None. Must be called with the lock held.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            if self.eviction == "lru":
+                self._entries.move_to_end(key)
+        return value
+
+    def _put(self, key, value):
+        """
+        Stores `value`, evicting the first entry when full. Must be called with the lock held.
+        """
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+        self._entries[key] = value
+
+    def from_latlon(self, lat: float, lon: float) -> tuple:
+        """
+        Cached `utm.from_latlon`.
+        """
+        if self.latlon_quantum is not None:
+            lat = round(lat / self.latlon_quantum) * self.latlon_quantum
+            lon = round(lon / self.latlon_quantum) * self.latlon_quantum
+        key = ("gps", lat, lon)
+        with self._lock:
+            value = self._get(key)
+        if value is None:
+            # Converting outside of the lock lets other threads use the cache meanwhile.
+            value = hooks.from_latlon("conversion.from_latlon", lat, lon)
+            with self._lock:
+                self._put(key, value)
+        return value
+
+    def to_latlon(self, easting: float, northing: float, zone_number: int, zone_letter: str) -> tuple:
+        """
+        Cached `utm.to_latlon`.
+        """
+        if self.utm_quantum is not None:
+            easting = round(easting / self.utm_quantum) * self.utm_quantum
+            northing = round(northing / self.utm_quantum) * self.utm_quantum
+        key = ("utm", easting, northing, zone_number, zone_letter)
+        with self._lock:
+            value = self._get(key)
+        if value is None:
+            value = hooks.to_latlon("conversion.to_latlon", easting, northing, zone_number, zone_letter)
+            with self._lock:
+                self._put(key, value)
+        return value
+
+    def stats(self) -> dict:
+        """
+        Returns (dict): The hits, misses, evictions, current size, maximum size and hit rate of the cache.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        """
+        Removes every entry and resets the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
@@ -0,0 +1,152 @@
+from math import radians
+
+import numpy as np
+
+from . import hooks
+from .location_array import LocationArray, _normalize_zones
+from .uprm_gps_utils import Attitude, Location, _zone_box
+
+
+def _buffers(out, *arrays) -> tuple:
+    """
+    Returns (tuple): The (easting, northing) output arrays, allocated with the broadcast shape of `arrays` when `out` is None.
+    """
+    if out is None:
+        shape = np.broadcast(*arrays).shape
+        return np.empty(shape), np.empty(shape)
+    return out[0], out[1]
+
+
+def _offsets_to_locations(location: Location, easting: np.ndarray, northing: np.ndarray) -> LocationArray:
+    """
+    Adds the vehicle's UTM coordinates to the easting/northing offsets, in place, and wraps them in a
+    `LocationArray`. Points that land outside of the vehicle's UTM zone are moved into the right one.
+    """
+    easting += location.easting
+    northing += location.northing
+
+    zone_number, zone_letter = location.zone_number, location.zone_letter
+    box = _zone_box(zone_number, zone_letter)
+    if easting.size == 0 or (box is not None and box[0] < easting.min() and easting.max() < box[1]
+                             and box[2] < northing.min() and northing.max() < box[3]):
+        return LocationArray.from_utm(easting, northing, zone_number, zone_letter)
+
+    normalized_easting, normalized_northing, zone_number, zone_letter = _normalize_zones(
+        easting, northing, np.broadcast_to(zone_number, easting.shape), np.broadcast_to(zone_letter, easting.shape))
+    np.copyto(easting, normalized_easting)
+    np.copyto(northing, normalized_northing)
+    return LocationArray.from_utm(easting, northing, zone_number, zone_letter)
+
+
+@hooks.instrumented("transform.detections_to_global_coordinates")
+def detections_to_global_coordinates(location: Location, attitude: Attitude, distances_meters, relative_angles_degrees,
+                                     rel_north: float=0, out=None) -> LocationArray:
+    """
+    Batched version of `relative_angle_to_cardinal_angle` followed by `relative_radial_to_global_coordinates`,
+    for every detection of a sensor frame at once.
+
+    The vehicle's heading is folded into a single angle offset for the whole frame, and the detections are
+    projected with one vectorized sin/cos each. Their GPS coordinates are only computed, in one batch, when
+    first read. Detections that land outside of the vehicle's UTM zone are moved into the right one.
+
+    WARNING:
+        The returned `LocationArray` uses the `out` buffers as its UTM coordinates, so reusing them for the
+        next frame overwrites the previous results. Read or copy what is needed before then.
+
+    Parameters:
+        location (Location): The location of the vehicle.
+        attitude (Attitude): The attitude of the vehicle. Only the yaw is used.
+        distances_meters (np.ndarray): Distance between each object and the vehicle in meters.
+        relative_angles_degrees (np.ndarray): Angle of each object with respect to the vehicle, in degrees.
+        rel_north (float): The relative angle that corresponds to the vehicle's front.
+        out (tuple of np.ndarray): Optional (easting, northing) float arrays of the detections' shape to
+            write the results into, so that no arrays are allocated per frame.
+
+    Returns (LocationArray): The location coordinates of the objects.
+    """
+    easting, northing = _buffers(out, distances_meters, relative_angles_degrees)
+
+    # cardinal angle of each object, in radians, computed in `northing` to avoid a temporary array
+    np.multiply(relative_angles_degrees, radians(1), out=northing)
+    northing += radians(attitude.yaw_deg - rel_north)
+    np.sin(northing, out=easting)
+    np.cos(northing, out=northing)
+
+    easting *= distances_meters
+    northing *= distances_meters
+    return _offsets_to_locations(location, easting, northing)
+
+
+@hooks.instrumented("transform.body_to_global_coordinates")
+def body_to_global_coordinates(location: Location, attitude: Attitude, forward_meters, right_meters, down_meters=0,
+                               out=None) -> LocationArray:
+    """
+    Computes the GPS coordinates of points given in the vehicle's body frame, such as LiDAR returns,
+    taking its full attitude into account. The vertical component of the points is dropped.
+
+    The attitude's rotation matrix is computed once and reused for every point. See `Attitude` for the
+    frame and angle conventions, and `detections_to_global_coordinates` for `out`. The sums need one scratch
+    array, which is allocated per call unless it is passed as a third `out` array.
+
+    Parameters:
+        location (Location): The location of the vehicle.
+        attitude (Attitude): The attitude of the vehicle.
+        forward_meters (np.ndarray): Offset of each point towards the bow.
+        right_meters (np.ndarray): Offset of each point towards starboard.
+        down_meters (np.ndarray): Offset of each point towards the keel.
+        out (tuple of np.ndarray): Optional (easting, northing) or (easting, northing, scratch) arrays of the
+            points' shape, so that no arrays are allocated per frame.
+
+    Returns (LocationArray): The location coordinates of the points.
+    """
+    easting, northing = _buffers(out, forward_meters, right_meters, down_meters)
+    scratch = out[2] if out is not None and len(out) > 2 else np.empty_like(easting)
+    (r11, r12, r13), (r21, r22, r23), _ = attitude.rotation_matrix
+
+    np.multiply(forward_meters, r21, out=easting)
+    easting += np.multiply(right_meters, r22, out=scratch)
+    easting += np.multiply(down_meters, r23, out=scratch)
+    np.multiply(forward_meters, r11, out=northing)
+    northing += np.multiply(right_meters, r12, out=scratch)
+    northing += np.multiply(down_meters, r13, out=scratch)
+    return _offsets_to_locations(location, easting, northing)
+
+
+@hooks.instrumented("transform.detections_to_global_coordinates_3d")
+def detections_to_global_coordinates_3d(location: Location, attitude: Attitude, distances_meters,
+                                        relative_angles_degrees, elevation_angles_degrees=0, rel_north: float=0,
+                                        out=None) -> LocationArray:
+    """
+    Version of `detections_to_global_coordinates` that uses the vehicle's roll and pitch, so that
+    detections stay in place when the vehicle heels or pitches in waves.
+
+    Each detection is a ray from the sensor, measured in the vehicle's body frame: its relative angle sweeps
+    clockwise from `rel_north` like in `relative_angle_to_cardinal_angle`, and its elevation is positive
+    above the vehicle's deck plane. The rays are rotated into the world frame and their horizontal part is
+    projected, as in `body_to_global_coordinates`.
+
+    WARNING:
+        `out` only holds the results: the body-frame components of the rays are intermediate arrays that
+        are still allocated per frame. Use `body_to_global_coordinates` with preallocated components when
+        allocations matter.
+
+    Parameters:
+        location (Location): The location of the vehicle.
+        attitude (Attitude): The attitude of the vehicle.
+        distances_meters (np.ndarray): Distance between each object and the vehicle in meters.
+        relative_angles_degrees (np.ndarray): Angle of each object with respect to the vehicle, in degrees.
+        elevation_angles_degrees (np.ndarray): Angle of each object above the vehicle's deck plane, in degrees.
+        rel_north (float): The relative angle that corresponds to the vehicle's front.
+        out (tuple of np.ndarray): Optional (easting, northing) or (easting, northing, scratch) arrays to write
+            the results into.
+
+    Returns (LocationArray): The location coordinates of the objects.
+    """
+    bearing = np.radians(np.subtract(relative_angles_degrees, rel_north))
+    elevation = np.radians(elevation_angles_degrees)
+    horizontal = np.multiply(distances_meters, np.cos(elevation))
+    return body_to_global_coordinates(location, attitude,
+                                      horizontal * np.cos(bearing),
+                                      horizontal * np.sin(bearing),
+                                      -np.multiply(distances_meters, np.sin(elevation)),
+                                      out=out)
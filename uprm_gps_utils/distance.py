@@ -0,0 +1,169 @@
+import numpy as np
+
+from . import hooks
+from .location_array import _northern
+
+
+EARTH_RADIUS_METERS = 6371000
+
+# WGS84 ellipsoid, which is the one the `utm` package projects from
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_B = WGS84_A * (1 - WGS84_F)
+WGS84_E2 = WGS84_F * (2 - WGS84_F)
+
+UTM_K0 = 0.9996
+
+_VINCENTY_MAX_ITERATIONS = 200
+_VINCENTY_TOLERANCE = 1e-12
+
+
+def _haversine(a, b):
+    """
+    Great circle distance on a sphere of radius `EARTH_RADIUS_METERS`.
+    """
+    lat1, lon1, lat2, lon2 = np.radians(a.lat), np.radians(a.lon), np.radians(b.lat), np.radians(b.lon)
+    h = np.sin((lat2 - lat1) / 2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2)**2
+    return 2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(h))
+
+
+def _equirectangular(a, b):
+    """
+    Flat earth distance using the meridional and prime vertical radii of the WGS84 ellipsoid at the mean latitude.
+    """
+    lat1, lat2 = np.radians(a.lat), np.radians(b.lat)
+    delta_lon = np.radians((np.asarray(b.lon) - a.lon + 180) % 360 - 180)
+    sin_lat = np.sin((lat1 + lat2) / 2)
+    w2 = 1 - WGS84_E2 * sin_lat**2
+    prime_vertical = WGS84_A / np.sqrt(w2)
+    meridional = prime_vertical * (1 - WGS84_E2) / w2
+    cos_lat = np.sqrt(1 - sin_lat**2)
+    return np.hypot(meridional * (lat2 - lat1), prime_vertical * cos_lat * delta_lon)
+
+
+def _utm(a, b):
+    """
+    Straight line distance in the UTM plane, corrected by the projection's scale factor at the midpoint.
+    Pairs in different zones or hemispheres fall back to `_equirectangular`.
+    """
+    delta_easting = np.asarray(b.easting) - a.easting
+    delta_northing = np.asarray(b.northing) - a.northing
+    mid_x = (np.asarray(a.easting) + b.easting) / 2 - 500000
+    scale = UTM_K0 * (1 + mid_x**2 / (2 * (UTM_K0 * EARTH_RADIUS_METERS)**2))
+    planar = np.hypot(delta_easting, delta_northing) / scale
+
+    same_zone = (np.asarray(a.zone_number) == b.zone_number) & (_northern(a.zone_letter) == _northern(b.zone_letter))
+    if np.all(same_zone):
+        return planar
+    return np.where(same_zone, planar, _equirectangular(a, b))
+
+
+def _vincenty(a, b):
+    """
+    Vincenty's inverse formula on the WGS84 ellipsoid. Nearly antipodal pairs, where the iteration
+    does not converge, fall back to `_haversine`.
+    """
+    lat1, lat2 = np.broadcast_arrays(np.radians(a.lat), np.radians(b.lat))
+    big_l = np.radians((np.asarray(b.lon) - a.lon + 180) % 360 - 180)
+    big_l = np.broadcast_to(big_l, lat1.shape)
+
+    u1 = np.arctan((1 - WGS84_F) * np.tan(lat1))
+    u2 = np.arctan((1 - WGS84_F) * np.tan(lat2))
+    sin_u1, cos_u1 = np.sin(u1), np.cos(u1)
+    sin_u2, cos_u2 = np.sin(u2), np.cos(u2)
+
+    lam = big_l
+    for _ in range(_VINCENTY_MAX_ITERATIONS):
+        sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+        sin_sigma = np.hypot(cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+        cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+        sigma = np.arctan2(sin_sigma, cos_sigma)
+        sin_alpha = np.divide(cos_u1 * cos_u2 * sin_lam, sin_sigma,
+                              out=np.zeros_like(sin_sigma), where=sin_sigma != 0)
+        cos2_alpha = 1 - sin_alpha**2
+        # cos(2σm) is 0 on equatorial lines, where cos²α is 0
+        cos_2sigma_m = np.where(cos2_alpha != 0, cos_sigma - np.divide(2 * sin_u1 * sin_u2, cos2_alpha,
+                                                                       out=np.zeros_like(cos2_alpha),
+                                                                       where=cos2_alpha != 0), 0)
+        c = WGS84_F / 16 * cos2_alpha * (4 + WGS84_F * (4 - 3 * cos2_alpha))
+        previous_lam = lam
+        lam = big_l + (1 - c) * WGS84_F * sin_alpha * (
+            sigma + c * sin_sigma * (cos_2sigma_m + c * cos_sigma * (-1 + 2 * cos_2sigma_m**2)))
+        converged = np.abs(lam - previous_lam) < _VINCENTY_TOLERANCE
+        if np.all(converged):
+            break
+
+    u_squared = cos2_alpha * (WGS84_A**2 - WGS84_B**2) / WGS84_B**2
+    big_a = 1 + u_squared / 16384 * (4096 + u_squared * (-768 + u_squared * (320 - 175 * u_squared)))
+    big_b = u_squared / 1024 * (256 + u_squared * (-128 + u_squared * (74 - 47 * u_squared)))
+    delta_sigma = big_b * sin_sigma * (cos_2sigma_m + big_b / 4 * (
+        cos_sigma * (-1 + 2 * cos_2sigma_m**2)
+        - big_b / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma**2) * (-3 + 4 * cos_2sigma_m**2)))
+    distance = WGS84_B * big_a * (sigma - delta_sigma)
+
+    if np.all(converged):
+        return distance
+    return np.where(converged, distance, _haversine(a, b))
+
+
+METHODS = {
+    "haversine": _haversine,
+    "equirectangular": _equirectangular,
+    "utm": _utm,
+    "vincenty": _vincenty,
+}
+
+
+class _Column:
+    """
+    Exposes the coordinates of a `Location` or `LocationArray` as column vectors, so that
+    they broadcast against a row of other points into a matrix.
+    Coordinates are only read, and therefore only converted, when a method uses them.
+    """
+    def __init__(self, locations):
+        self._locations = locations
+
+    def __getattr__(self, name):
+        return np.atleast_1d(getattr(self._locations, name))[:, np.newaxis]
+
+
+def _get_method(method: str):
+    try:
+        return METHODS[method]
+    except KeyError:
+        raise ValueError(f"unknown distance method '{method}' (must be one of {', '.join(METHODS)})") from None
+
+
+@hooks.instrumented("distance.distances_between_locations")
+def distances_between_locations(locationsA, locationsB, method: str="haversine") -> np.ndarray:
+    """
+    Element-wise version of `distance_between_locations`, with a selectable earth model.
+
+    Either argument may be a single `Location`, in which case it is compared against every element of the other.
+
+    Methods:
+        "utm": straight line in the UTM plane, corrected by the scale factor. Cheapest when the UTM
+            coordinates are already known; for short ranges within one zone.
+        "equirectangular": flat earth on the local WGS84 radii. For short ranges.
+        "haversine": great circle on a 6371 km sphere, which is off by up to ~0.5% from the ellipsoid.
+        "vincenty": geodesic on the WGS84 ellipsoid, accurate to well under a millimeter.
+
+    Parameters:
+        locationsA (LocationArray or Location): The first points.
+        locationsB (LocationArray or Location): The second points.
+        method (str): One of "utm", "equirectangular", "haversine" or "vincenty".
+
+    Returns (np.ndarray): The distances in meters.
+    """
+    return _get_method(method)(locationsA, locationsB)
+
+
+@hooks.instrumented("distance.distance_matrix")
+def distance_matrix(locationsA, locationsB, method: str="haversine") -> np.ndarray:
+    """
+    Pairwise version of `distance_between_locations`. See `distances_between_locations` for the methods.
+    Either argument may be a single `Location`, which counts as a row or column of length 1.
+
+    Returns (np.ndarray): A (len(locationsA), len(locationsB)) matrix of distances in meters.
+    """
+    return _get_method(method)(_Column(locationsA), locationsB)
@@ -0,0 +1,466 @@
+from math import ceil, sqrt
+
+import numpy as np
+
+from . import hooks
+from .location_array import LocationArray, _northern
+from .uprm_gps_utils import Location
+
+
+# Largest (points x edges) matrix computed at once, to bound the memory of batch queries.
+_CHUNK_ELEMENTS = 1 << 22
+# Most cells per axis of the grid used for distance queries, and how far it extends around the
+# bounding box, as a fraction of the box's largest side.
+_MAX_GRID_SIZE = 128
+_GRID_MARGIN = 0.5
+# Most tiles per axis that the points of a `Geofence` query are split into, and the fewest points per tile.
+_MAX_TILES = 64
+_MIN_TILE_POINTS = 256
+
+
+def _project(locations, zone_number: int, zone_letter: str) -> tuple:
+    """
+    Returns (tuple): The easting and northing arrays of a `Location` or `LocationArray` in the given zone.
+    UTM coordinates that are already known in the same zone and hemisphere are used as is.
+    """
+    if locations._easting is not None \
+            and np.all(locations._zone_number == zone_number) \
+            and np.all(_northern(np.atleast_1d(locations._zone_letter)) == _northern(np.atleast_1d(zone_letter))):
+        return np.atleast_1d(np.asarray(locations._easting, dtype=float)), \
+            np.atleast_1d(np.asarray(locations._northing, dtype=float))
+    easting, northing, _, _ = hooks.from_latlon("conversion.array_from_latlon",
+                                                np.atleast_1d(np.asarray(locations.lat, dtype=float)),
+                                                np.atleast_1d(np.asarray(locations.lon, dtype=float)),
+                                                force_zone_number=zone_number, force_zone_letter=zone_letter)
+    return easting, northing
+
+
+def _project_location(location: Location, zone_number: int, zone_letter: str) -> tuple:
+    """
+    Returns (tuple): The easting and northing floats of a single `Location` in the given zone.
+    """
+    if location._easting is not None and location._zone_number == zone_number \
+            and (location._zone_letter.upper() >= "N") == (zone_letter.upper() >= "N"):
+        return location._easting, location._northing
+    easting, northing, _, _ = hooks.from_latlon("conversion.from_latlon", location.lat, location.lon,
+                                                force_zone_number=zone_number, force_zone_letter=zone_letter)
+    return easting, northing
+
+
+def _csr(groups: np.ndarray, members: np.ndarray, count: int) -> tuple:
+    """
+    Sorts (group, member) pairs into compressed rows.
+
+    Returns (tuple): The (offsets, members) arrays; the members of group `g` are `members[offsets[g]:offsets[g + 1]]`.
+    """
+    order = np.argsort(groups, kind="stable")
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(groups, minlength=count), out=offsets[1:])
+    return offsets, members[order]
+
+
+def _groups(keys: np.ndarray):
+    """
+    Yields the (key, positions) of each distinct value of `keys`, in increasing order.
+    """
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)]
+    for start, end in zip(starts, ends):
+        yield sorted_keys[start], order[start:end]
+
+
+def _chunks(count: int, width: int):
+    """
+    Yields slices over `count` rows, sized so that a (rows x width) matrix stays under `_CHUNK_ELEMENTS`.
+    """
+    step = max(1, _CHUNK_ELEMENTS // max(width, 1))
+    for start in range(0, count, step):
+        yield slice(start, min(start + step, count))
+
+
+class Polygon:
+    """
+    A closed polygon, such as a course boundary or a no-go zone, for point-in-polygon and distance-to-boundary
+    queries on `Location`s and `LocationArray`s.
+
+    Vertices are projected once into a single UTM zone, the first vertex's by default, and the edges are
+    precomputed there. Edges are sorted into horizontal bands, so a point-in-polygon test only looks at the
+    few edges of the point's band. Distance queries use a grid over the bounding box that lists, for each
+    cell, the only edges that can be the closest to a point of that cell. The grid is built on the first
+    distance query.
+
+    Attributes:
+        zone_number (int): the zone number the polygon is computed in
+        zone_letter (str): the zone letter the polygon is computed in
+        bounding_box (tuple): the (min_easting, min_northing, max_easting, max_northing) of the polygon
+    """
+    def __init__(self, vertices, zone_number: int=None, zone_letter: str=None):
+        """
+        Parameters:
+            vertices (iterable of Location, or LocationArray): The vertices, in order. The polygon is closed
+                automatically, so the first vertex should not be repeated at the end.
+            zone_number (int): Zone number to compute the polygon in. Defaults to the first vertex's.
+            zone_letter (str): Zone letter to compute the polygon in. Defaults to the first vertex's.
+        """
+        if not isinstance(vertices, LocationArray):
+            vertices = list(vertices)
+        if len(vertices) < 3:
+            raise ValueError("a polygon needs at least 3 vertices")
+        if zone_number is None:
+            zone_number, zone_letter = int(vertices[0].zone_number), str(vertices[0].zone_letter)
+        self.zone_number = zone_number
+        self.zone_letter = zone_letter
+
+        if isinstance(vertices, LocationArray):
+            x0, y0 = _project(vertices, zone_number, zone_letter)
+        else:
+            x0, y0 = np.concatenate([_project(vertex, zone_number, zone_letter) for vertex in vertices], axis=1)
+        x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+        self._x0, self._y0 = x0, y0
+        self._dx, self._dy = x1 - x0, y1 - y0
+        self._length2 = self._dx**2 + self._dy**2
+        self._x_per_y = np.divide(self._dx, self._dy, out=np.zeros_like(self._dx), where=self._dy != 0)
+        self.bounding_box = (float(x0.min()), float(y0.min()), float(x0.max()), float(y0.max()))
+
+        # horizontal bands, each listing the edges whose vertical extent overlaps it
+        min_y, max_y = self.bounding_box[1], self.bounding_box[3]
+        self._band_count = len(x0)
+        self._band_height = max((max_y - min_y) / self._band_count, 1e-9)
+        first_band = self._band_of(np.minimum(y0, y1))
+        last_band = self._band_of(np.maximum(y0, y1))
+        spans = last_band - first_band + 1
+        edges = np.repeat(np.arange(len(x0)), spans)
+        bands = np.repeat(first_band, spans) + np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
+        self._band_offsets, self._band_edges = _csr(bands, edges, self._band_count)
+
+        self._grid = None
+
+    def __len__(self) -> int:
+        return len(self._x0)
+
+    def _band_of(self, northing: np.ndarray) -> np.ndarray:
+        bands = ((northing - self.bounding_box[1]) / self._band_height).astype(np.int64)
+        return np.clip(bands, 0, self._band_count - 1)
+
+    def _in_bounding_box(self, easting: np.ndarray, northing: np.ndarray) -> np.ndarray:
+        min_x, min_y, max_x, max_y = self.bounding_box
+        return (min_x <= easting) & (easting <= max_x) & (min_y <= northing) & (northing <= max_y)
+
+    def _contains_utm(self, easting: np.ndarray, northing: np.ndarray) -> np.ndarray:
+        """
+        Even-odd rule point-in-polygon test of UTM coordinates in the polygon's zone.
+        """
+        inside = np.zeros(easting.shape, dtype=bool)
+        candidates = np.flatnonzero(self._in_bounding_box(easting, northing))
+        if not len(candidates):
+            return inside
+        for band, in_band in _groups(self._band_of(northing[candidates])):
+            edges = self._band_edges[self._band_offsets[band]:self._band_offsets[band + 1]]
+            y0, x0, x_per_y = self._y0[edges], self._x0[edges], self._x_per_y[edges]
+            y1 = y0 + self._dy[edges]
+            in_band = candidates[in_band]
+            for rows in _chunks(len(in_band), len(edges)):
+                points = in_band[rows]
+                x, y = easting[points, np.newaxis], northing[points, np.newaxis]
+                crossings = ((y0 > y) != (y1 > y)) & (x < x0 + (y - y0) * x_per_y)
+                inside[points] = np.count_nonzero(crossings, axis=1) % 2 == 1
+        return inside
+
+    def _contains_point(self, easting: float, northing: float) -> bool:
+        """
+        `_contains_utm` for a single point, without the grouping overhead.
+        """
+        min_x, min_y, max_x, max_y = self.bounding_box
+        if not (min_x <= easting <= max_x and min_y <= northing <= max_y):
+            return False
+        band = min(int((northing - min_y) / self._band_height), self._band_count - 1)
+        edges = self._band_edges[self._band_offsets[band]:self._band_offsets[band + 1]]
+        y0 = self._y0[edges]
+        crossings = ((y0 > northing) != (y0 + self._dy[edges] > northing)) \
+            & (easting < self._x0[edges] + (northing - y0) * self._x_per_y[edges])
+        return np.count_nonzero(crossings) % 2 == 1
+
+    def _edge_distances(self, easting: np.ndarray, northing: np.ndarray, edges: np.ndarray) -> np.ndarray:
+        """
+        Returns (np.ndarray): The distance of each point to the closest of the given edges.
+        """
+        x0, y0, dx, dy = self._x0[edges], self._y0[edges], self._dx[edges], self._dy[edges]
+        length2 = self._length2[edges]
+        distances = np.empty(easting.shape)
+        for rows in _chunks(len(easting), len(edges)):
+            x = easting[rows, np.newaxis] - x0
+            y = northing[rows, np.newaxis] - y0
+            t = np.clip(np.divide(x * dx + y * dy, length2, out=np.zeros_like(x), where=length2 != 0), 0, 1)
+            distances[rows] = np.sqrt(np.min((x - t * dx)**2 + (y - t * dy)**2, axis=1))
+        return distances
+
+    def _build_grid(self):
+        """
+        Lists, for each cell of a grid around the bounding box, the edges that can be the closest one to a point
+        of the cell: any edge further from the cell's center than the closest edge plus the cell's diagonal
+        can never be.
+
+        The grid is refined from a single cell, splitting every cell in four at each step. A cell only has to
+        test the candidates of its parent, which already include every edge that can be the closest one.
+        """
+        min_x, min_y, max_x, max_y = self.bounding_box
+        margin = _GRID_MARGIN * max(max_x - min_x, max_y - min_y)
+        min_x, min_y, max_x, max_y = min_x - margin, min_y - margin, max_x + margin, max_y + margin
+        target_size = min(_MAX_GRID_SIZE, 2 * sqrt(len(self)))
+
+        # (cell, edge) candidate pairs
+        cells = np.zeros(len(self), dtype=np.int64)
+        edges = np.arange(len(self))
+        size = 1
+        while size < target_size:
+            parent_row, parent_column = cells // size, cells % size
+            size *= 2
+            cells = np.concatenate([(2 * parent_row + row) * size + 2 * parent_column + column
+                                    for row in (0, 1) for column in (0, 1)])
+            edges = np.tile(edges, 4)
+
+            cell_width = max((max_x - min_x) / size, 1e-9)
+            cell_height = max((max_y - min_y) / size, 1e-9)
+            x = min_x + (cells % size + 0.5) * cell_width - self._x0[edges]
+            y = min_y + (cells // size + 0.5) * cell_height - self._y0[edges]
+            dx, dy, length2 = self._dx[edges], self._dy[edges], self._length2[edges]
+            t = np.clip(np.divide(x * dx + y * dy, length2, out=np.zeros_like(x), where=length2 != 0), 0, 1)
+            distances = np.hypot(x - t * dx, y - t * dy)
+
+            closest = np.full(size * size, np.inf)
+            np.minimum.at(closest, cells, distances)
+            keep = distances <= closest[cells] + sqrt(cell_width**2 + cell_height**2) * (1 + 1e-9)
+            cells, edges = cells[keep], edges[keep]
+
+        offsets, edges = _csr(cells, edges, size * size)
+        self._grid = (min_x, min_y, max_x, max_y, size, (max_x - min_x) / size, (max_y - min_y) / size, offsets, edges)
+
+    def _distance_utm(self, easting: np.ndarray, northing: np.ndarray) -> np.ndarray:
+        """
+        Distance of UTM coordinates in the polygon's zone to the closest edge.
+        Points outside of the grid are compared against every edge.
+        """
+        if self._grid is None:
+            self._build_grid()
+        min_x, min_y, max_x, max_y, size, cell_width, cell_height, offsets, grid_edges = self._grid
+        distances = np.empty(easting.shape)
+
+        in_grid = (min_x <= easting) & (easting <= max_x) & (min_y <= northing) & (northing <= max_y)
+        outside = np.flatnonzero(~in_grid)
+        if len(outside):
+            distances[outside] = self._edge_distances(easting[outside], northing[outside], np.arange(len(self)))
+
+        points = np.flatnonzero(in_grid)
+        if not len(points):
+            return distances
+        column = np.minimum(((easting[points] - min_x) / cell_width).astype(np.int64), size - 1)
+        row = np.minimum(((northing[points] - min_y) / cell_height).astype(np.int64), size - 1)
+        for cell, in_cell in _groups(row * size + column):
+            in_cell = points[in_cell]
+            distances[in_cell] = self._edge_distances(easting[in_cell], northing[in_cell],
+                                                      grid_edges[offsets[cell]:offsets[cell + 1]])
+        return distances
+
+    def _distance_point(self, easting: float, northing: float) -> float:
+        """
+        `_distance_utm` for a single point, without the grouping overhead.
+        """
+        if self._grid is None:
+            self._build_grid()
+        min_x, min_y, max_x, max_y, size, cell_width, cell_height, offsets, grid_edges = self._grid
+        if min_x <= easting <= max_x and min_y <= northing <= max_y:
+            cell = min(int((northing - min_y) / cell_height), size - 1) * size \
+                + min(int((easting - min_x) / cell_width), size - 1)
+            edges = grid_edges[offsets[cell]:offsets[cell + 1]]
+        else:
+            edges = np.arange(len(self))
+        return float(self._edge_distances(np.array([easting]), np.array([northing]), edges)[0])
+
+    def contains(self, locations):
+        """
+        Checks whether locations are inside the polygon.
+
+        Parameters:
+            locations (Location or LocationArray): The locations to check.
+
+        Returns (bool or np.ndarray): True for the locations inside the polygon.
+        """
+        if isinstance(locations, Location):
+            return self._contains_point(*_project_location(locations, self.zone_number, self.zone_letter))
+        return self._contains_utm(*_project(locations, self.zone_number, self.zone_letter))
+
+    def distance_to_boundary(self, locations):
+        """
+        Computes the distance from locations to the closest edge of the polygon, whether they are inside or not.
+
+        Parameters:
+            locations (Location or LocationArray): The locations to check.
+
+        Returns (float or np.ndarray): The distances in meters.
+        """
+        if isinstance(locations, Location):
+            return self._distance_point(*_project_location(locations, self.zone_number, self.zone_letter))
+        return self._distance_utm(*_project(locations, self.zone_number, self.zone_letter))
+
+
+class Geofence:
+    """
+    A set of polygons, such as no-go zones, queried together.
+
+    The bounding boxes of every polygon are kept in arrays. Batch queries split the points into tiles, so
+    each tile only runs the exact tests on the few polygons near it. Every polygon must be computed in the same UTM zone; pass
+    `zone_number` and `zone_letter` to `Polygon` to force it.
+    """
+    def __init__(self, polygons=()):
+        """
+        Parameters:
+            polygons (iterable of Polygon): The initial polygons.
+        """
+        self.polygons = []
+        self._boxes = np.empty((0, 4))
+        self._first_vertices = np.empty((0, 2))
+        for polygon in polygons:
+            self.add(polygon)
+
+    def add(self, polygon: Polygon):
+        """
+        Adds a polygon. Raises a `ValueError` if it is not computed in the same zone as the other polygons.
+        """
+        if self.polygons and (polygon.zone_number, polygon.zone_letter) != (self.zone_number, self.zone_letter):
+            raise ValueError(f"polygon is in zone {polygon.zone_number}{polygon.zone_letter}, "
+                             f"expected {self.zone_number}{self.zone_letter}")
+        self.polygons.append(polygon)
+        self._boxes = np.vstack((self._boxes, polygon.bounding_box))
+        self._first_vertices = np.vstack((self._first_vertices, (polygon._x0[0], polygon._y0[0])))
+
+    def __len__(self) -> int:
+        return len(self.polygons)
+
+    def __iter__(self):
+        return iter(self.polygons)
+
+    @property
+    def zone_number(self) -> int:
+        return self.polygons[0].zone_number
+
+    @property
+    def zone_letter(self) -> str:
+        return self.polygons[0].zone_letter
+
+    def _box_distances(self, easting: float, northing: float) -> np.ndarray:
+        min_x, min_y, max_x, max_y = self._boxes.T
+        return np.hypot(np.maximum(np.maximum(min_x - easting, easting - max_x), 0),
+                        np.maximum(np.maximum(min_y - northing, northing - max_y), 0))
+
+    def containing(self, location: Location) -> list:
+        """
+        Returns (list): The polygons that contain the given location.
+        """
+        if not self.polygons:
+            return []
+        easting, northing = _project_location(location, self.zone_number, self.zone_letter)
+        candidates = np.flatnonzero(self._box_distances(easting, northing) == 0)
+        return [self.polygons[i] for i in candidates if self.polygons[i]._contains_point(easting, northing)]
+
+    def _distance_point(self, location: Location) -> float:
+        """
+        `distance_to_boundary` of a single location, checking the polygons from the closest bounding box.
+        """
+        distance = float("inf")
+        if not self.polygons:
+            return distance
+        easting, northing = _project_location(location, self.zone_number, self.zone_letter)
+        box_distances = self._box_distances(easting, northing)
+        for i in np.argsort(box_distances):
+            if box_distances[i] >= distance:
+                break
+            distance = min(distance, self.polygons[i]._distance_point(easting, northing))
+        return distance
+
+    def _tiles(self, easting: np.ndarray, northing: np.ndarray):
+        """
+        Splits the points into a grid of tiles over their extent, with about as many tiles as polygons.
+
+        Yields (tuple): The positions of the points of each tile, and the tile's (min_easting, min_northing,
+        max_easting, max_northing).
+        """
+        min_x, min_y, max_x, max_y = easting.min(), northing.min(), easting.max(), northing.max()
+        size = int(min(ceil(sqrt(len(self.polygons))), _MAX_TILES, ceil(sqrt(len(easting) / _MIN_TILE_POINTS))))
+        tile_width = max((max_x - min_x) / size, 1e-9)
+        tile_height = max((max_y - min_y) / size, 1e-9)
+        column = np.minimum(((easting - min_x) / tile_width).astype(np.int64), size - 1)
+        row = np.minimum(((northing - min_y) / tile_height).astype(np.int64), size - 1)
+        for tile, points in _groups(row * size + column):
+            x, y = min_x + tile % size * tile_width, min_y + tile // size * tile_height
+            yield points, (x, y, x + tile_width, y + tile_height)
+
+    def contains(self, locations):
+        """
+        Checks whether locations are inside any of the polygons.
+
+        Parameters:
+            locations (Location or LocationArray): The locations to check.
+
+        Returns (bool or np.ndarray): True for the locations inside at least one polygon.
+        """
+        if isinstance(locations, Location):
+            return bool(self.containing(locations))
+        inside = np.zeros(len(locations), dtype=bool)
+        if not self.polygons or not len(inside):
+            return inside
+        easting, northing = _project(locations, self.zone_number, self.zone_letter)
+
+        min_x, min_y, max_x, max_y = self._boxes.T
+        for points, (tile_min_x, tile_min_y, tile_max_x, tile_max_y) in self._tiles(easting, northing):
+            overlapping = np.flatnonzero((min_x <= tile_max_x) & (tile_min_x <= max_x)
+                                         & (min_y <= tile_max_y) & (tile_min_y <= max_y))
+            for i in overlapping:
+                polygon = self.polygons[i]
+                candidates = points[~inside[points] & polygon._in_bounding_box(easting[points], northing[points])]
+                if len(candidates):
+                    inside[candidates] = polygon._contains_utm(easting[candidates], northing[candidates])
+        return inside
+
+    def distance_to_boundary(self, locations):
+        """
+        Computes the distance from locations to the closest edge of any polygon.
+
+        The points are split into tiles. Every vertex lies on a boundary, so the distance from the furthest
+        corner of a tile to a polygon's first vertex bounds the distance of the whole tile; only the polygons
+        whose bounding box is closer to the tile than the smallest of these bounds are checked, closest first.
+        Within a tile, polygons whose bounding box is further from a point than the closest edge found so far
+        are skipped for that point.
+
+        Parameters:
+            locations (Location or LocationArray): The locations to check.
+
+        Returns (float or np.ndarray): The distances in meters, infinite when there are no polygons.
+        """
+        if isinstance(locations, Location):
+            return self._distance_point(locations)
+        distances = np.full(len(locations), np.inf)
+        if not self.polygons or not len(distances):
+            return distances
+        easting, northing = _project(locations, self.zone_number, self.zone_letter)
+
+        min_x, min_y, max_x, max_y = self._boxes.T
+        first_x, first_y = self._first_vertices.T
+        for points, (tile_min_x, tile_min_y, tile_max_x, tile_max_y) in self._tiles(easting, northing):
+            upper_bound = np.min(np.hypot(np.maximum(np.abs(first_x - tile_min_x), np.abs(first_x - tile_max_x)),
+                                          np.maximum(np.abs(first_y - tile_min_y), np.abs(first_y - tile_max_y))))
+            lower_bounds = np.hypot(np.maximum(np.maximum(min_x - tile_max_x, tile_min_x - max_x), 0),
+                                    np.maximum(np.maximum(min_y - tile_max_y, tile_min_y - max_y), 0))
+            candidates = np.flatnonzero(lower_bounds <= upper_bound)
+            x, y = easting[points], northing[points]
+            tile_distances = distances[points]
+            for i in candidates[np.argsort(lower_bounds[candidates])]:
+                box_distances = np.hypot(np.maximum(np.maximum(min_x[i] - x, x - max_x[i]), 0),
+                                         np.maximum(np.maximum(min_y[i] - y, y - max_y[i]), 0))
+                closer = np.flatnonzero(box_distances < tile_distances)
+                if len(closer):
+                    tile_distances[closer] = np.minimum(tile_distances[closer],
+                                                        self.polygons[i]._distance_utm(x[closer], y[closer]))
+            distances[points] = tile_distances
+        return distances
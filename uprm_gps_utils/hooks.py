@@ -0,0 +1,89 @@
+"""
+Points through which the library's operations are timed while instrumentation is enabled.
+
+Every UTM projection of the package goes through `from_latlon` and `to_latlon`, and the other instrumented
+operations are decorated with `instrumented`. `enable_instrumentation` sets `operations`; while it is None,
+each of them only costs a check of that global.
+"""
+from functools import wraps
+from time import perf_counter
+
+from .lazy_module import LazyModule
+
+
+# imported on first use, since utm pulls in NumPy
+utm = LazyModule("utm", globals())
+
+# every instrumented operation
+OPERATIONS = (
+    "conversion.from_latlon",
+    "conversion.to_latlon",
+    "conversion.array_from_latlon",
+    "conversion.array_to_latlon",
+    "conversion.array_to_zone",
+    "conversion.local_frame_from_gps",
+    "conversion.local_frame_to_gps",
+    "transform.translate",
+    "transform.rotate",
+    "transform.relative_radial_to_global_coordinates",
+    "transform.array_translate",
+    "transform.array_rotate",
+    "transform.detections_to_global_coordinates",
+    "transform.detections_to_global_coordinates_3d",
+    "transform.body_to_global_coordinates",
+    "distance.distance_between_locations",
+    "distance.distances_between_locations",
+    "distance.distance_matrix",
+    "angle.normalize_angle",
+    "angle.relative_angle_to_cardinal_angle",
+)
+
+# The `OperationStats` being recorded, by operation name, or None while instrumentation is disabled.
+operations = None
+
+
+def _call(operation: str, function, args: tuple, kwargs: dict):
+    """
+    Calls `function`, recording its latency under `operation` if that operation is being recorded.
+    """
+    recording = operations
+    stats = recording.get(operation) if recording is not None else None
+    if stats is None:
+        return function(*args, **kwargs)
+    start = perf_counter()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        stats.record(perf_counter() - start)
+
+
+def from_latlon(operation: str, *args, **kwargs):
+    """
+    `utm.from_latlon`, recorded under `operation`.
+    """
+    if operations is None:
+        return utm.from_latlon(*args, **kwargs)
+    return _call(operation, utm.from_latlon, args, kwargs)
+
+
+def to_latlon(operation: str, *args, **kwargs):
+    """
+    `utm.to_latlon`, recorded under `operation`.
+    """
+    if operations is None:
+        return utm.to_latlon(*args, **kwargs)
+    return _call(operation, utm.to_latlon, args, kwargs)
+
+
+def instrumented(operation: str):
+    """
+    Decorator recording every call of a function or method under `operation`.
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if operations is None:
+                return function(*args, **kwargs)
+            return _call(operation, function, args, kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,174 @@
+import fnmatch
+import json
+import threading
+from time import perf_counter
+
+from . import hooks
+
+
+PERCENTILES = (50, 90, 99)
+
+
+class OperationStats:
+    """
+    Call count and latencies of one operation. Totals cover every call; percentiles are computed over the
+    most recent `sample_size` calls, kept in a ring buffer so memory stays bounded.
+    """
+    def __init__(self, sample_size: int):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.min_seconds = float("inf")
+        self.max_seconds = 0.0
+        self._samples = [0.0] * sample_size
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples[self.count % len(self._samples)] = seconds
+            self.count += 1
+            self.total_seconds += seconds
+            if seconds < self.min_seconds:
+                self.min_seconds = seconds
+            if seconds > self.max_seconds:
+                self.max_seconds = seconds
+
+    def stats(self) -> dict:
+        """
+        Returns (dict): The count, the total, mean, min and max latencies, and the latency percentiles, in seconds.
+        """
+        with self._lock:
+            samples = sorted(self._samples[:min(self.count, len(self._samples))])
+            result = {
+                "count": self.count,
+                "total_seconds": self.total_seconds,
+                "mean_seconds": self.total_seconds / self.count if self.count else 0.0,
+                "min_seconds": self.min_seconds if self.count else 0.0,
+                "max_seconds": self.max_seconds,
+            }
+        for percentile in PERCENTILES:
+            # nearest-rank percentile
+            rank = max(0, -(-percentile * len(samples) // 100) - 1)
+            result[f"p{percentile}_seconds"] = samples[rank] if samples else 0.0
+        return result
+
+
+def _hit_rate(hits: int, misses: int) -> dict:
+    lookups = hits + misses
+    return {"hits": hits, "misses": misses, "hit_rate": hits / lookups if lookups else 0.0}
+
+
+class Instrumentation:
+    """
+    Per-operation call counts and latencies of the library, collected while instrumentation is enabled.
+    See `enable_instrumentation`.
+
+    Attributes:
+        operations (dict): the `OperationStats` of each instrumented operation
+    """
+    def __init__(self, operations: dict, start_seconds: float, zone_box_info, conversion_cache, conversion_cache_stats):
+        """
+        WARNING: Do not use the constructor externally. Use `enable_instrumentation`.
+        """
+        self.operations = operations
+        self._start_seconds = start_seconds
+        self._zone_box_info = zone_box_info
+        # the conversion cache active when instrumentation was enabled, if any, and its statistics then
+        self._conversion_cache = conversion_cache
+        self._conversion_cache_stats = conversion_cache_stats
+
+    def stats(self) -> dict:
+        """
+        Returns (dict): The statistics of every instrumented operation, the hit rates of the library's caches
+        since instrumentation was enabled, and the number of seconds elapsed since then. The conversion cache's
+        hits, misses and evictions are counted from when instrumentation was enabled, or from when the cache
+        was, if later; its size is the current one. Only built-in types are used, so the result can be
+        serialized as is.
+        """
+        from .uprm_gps_utils import _zone_box, get_conversion_cache
+
+        zone_box_info = _zone_box.cache_info()
+        conversion_cache = get_conversion_cache()
+        conversion_cache_stats = conversion_cache.stats() if conversion_cache is not None else None
+        if conversion_cache is not None and conversion_cache is self._conversion_cache:
+            before = self._conversion_cache_stats
+            conversion_cache_stats.update(_hit_rate(conversion_cache_stats["hits"] - before["hits"],
+                                                    conversion_cache_stats["misses"] - before["misses"]),
+                                          evictions=conversion_cache_stats["evictions"] - before["evictions"])
+        return {
+            "elapsed_seconds": perf_counter() - self._start_seconds,
+            "operations": {name: operation.stats() for name, operation in self.operations.items()},
+            "caches": {
+                "zone_box": _hit_rate(zone_box_info.hits - self._zone_box_info.hits,
+                                      zone_box_info.misses - self._zone_box_info.misses),
+                "conversion_cache": conversion_cache_stats,
+            },
+        }
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Returns (str): `stats()` as JSON. Keyword arguments are passed to `json.dumps`.
+        """
+        return json.dumps(self.stats(), **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if get_instrumentation() is self:
+            disable_instrumentation()
+
+
+# The active instrumentation.
+_instrumentation = None
+
+
+def enable_instrumentation(operations: str="*", sample_size: int=10000) -> Instrumentation:
+    """
+    Starts recording the call count and latency of the library's conversions, transforms, distances and angle
+    functions, under names such as "conversion.from_latlon" or "distance.distance_matrix". Replaces any
+    previous instrumentation.
+
+    Every UTM projection of the package, including the reprojections of points that leave their zone, is
+    counted as a conversion, named after the kind of call site: "conversion.from_latlon" for single points,
+    "conversion.array_from_latlon" for batches, which are projected once per zone. Projections served by the
+    conversion cache are not counted. Latencies include the nested instrumented operations, e.g. the
+    conversion done by the first `easting` read inside `rotate`.
+
+    The operations check whether instrumentation is enabled on each call, so they are recorded however they
+    were imported, and only cost that check while it is disabled.
+
+    Parameters:
+        operations (str): Glob pattern of the operations to instrument, e.g. "conversion.*".
+        sample_size (int): The number of recent calls per operation kept for the percentiles.
+
+    Returns (Instrumentation): The new instrumentation, which exposes the statistics through `stats()` and `to_json()`.
+    """
+    global _instrumentation
+    if sample_size <= 0:
+        raise ValueError("sample_size must be positive")
+    disable_instrumentation()
+
+    from .uprm_gps_utils import _zone_box, get_conversion_cache
+
+    stats = {name: OperationStats(sample_size) for name in fnmatch.filter(hooks.OPERATIONS, operations)}
+    conversion_cache = get_conversion_cache()
+    _instrumentation = Instrumentation(stats, perf_counter(), _zone_box.cache_info(), conversion_cache,
+                                       conversion_cache.stats() if conversion_cache is not None else None)
+    hooks.operations = stats
+    return _instrumentation
+
+
+def disable_instrumentation():
+    """
+    Stops recording. The last instrumentation keeps its statistics.
+    """
+    global _instrumentation
+    hooks.operations = None
+    _instrumentation = None
+
+
+def get_instrumentation() -> Instrumentation:
+    """
+    Returns (Instrumentation): The active instrumentation, or None when disabled.
+    """
+    return _instrumentation
@@ -0,0 +1,33 @@
+from importlib import import_module
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported when one of its attributes is first read, so that importing
+    the package does not pay for heavy dependencies such as `utm`, which pulls in NumPy.
+
+    On first use it imports the module and replaces itself, in the namespace it was bound in, with the real
+    module. Later reads are then plain global lookups, with no overhead.
+
+    Usage, at the top of a module:
+        utm = LazyModule("utm", globals())
+    """
+    def __init__(self, name: str, namespace: dict, alias: str=None):
+        """
+        Parameters:
+            name (str): The name of the module to import.
+            namespace (dict): The `globals()` of the module that uses it.
+            alias (str): The global name it is bound to. Defaults to `name`.
+        """
+        self._name = name
+        self._namespace = namespace
+        self._alias = alias or name
+
+    def __getattr__(self, attribute: str):
+        module = import_module(self._name)
+        if self._namespace.get(self._alias) is self:
+            self._namespace[self._alias] = module
+        return getattr(module, attribute)
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self._name}'>"
@@ -0,0 +1,211 @@
+from math import cos, radians, sin
+
+import numpy as np
+
+from . import hooks
+from .uprm_gps_utils import Location
+
+
+# Finite difference steps used to build the local model of the projection.
+_STEP_DEGREES = 1e-3
+_STEP_METERS = 100
+
+
+def _wrap_longitude(delta_lon):
+    """
+    Wraps a longitude difference to [-180º, 180º). Works on floats and arrays.
+    """
+    return (delta_lon + 180) % 360 - 180
+
+
+def _quadratic_coefficients(func, step: float):
+    """
+    Second order Taylor coefficients of `func(du, dv) -> (a, b)` around (0, 0), using central differences.
+
+    Returns ((a_0, a_u, a_v, a_uu, a_uv, a_vv), (b_0, b_u, ...)), already divided by the
+    Taylor factorials so that a ≈ a_0 + a_u*du + a_v*dv + a_uu*du² + a_uv*du*dv + a_vv*dv².
+    """
+    h = step
+    center = func(0, 0)
+    u_plus, u_minus = func(h, 0), func(-h, 0)
+    v_plus, v_minus = func(0, h), func(0, -h)
+    pp, pm, mp, mm = func(h, h), func(h, -h), func(-h, h), func(-h, -h)
+
+    coefficients = []
+    for i in range(2):
+        coefficients.append((
+            center[i],
+            (u_plus[i] - u_minus[i]) / (2 * h),
+            (v_plus[i] - v_minus[i]) / (2 * h),
+            (u_plus[i] - 2 * center[i] + u_minus[i]) / (2 * h * h),
+            (pp[i] - pm[i] - mp[i] + mm[i]) / (4 * h * h),
+            (v_plus[i] - 2 * center[i] + v_minus[i]) / (2 * h * h),
+        ))
+    return tuple(coefficients)
+
+
+def _evaluate(coefficients, du, dv):
+    """
+    Evaluates a quadratic built by `_quadratic_coefficients`. Works on floats and arrays.
+    """
+    c_0, c_u, c_v, c_uu, c_uv, c_vv = coefficients
+    return c_0 + du * (c_u + c_uu * du + c_uv * dv) + dv * (c_v + c_vv * dv)
+
+
+class LocalFrame:
+    """
+    A local metric frame around a mission origin.
+
+    Local coordinates are the UTM easting/northing offsets, in meters, from the origin, always expressed
+    in the origin's UTM zone. Within that zone, `translate`, `rotate` and `relative_radial_to_global_coordinates`
+    give the same results as their `Location` counterparts.
+
+    WARNING:
+        Unlike `Location`, results that leave the origin's zone are not moved into their actual zone: they
+        stay expressed in the origin's zone, like the points of `LocationArray.to_zone`, so the whole mission
+        is computed in a single plane. Their GPS coordinates are still correct.
+
+    The UTM projection is replaced by a second order Taylor expansion around the origin, which is
+    precomputed once. Converting between GPS and local coordinates then takes a handful of multiplies
+    instead of the full transverse Mercator series. Use `error_bound` to know how far from the origin
+    that approximation can be trusted, or pass `exact=True` to fall back to the exact UTM projection.
+
+    Every conversion method accepts floats or NumPy arrays.
+
+    Attributes:
+        origin (Location): the origin of the frame
+        exact (bool): whether the exact UTM projection is used
+    """
+    def __init__(self, origin: Location, exact: bool=False):
+        """
+        Parameters:
+            origin (Location): The origin of the frame. Courses usually use their start or center.
+            exact (bool): Use the exact UTM projection instead of the local approximation.
+        """
+        self.origin = origin
+        self.exact = exact
+        self._lat0, self._lon0 = origin.lat, origin.lon
+        self._easting0, self._northing0 = origin.easting, origin.northing
+        self._zone_number, self._zone_letter = origin.zone_number, origin.zone_letter
+
+        self._to_local = _quadratic_coefficients(self._exact_gps_to_local, _STEP_DEGREES)
+        self._to_gps = _quadratic_coefficients(self._exact_local_to_gps, _STEP_METERS)
+
+    def _exact_gps_to_local(self, delta_lat, delta_lon):
+        easting, northing, _, _ = hooks.from_latlon("conversion.from_latlon", self._lat0 + delta_lat, self._lon0 + delta_lon,
+                                                    force_zone_number=self._zone_number,
+                                                    force_zone_letter=self._zone_letter)
+        return easting - self._easting0, northing - self._northing0
+
+    def _exact_local_to_gps(self, x, y):
+        lat, lon = hooks.to_latlon("conversion.to_latlon", self._easting0 + x, self._northing0 + y,
+                                   self._zone_number, self._zone_letter, strict=False)
+        return lat - self._lat0, _wrap_longitude(lon - self._lon0)
+
+    @hooks.instrumented("conversion.local_frame_from_gps")
+    def gps_to_local(self, lat, lon):
+        """
+        Converts GPS coordinates to local coordinates.
+
+        Returns (tuple): The (x, y) offsets in meters from the origin.
+        """
+        delta_lat = lat - self._lat0
+        delta_lon = _wrap_longitude(lon - self._lon0)
+        if self.exact:
+            return self._exact_gps_to_local(delta_lat, delta_lon)
+        return _evaluate(self._to_local[0], delta_lat, delta_lon), _evaluate(self._to_local[1], delta_lat, delta_lon)
+
+    @hooks.instrumented("conversion.local_frame_to_gps")
+    def local_to_gps(self, x, y):
+        """
+        Converts local coordinates to GPS coordinates.
+
+        Returns (tuple): The (lat, lon) in decimal degrees.
+        """
+        if self.exact:
+            delta_lat, delta_lon = self._exact_local_to_gps(x, y)
+        else:
+            delta_lat, delta_lon = _evaluate(self._to_gps[0], x, y), _evaluate(self._to_gps[1], x, y)
+        return self._lat0 + delta_lat, _wrap_longitude(self._lon0 + delta_lon)
+
+    def location_to_local(self, location: Location):
+        """
+        Returns (tuple): The (x, y) offsets in meters of the given `Location` from the origin.
+        UTM coordinates already known in the origin's zone are used as is.
+        """
+        if location._easting is not None and location._zone_number == self._zone_number \
+                and location._zone_letter == self._zone_letter:
+            return location._easting - self._easting0, location._northing - self._northing0
+        return self.gps_to_local(location.lat, location.lon)
+
+    def local_to_location(self, x: float, y: float) -> Location:
+        """
+        Returns (Location): The location at the given local coordinates. Both its GPS and UTM coordinates
+        are filled in, with the UTM coordinates expressed in the origin's zone.
+        """
+        lat, lon = self.local_to_gps(x, y)
+        return Location(lat, lon, self._easting0 + x, self._northing0 + y, self._zone_number, self._zone_letter)
+
+    def translate(self, location: Location, dx_meters: float, dy_meters: float) -> Location:
+        """
+        Same as `Location.translate`, computed inside this frame, without moving the result into another zone.
+        """
+        x, y = self.location_to_local(location)
+        return self.local_to_location(x + dx_meters, y + dy_meters)
+
+    def rotate(self, location: Location, pivot: Location, angle_cw_deg: float) -> Location:
+        """
+        Same as `Location.rotate`, computed inside this frame, without moving the result into another zone.
+        """
+        angle_rad = radians(-angle_cw_deg)
+
+        sin_angle = sin(angle_rad)
+        cos_angle = cos(angle_rad)
+
+        x, y = self.location_to_local(location)
+        pivot_x, pivot_y = self.location_to_local(pivot)
+        delta_x = x - pivot_x
+        delta_y = y - pivot_y
+
+        return self.local_to_location(pivot_x + cos_angle * delta_x - sin_angle * delta_y,
+                                      pivot_y + sin_angle * delta_x + cos_angle * delta_y)
+
+    def relative_radial_to_global_coordinates(self, location: Location, distance_of_object_meters: float,
+                                              cardinal_angle_of_object_degrees: float) -> Location:
+        """
+        Same as `relative_radial_to_global_coordinates`, computed inside this frame, without moving the result
+        into another zone.
+        """
+        x, y = self.location_to_local(location)
+        return self.local_to_location(x + distance_of_object_meters * sin(radians(cardinal_angle_of_object_degrees)),
+                                      y + distance_of_object_meters * cos(radians(cardinal_angle_of_object_degrees)))
+
+    def error_bound(self, radius_meters: float, samples: int=360) -> float:
+        """
+        Estimates the worst error, in meters, of the local approximation within `radius_meters` of the origin.
+
+        The error grows with the cube of the distance to the origin, so it is sampled on the circle of the
+        given radius, in both conversion directions, and compared against the exact UTM projection.
+
+        Returns (float): The largest error found. Always 0 for exact frames.
+        """
+        if self.exact:
+            return 0.0
+        angles = np.linspace(0, 2 * np.pi, samples, endpoint=False)
+        x, y = radius_meters * np.sin(angles), radius_meters * np.cos(angles)
+        exact_delta_lat, exact_delta_lon = self._exact_local_to_gps(x, y)
+
+        # gps -> local
+        exact_x, exact_y = self._exact_gps_to_local(exact_delta_lat, exact_delta_lon)
+        approx_x, approx_y = self.gps_to_local(self._lat0 + exact_delta_lat, self._lon0 + exact_delta_lon)
+        forward_error = np.hypot(approx_x - exact_x, approx_y - exact_y)
+
+        # local -> gps, with the error in degrees scaled to meters by the linear part of the projection
+        lat, lon = self.local_to_gps(x, y)
+        error_lat = lat - self._lat0 - exact_delta_lat
+        error_lon = _wrap_longitude(lon - self._lon0 - exact_delta_lon)
+        x_coefficients, y_coefficients = self._to_local
+        inverse_error = np.hypot(x_coefficients[1] * error_lat + x_coefficients[2] * error_lon,
+                                 y_coefficients[1] * error_lat + y_coefficients[2] * error_lon)
+
+        return float(max(inverse_error.max(), forward_error.max()))
@@ -0,0 +1,368 @@
+import numpy as np
+import utm
+
+from . import hooks
+from .uprm_gps_utils import Location, _zone_box
+
+
+_ZONE_LETTERS = np.array(list("CDEFGHJKLMNPQRSTUVWXX"))
+
+
+def _zone_numbers(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of `utm.latlon_to_zone_number`, including the Norway and Svalbard exceptions.
+    """
+    lon = (lon % 360 + 540) % 360 - 180
+    zone_numbers = ((lon + 180) // 6).astype(np.int64) + 1
+
+    norway = (56 <= lat) & (lat < 64) & (3 <= lon) & (lon < 12)
+    zone_numbers[norway] = 32
+
+    svalbard = (72 <= lat) & (lat <= 84) & (lon >= 0)
+    for upper_lon, zone_number in ((9, 31), (21, 33), (33, 35), (42, 37)):
+        in_zone = svalbard & (lon < upper_lon)
+        zone_numbers[in_zone] = zone_number
+        svalbard &= ~in_zone
+
+    return zone_numbers
+
+
+def _zone_letters(lat: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of `utm.latitude_to_zone_letter`.
+    """
+    return _ZONE_LETTERS[(lat + 80).astype(np.int64) >> 3]
+
+
+def _northern(zone_letter) -> np.ndarray:
+    """
+    Whether each zone letter is in the northern hemisphere. Case insensitive, without the cost of `np.char.upper`.
+    """
+    codes = np.asarray(zone_letter, dtype="<U1").view(np.uint32)
+    return (codes | 0x20) >= ord("n")
+
+
+def _unique(keys: np.ndarray) -> np.ndarray:
+    """
+    `np.unique`, without the sort in the common case where every key is the same.
+    """
+    if len(keys) and (keys == keys[0]).all():
+        return keys[:1]
+    return np.unique(keys)
+
+
+def _zone_groups(zone_number: np.ndarray, northern: np.ndarray):
+    """
+    Yields (zone_number, northern, index) for every distinct zone/hemisphere pair.
+    `index` is `slice(None)` when every element is in the same group, which avoids copies.
+    """
+    keys = zone_number * 2 + northern
+    unique_keys = _unique(keys)
+    if len(unique_keys) == 1:
+        yield int(zone_number[0]), bool(northern[0]), slice(None)
+        return
+    for key in unique_keys:
+        yield int(key // 2), bool(key % 2), keys == key
+
+
+def _normalize_zones(easting: np.ndarray, northing: np.ndarray, zone_number: np.ndarray, zone_letter: np.ndarray):
+    """
+    Vectorized version of `_location_from_offset_utm`, for UTM coordinates obtained by moving points of the given zones.
+
+    Points inside their zone's safe box are kept as is. The others are converted to GPS to find their actual
+    zone and band: the ones still in the same zone and hemisphere only get their zone letter updated, and the
+    rest are reprojected into their new zones.
+
+    Returns (tuple): The (easting, northing, zone_number, zone_letter) arrays. The inputs are returned
+    unchanged when every point is inside its zone.
+    """
+    codes = np.asarray(zone_letter, dtype="<U1").view(np.uint32) & np.uint32(0xDF)
+    keys = np.asarray(zone_number, dtype=np.int64) * 256 + codes
+    unique_keys = _unique(keys)
+    inside = np.zeros(easting.shape, dtype=bool)
+    for key in unique_keys:
+        box = _zone_box(int(key // 256), chr(key % 256))
+        if box is None:
+            continue
+        index = slice(None) if len(unique_keys) == 1 else keys == key
+        inside[index] = (box[0] < easting[index]) & (easting[index] < box[1]) \
+            & (box[2] < northing[index]) & (northing[index] < box[3])
+    if inside.all():
+        return easting, northing, zone_number, zone_letter
+
+    outside = np.flatnonzero(~inside)
+    easting, northing = easting.copy(), northing.copy()
+    zone_number, zone_letter = np.array(zone_number), np.array(zone_letter)
+
+    outside_easting, outside_northing = easting[outside], northing[outside]
+    outside_zone_number, outside_northern = zone_number[outside], _northern(zone_letter[outside])
+    lat = np.empty_like(outside_easting)
+    lon = np.empty_like(outside_easting)
+    for number, is_northern, index in _zone_groups(outside_zone_number, outside_northern):
+        lat[index], lon[index] = hooks.to_latlon("conversion.array_to_latlon", outside_easting[index],
+                                                 outside_northing[index], number, northern=is_northern, strict=False)
+    if lat.min() < -80 or lat.max() > 84:
+        raise utm.OutOfRangeError("latitude out of range (must be between 80 deg S and 84 deg N)")
+
+    actual_zone_number = _zone_numbers(lat, lon)
+    moved = np.flatnonzero((actual_zone_number != outside_zone_number) | ((lat >= 0) != outside_northern))
+    if len(moved):
+        moved_lat, moved_lon = lat[moved], lon[moved]
+        moved_easting = np.empty_like(moved_lat)
+        moved_northing = np.empty_like(moved_lat)
+        for number, is_northern, index in _zone_groups(actual_zone_number[moved], moved_lat >= 0):
+            moved_easting[index], moved_northing[index], _, _ = hooks.from_latlon("conversion.array_from_latlon",
+                                                                                  moved_lat[index], moved_lon[index],
+                                                                                  force_zone_number=number,
+                                                                                  force_northern=is_northern)
+        outside_easting[moved], outside_northing[moved] = moved_easting, moved_northing
+
+    easting[outside], northing[outside] = outside_easting, outside_northing
+    zone_number[outside], zone_letter[outside] = actual_zone_number, _zone_letters(lat)
+    return easting, northing, zone_number, zone_letter
+
+
+class LocationArray:
+    """
+    Columnar counterpart of `Location` for batches of points.
+
+    Like `Location`, it only stores the representation it was built from and computes
+    the other one the first time it is read. Points may span several UTM zones; each
+    zone/hemisphere is projected separately. `to_zone` expresses every point in one common zone instead.
+
+    Attributes:
+        lat (np.ndarray): latitudes in decimal degrees
+        lon (np.ndarray): longitudes in decimal degrees
+        easting (np.ndarray): eastings in meters
+        northing (np.ndarray): northings in meters
+        zone_number (np.ndarray): the utm zone numbers
+        zone_letter (np.ndarray): the utm zone letters
+    """
+    def __init__(self):
+        """
+        WARNING: Do not use the constructor externally. Use the factory class methods `from_gps`, `from_utm` and
+        `from_locations`.
+        """
+        self._lat = None
+        self._lon = None
+        self._easting = None
+        self._northing = None
+        self._zone_number = None
+        self._zone_letter = None
+        self._forced_zone = False
+
+    def _compute_gps(self):
+        """
+        Fill in the GPS representation from the UTM one.
+        """
+        lat = np.empty_like(self._easting)
+        lon = np.empty_like(self._easting)
+        northern = _northern(self._zone_letter)
+        # points forced into a common zone by `to_zone` may lie far outside its easting range
+        for zone_number, is_northern, index in _zone_groups(self._zone_number, northern):
+            lat[index], lon[index] = hooks.to_latlon("conversion.array_to_latlon", self._easting[index],
+                                                     self._northing[index], zone_number,
+                                                     northern=is_northern, strict=not self._forced_zone)
+        self._lat, self._lon = lat, lon
+
+    def _compute_utm(self):
+        """
+        Fill in the UTM representation from the GPS one.
+        """
+        easting = np.empty_like(self._lat)
+        northing = np.empty_like(self._lat)
+        zone_number = _zone_numbers(self._lat, self._lon)
+        zone_letter = _zone_letters(self._lat)
+        for number, is_northern, index in _zone_groups(zone_number, self._lat >= 0):
+            easting[index], northing[index], _, _ = hooks.from_latlon("conversion.array_from_latlon",
+                                                                      self._lat[index], self._lon[index],
+                                                                      force_zone_number=number,
+                                                                      force_northern=is_northern)
+        self._easting, self._northing, self._zone_number, self._zone_letter = easting, northing, zone_number, zone_letter
+
+    @property
+    def lat(self) -> np.ndarray:
+        if self._lat is None:
+            self._compute_gps()
+        return self._lat
+
+    @property
+    def lon(self) -> np.ndarray:
+        if self._lon is None:
+            self._compute_gps()
+        return self._lon
+
+    @property
+    def easting(self) -> np.ndarray:
+        if self._easting is None:
+            self._compute_utm()
+        return self._easting
+
+    @property
+    def northing(self) -> np.ndarray:
+        if self._northing is None:
+            self._compute_utm()
+        return self._northing
+
+    @property
+    def zone_number(self) -> np.ndarray:
+        if self._zone_number is None:
+            self._compute_utm()
+        return self._zone_number
+
+    @property
+    def zone_letter(self) -> np.ndarray:
+        if self._zone_letter is None:
+            self._compute_utm()
+        return self._zone_letter
+
+    def _from_offset_utm(self, easting: np.ndarray, northing: np.ndarray):
+        """
+        Returns a `LocationArray` for UTM coordinates obtained by moving these points. Points that leave
+        their zone are moved into the right one, unless this array was put in a common zone by `to_zone`.
+        """
+        zone_number = np.broadcast_to(self.zone_number, easting.shape)
+        zone_letter = np.broadcast_to(self.zone_letter, easting.shape)
+        if self._forced_zone:
+            locs = LocationArray.from_utm(easting, northing, zone_number, zone_letter)
+            locs._forced_zone = True
+            return locs
+        return LocationArray.from_utm(*_normalize_zones(easting, northing, zone_number, zone_letter))
+
+    @hooks.instrumented("conversion.array_to_zone")
+    def to_zone(self, zone_number: int=None, zone_letter: str=None):
+        """
+        Expresses every point in one common UTM zone, so that a whole batch can be computed in a single plane.
+        `translate` and `rotate` on the result keep that zone instead of moving points into their own zones.
+
+        Parameters:
+            zone_number (int): The common zone number. Defaults to the zone of the first point.
+            zone_letter (str): The common zone letter. Defaults to the zone letter of the first point when
+                `zone_number` is not given either. With only `zone_number`, each point keeps the letter of its
+                own latitude band, and therefore its own hemisphere.
+
+        Return a `LocationArray` in the given zone.
+        """
+        if zone_number is None:
+            zone_number, zone_letter = int(self.zone_number[0]), str(self.zone_letter[0])
+        if zone_letter is None:
+            lat, lon = self.lat, self.lon
+            easting, northing = np.empty_like(lat), np.empty_like(lat)
+            zone_letter = _zone_letters(lat)
+            for is_northern in (True, False):
+                index = np.flatnonzero((lat >= 0) == is_northern)
+                if len(index):
+                    easting[index], northing[index], _, _ = hooks.from_latlon("conversion.array_from_latlon",
+                                                                              lat[index], lon[index],
+                                                                              force_zone_number=zone_number,
+                                                                              force_northern=is_northern)
+        else:
+            easting, northing, _, _ = hooks.from_latlon("conversion.array_from_latlon", self.lat, self.lon,
+                                                        force_zone_number=zone_number, force_zone_letter=zone_letter)
+        locs = LocationArray.from_utm(easting, northing, zone_number, zone_letter)
+        locs._lat, locs._lon = self._lat, self._lon
+        locs._forced_zone = True
+        return locs
+
+    @hooks.instrumented("transform.array_translate")
+    def translate(self, dx_meters, dy_meters):
+        """
+        Simple linear translation of every coordinate.
+        Points that land outside of their UTM zone are reprojected into the right one, as in `Location.translate`.
+
+        Parameters:
+            dx_meters (float or np.ndarray): The west to east delta(s).
+            dy_meters (float or np.ndarray): The south to north delta(s).
+
+        Return a `LocationArray` with the given deltas given these locations.
+        """
+        easting, northing = np.broadcast_arrays(self.easting + dx_meters, self.northing + dy_meters)
+        return self._from_offset_utm(easting, northing)
+
+    @hooks.instrumented("transform.array_rotate")
+    def rotate(self, pivot, angle_cw_deg):
+        """
+        Performs a rotation in UTM space about the given pivot(s). Same as `Location.rotate`,
+        including the reprojection of points that land outside of their UTM zone.
+
+        Parameters:
+            pivot (Location or LocationArray): The point(s) to rotate about.
+            angle_cw_deg (float or np.ndarray): The angle(s) in degrees to rotate clockwise.
+
+        Return a `LocationArray` rotated around the given pivot(s).
+        """
+        angle_rad = np.radians(-np.asarray(angle_cw_deg, dtype=float))
+
+        sin_angle = np.sin(angle_rad)
+        cos_angle = np.cos(angle_rad)
+
+        delta_easting = self.easting - pivot.easting
+        delta_northing = self.northing - pivot.northing
+
+        result_easting = pivot.easting + cos_angle * delta_easting - sin_angle * delta_northing
+        result_northing = pivot.northing + sin_angle * delta_easting + cos_angle * delta_northing
+
+        return self._from_offset_utm(*np.broadcast_arrays(result_easting, result_northing))
+
+    @classmethod
+    def from_gps(cls, lat, lon):
+        """
+        Returned a `LocationArray` from the given GPS coordinates.
+        The UTM coordinates are only computed when they are first read.
+        """
+        locs = cls()
+        locs._lat, locs._lon = np.broadcast_arrays(np.asarray(lat, dtype=float), np.asarray(lon, dtype=float))
+        return locs
+
+    @classmethod
+    def from_utm(cls, easting, northing, zone_number, zone_letter):
+        """
+        Returned a `LocationArray` from the given UTM coordinates.
+        `zone_number` and `zone_letter` may be scalars shared by every point.
+        The GPS coordinates are only computed when they are first read.
+        """
+        easting, northing = np.broadcast_arrays(np.asarray(easting, dtype=float), np.asarray(northing, dtype=float))
+        locs = cls()
+        locs._easting, locs._northing = easting, northing
+        locs._zone_number = np.broadcast_to(np.asarray(zone_number, dtype=np.int64), easting.shape)
+        locs._zone_letter = np.broadcast_to(np.asarray(zone_letter, dtype="<U1"), easting.shape)
+        return locs
+
+    @classmethod
+    def from_locations(cls, locations):
+        """
+        Returned a `LocationArray` holding the GPS coordinates of the given `Location`s.
+        """
+        locations = list(locations)
+        return cls.from_gps([location.lat for location in locations], [location.lon for location in locations])
+
+    def __len__(self) -> int:
+        return len(self._lat if self._lat is not None else self._easting)
+
+    def __getitem__(self, index):
+        """
+        An integer index returns a `Location`; slices, masks and index arrays return a `LocationArray`.
+        """
+        if isinstance(index, (int, np.integer)):
+            lat, lon, easting, northing, zone_number, zone_letter = None, None, None, None, None, None
+            if self._lat is not None:
+                lat, lon = float(self._lat[index]), float(self._lon[index])
+            if self._easting is not None:
+                easting, northing = float(self._easting[index]), float(self._northing[index])
+                zone_number, zone_letter = int(self._zone_number[index]), str(self._zone_letter[index])
+            return Location(lat, lon, easting, northing, zone_number, zone_letter)
+
+        locs = LocationArray()
+        locs._forced_zone = self._forced_zone
+        for name in ("_lat", "_lon", "_easting", "_northing", "_zone_number", "_zone_letter"):
+            values = getattr(self, name)
+            if values is not None:
+                setattr(locs, name, values[index])
+        return locs
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __str__(self) -> str:
+        return "LocationArray(\n" + "\n".join(f"    {location}" for location in self) + "\n)"
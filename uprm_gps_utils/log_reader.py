@@ -0,0 +1,177 @@
+import mmap
+import os
+
+import numpy as np
+
+from .location_array import LocationArray
+from .uprm_gps_utils import Location
+
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def _iter_lines(source, chunk_size: int, memory_map: bool):
+    """
+    Yields the lines of `source` as bytes, without line endings, reading `chunk_size` bytes at a time.
+
+    `source` can be a path, a binary file object or a bytes-like object (bytes, bytearray, memoryview, mmap).
+    Paths are memory-mapped when `memory_map` is set.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            if memory_map and os.fstat(file.fileno()).st_size > 0:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    yield from _iter_lines(buffer, chunk_size, memory_map)
+            else:
+                yield from _iter_lines(file, chunk_size, memory_map)
+        return
+
+    if hasattr(source, "read"):
+        chunks = iter(lambda: source.read(chunk_size), b"")
+    else:
+        view = memoryview(source)
+        chunks = (bytes(view[start:start + chunk_size]) for start in range(0, len(view), chunk_size))
+
+    remainder = b""
+    for chunk in chunks:
+        lines = (remainder + chunk).split(b"\n")
+        remainder = lines.pop()
+        for line in lines:
+            yield line.rstrip(b"\r")
+    if remainder:
+        yield remainder.rstrip(b"\r")
+
+
+def _batches(coordinates, batch_size: int):
+    """
+    Groups (lat, lon) pairs into `LocationArray`s of up to `batch_size` points.
+    """
+    lat = np.empty(batch_size)
+    lon = np.empty(batch_size)
+    count = 0
+    for lat_value, lon_value in coordinates:
+        lat[count] = lat_value
+        lon[count] = lon_value
+        count += 1
+        if count == batch_size:
+            yield LocationArray.from_gps(lat.copy(), lon.copy())
+            count = 0
+    if count:
+        yield LocationArray.from_gps(lat[:count].copy(), lon[:count].copy())
+
+
+def _locations(coordinates, batch_size: int):
+    if batch_size is None:
+        return (Location.from_gps(lat, lon) for lat, lon in coordinates)
+    return _batches(coordinates, batch_size)
+
+
+def _nmea_degrees(value: bytes, hemisphere: bytes) -> float:
+    """
+    Converts an NMEA (d)ddmm.mmmm angle to decimal degrees.
+    """
+    raw = float(value)
+    degrees = int(raw / 100)
+    decimal = degrees + (raw - degrees * 100) / 60
+    return -decimal if hemisphere in (b"S", b"W") else decimal
+
+
+def _valid_checksum(line: bytes) -> bool:
+    star = line.rfind(b"*")
+    if star == -1:
+        return False
+    checksum = 0
+    for byte in line[1:star]:
+        checksum ^= byte
+    try:
+        return checksum == int(line[star + 1:star + 3], 16)
+    except ValueError:
+        return False
+
+
+def _nmea_coordinates(source, chunk_size: int, memory_map: bool, sentences, validate_checksum: bool):
+    """
+    Yields the (lat, lon) of every valid fix in an NMEA log.
+    """
+    wanted = {sentence.encode() for sentence in sentences}
+    for line in _iter_lines(source, chunk_size, memory_map):
+        if not line.startswith(b"$") or line[3:6] not in wanted:
+            continue
+        if validate_checksum and not _valid_checksum(line):
+            continue
+        fields = line.split(b"*", 1)[0].split(b",")
+        try:
+            if line[3:6] == b"GGA":
+                # $--GGA,time,lat,N/S,lon,E/W,quality,...; quality 0 means no fix
+                if fields[6] in (b"", b"0"):
+                    continue
+                yield _nmea_degrees(fields[2], fields[3]), _nmea_degrees(fields[4], fields[5])
+            else:
+                # $--RMC,time,status,lat,N/S,lon,E/W,...; status V means no fix
+                if fields[2] != b"A":
+                    continue
+                yield _nmea_degrees(fields[3], fields[4]), _nmea_degrees(fields[5], fields[6])
+        except (IndexError, ValueError):
+            continue
+
+
+def read_nmea(source, batch_size: int=None, sentences=("GGA", "RMC"), validate_checksum: bool=True,
+              chunk_size: int=DEFAULT_CHUNK_SIZE, memory_map: bool=True):
+    """
+    Streams the fixes of an NMEA log, using constant memory.
+
+    Only GGA sentences with a fix and RMC sentences with an "A" status are read, from any talker ($GP, $GN, ...).
+    Sentences that fail their checksum or cannot be parsed are skipped. A log that has both sentence types
+    yields each fix twice; pass `sentences=("GGA",)` to read one of them.
+
+    Parameters:
+        source (str, os.PathLike, binary file or bytes-like): The log to read. Paths are memory-mapped.
+        batch_size (int): When given, yield `LocationArray`s of up to this many fixes instead of `Location`s.
+        sentences (tuple): The sentence types to read, among "GGA" and "RMC".
+        validate_checksum (bool): Skip sentences with a missing or wrong checksum.
+        chunk_size (int): The number of bytes read at a time.
+        memory_map (bool): Memory-map paths instead of reading them.
+
+    Returns (generator): `Location`s, or `LocationArray`s when `batch_size` is given.
+    """
+    coordinates = _nmea_coordinates(source, chunk_size, memory_map, sentences, validate_checksum)
+    return _locations(coordinates, batch_size)
+
+
+def _csv_coordinates(source, chunk_size: int, memory_map: bool, lat_column, lon_column, delimiter: bytes):
+    """
+    Yields the (lat, lon) of every row of a CSV log.
+    """
+    lines = _iter_lines(source, chunk_size, memory_map)
+    if isinstance(lat_column, str) or isinstance(lon_column, str):
+        header = [name.strip().decode() for name in next(lines, b"").split(delimiter)]
+        lat_column = header.index(lat_column) if isinstance(lat_column, str) else lat_column
+        lon_column = header.index(lon_column) if isinstance(lon_column, str) else lon_column
+    for line in lines:
+        fields = line.split(delimiter)
+        try:
+            yield float(fields[lat_column]), float(fields[lon_column])
+        except (IndexError, ValueError):
+            continue
+
+
+def read_csv(source, lat_column="lat", lon_column="lon", delimiter: str=",", batch_size: int=None,
+             chunk_size: int=DEFAULT_CHUNK_SIZE, memory_map: bool=True):
+    """
+    Streams the fixes of a CSV log with decimal degree columns, using constant memory.
+
+    Rows whose coordinates cannot be parsed, such as blank lines, are skipped.
+
+    Parameters:
+        source (str, os.PathLike, binary file or bytes-like): The log to read. Paths are memory-mapped.
+        lat_column (str or int): The name of the latitude column in the header, or its index when there is no header.
+        lon_column (str or int): The name of the longitude column in the header, or its index when there is no header.
+        delimiter (str): The field delimiter.
+        batch_size (int): When given, yield `LocationArray`s of up to this many fixes instead of `Location`s.
+        chunk_size (int): The number of bytes read at a time.
+        memory_map (bool): Memory-map paths instead of reading them.
+
+    Returns (generator): `Location`s, or `LocationArray`s when `batch_size` is given.
+    """
+    coordinates = _csv_coordinates(source, chunk_size, memory_map, lat_column, lon_column, delimiter.encode())
+    return _locations(coordinates, batch_size)
@@ -0,0 +1,180 @@
+from math import floor, hypot
+import heapq
+
+from . import hooks
+from .uprm_gps_utils import Location
+
+
+class SpatialIndex:
+    """
+    Grid hash over the easting/northing of a set of `Location`s, for nearest-neighbour and radius queries.
+
+    Every location is projected into the UTM zone of the first location inserted, and distances are the
+    straight line distances in that plane, in meters. Locations are their own keys, so inserting a location
+    twice is a no-op and `remove` takes the location to remove.
+
+    Queries only visit the grid cells around the query point, so their cost depends on how many locations
+    are nearby rather than on the size of the index. `cell_size_meters` should be in the order of the
+    typical query radius or nearest-neighbour distance.
+    """
+    def __init__(self, locations=(), cell_size_meters: float=10.0):
+        """
+        Parameters:
+            locations (iterable of Location): The initial locations.
+            cell_size_meters (float): The side of each grid cell.
+        """
+        self.cell_size_meters = cell_size_meters
+        self._zone_number = None
+        self._zone_letter = None
+        self._points = {}
+        self._cells = {}
+        for location in locations:
+            self.insert(location)
+
+    def _project(self, location: Location):
+        """
+        Returns (tuple): The (easting, northing) of the location in the index's zone.
+        """
+        if location.zone_number == self._zone_number and location.zone_letter == self._zone_letter:
+            return location.easting, location.northing
+        easting, northing, _, _ = hooks.from_latlon("conversion.from_latlon", location.lat, location.lon,
+                                                    force_zone_number=self._zone_number,
+                                                    force_zone_letter=self._zone_letter)
+        return easting, northing
+
+    def _cell(self, easting: float, northing: float) -> tuple:
+        return floor(easting / self.cell_size_meters), floor(northing / self.cell_size_meters)
+
+    def insert(self, location: Location):
+        """
+        Adds a location to the index.
+        """
+        if location in self._points:
+            return
+        if self._zone_number is None:
+            self._zone_number, self._zone_letter = location.zone_number, location.zone_letter
+        easting, northing = self._project(location)
+        self._points[location] = (easting, northing)
+        self._cells.setdefault(self._cell(easting, northing), []).append(location)
+
+    def remove(self, location: Location):
+        """
+        Removes a location from the index. Raises a `KeyError` if it is not in the index.
+        """
+        easting, northing = self._points.pop(location)
+        cell = self._cell(easting, northing)
+        members = self._cells[cell]
+        members.remove(location)
+        if not members:
+            del self._cells[cell]
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, location: Location) -> bool:
+        return location in self._points
+
+    def __iter__(self):
+        return iter(self._points)
+
+    def _candidates_in_ring(self, cell_x: int, cell_y: int, ring: int):
+        """
+        Yields the locations in the cells at Chebyshev distance `ring` from the given cell.
+        """
+        if ring == 0:
+            yield from self._cells.get((cell_x, cell_y), ())
+            return
+        for dx in range(-ring, ring + 1):
+            yield from self._cells.get((cell_x + dx, cell_y - ring), ())
+            yield from self._cells.get((cell_x + dx, cell_y + ring), ())
+        for dy in range(-ring + 1, ring):
+            yield from self._cells.get((cell_x - ring, cell_y + dy), ())
+            yield from self._cells.get((cell_x + ring, cell_y + dy), ())
+
+    def nearest(self, location: Location, k: int=1) -> list:
+        """
+        Finds the `k` locations closest to the given one.
+
+        Returns (list): Up to `k` (Location, distance in meters) tuples, closest first.
+        """
+        if not self._points or k <= 0:
+            return []
+        easting, northing = self._project(location)
+        cell_x, cell_y = self._cell(easting, northing)
+
+        # max-heap of the best k so far, as (-distance, insertion order, location)
+        best = []
+        order = 0
+        ring = 0
+        while True:
+            # Once the ring covers more cells than are occupied, a scan of the occupied cells is cheaper.
+            if (2 * ring + 1)**2 > 4 * len(self._cells):
+                candidates = (candidate for members in self._cells.values() for candidate in members)
+                last_ring = True
+            else:
+                candidates = self._candidates_in_ring(cell_x, cell_y, ring)
+                last_ring = False
+
+            for candidate in candidates:
+                candidate_easting, candidate_northing = self._points[candidate]
+                distance = hypot(candidate_easting - easting, candidate_northing - northing)
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, order, candidate))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, order, candidate))
+                order += 1
+
+            # Every unvisited cell is at least `ring` cells away from the query.
+            if last_ring or (len(best) == k and -best[0][0] <= ring * self.cell_size_meters):
+                break
+            ring += 1
+
+        return [(candidate, -negative_distance) for negative_distance, _, candidate in sorted(best, reverse=True)]
+
+    def within(self, location: Location, radius_meters: float) -> list:
+        """
+        Finds every location within `radius_meters` of the given one.
+
+        Returns (list): (Location, distance in meters) tuples, closest first.
+        """
+        easting, northing = self._project(location)
+        min_x, min_y = self._cell(easting - radius_meters, northing - radius_meters)
+        max_x, max_y = self._cell(easting + radius_meters, northing + radius_meters)
+
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self._cells):
+            cells = (members for cell, members in self._cells.items()
+                     if min_x <= cell[0] <= max_x and min_y <= cell[1] <= max_y)
+        else:
+            cells = (self._cells.get((x, y), ()) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1))
+
+        found = []
+        for members in cells:
+            for candidate in members:
+                candidate_easting, candidate_northing = self._points[candidate]
+                distance = hypot(candidate_easting - easting, candidate_northing - northing)
+                if distance <= radius_meters:
+                    found.append((candidate, distance))
+        found.sort(key=lambda pair: pair[1])
+        return found
+
+    def nearest_many(self, locations, k: int=1) -> list:
+        """
+        Batch version of `nearest`.
+
+        Parameters:
+            locations (iterable of Location, or LocationArray): The query points.
+
+        Returns (list): One result of `nearest` per query point.
+        """
+        return [self.nearest(location, k) for location in locations]
+
+    def within_many(self, locations, radius_meters: float) -> list:
+        """
+        Batch version of `within`.
+
+        Parameters:
+            locations (iterable of Location, or LocationArray): The query points.
+
+        Returns (list): One result of `within` per query point.
+        """
+        return [self.within(location, radius_meters) for location in locations]
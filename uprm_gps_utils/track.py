@@ -0,0 +1,217 @@
+from math import asin, atan2, cos, degrees, nan, radians, sin, sqrt
+
+import numpy as np
+
+from .distance import EARTH_RADIUS_METERS
+from .location_array import LocationArray
+from .uprm_gps_utils import Location
+
+
+class Track:
+    """
+    Running distance, speed, course over ground and bounding box of a stream of GPS fixes.
+
+    Fixes are added one at a time with `add` or in batches with `add_many`. Every total is updated in
+    constant time per fix, and the sine and cosine of the last fix's latitude are kept so that each new
+    segment only computes the trigonometry of its new end. Distances use the Haversine formula of
+    `distance_between_locations`.
+
+    The most recent fixes are kept in a fixed-size ring buffer, so memory stays bounded over long missions.
+
+    Attributes:
+        count (int): the number of fixes added
+        distance_meters (float): the total distance travelled
+        speed_mps (float): the speed over the last segment, in meters per second, or None without timestamps
+        heading_deg (float): the course over ground of the last segment that moved, in cardinal degrees, or None
+        last (Location): the last fix, or None
+    """
+    def __init__(self, history_size: int=1024):
+        """
+        Parameters:
+            history_size (int): The number of recent fixes kept by `history`.
+        """
+        if history_size <= 0:
+            raise ValueError("history_size must be positive")
+        self.count = 0
+        self.distance_meters = 0.0
+        self.speed_mps = None
+        self.heading_deg = None
+        self.last = None
+        self._min_lat = self._min_lon = self._max_lat = self._max_lon = None
+        self._first_timestamp = None
+        # last timestamp seen, and timestamp of the last fix, None if it was added without one
+        self._timestamp = None
+        self._previous_timestamp = None
+        # latitude and longitude of the last fix in radians, and the sine/cosine of its latitude
+        self._lat_rad = self._lon_rad = self._sin_lat = self._cos_lat = None
+        # ring buffer of the recent fixes, with NaN timestamps for fixes added without one
+        self._history_lat = np.empty(history_size)
+        self._history_lon = np.empty(history_size)
+        self._history_time = np.empty(history_size)
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def bounding_box(self) -> tuple:
+        """
+        The (min_lat, min_lon, max_lat, max_lon) of every fix, or None.
+        """
+        if not self.count:
+            return None
+        return self._min_lat, self._min_lon, self._max_lat, self._max_lon
+
+    @property
+    def duration_seconds(self) -> float:
+        """
+        Time between the first and the last timestamped fixes, or None.
+        """
+        if self._first_timestamp is None:
+            return None
+        return self._timestamp - self._first_timestamp
+
+    @property
+    def average_speed_mps(self) -> float:
+        """
+        Total distance over the duration of the track, or None.
+        """
+        duration = self.duration_seconds
+        return self.distance_meters / duration if duration else None
+
+    def add(self, location: Location, timestamp: float=None):
+        """
+        Adds one fix to the track.
+
+        Parameters:
+            location (Location): The fix.
+            timestamp (float): The time of the fix in seconds, needed for speeds.
+        """
+        lat, lon = location.lat, location.lon
+        lat_rad, lon_rad = radians(lat), radians(lon)
+        sin_lat, cos_lat = sin(lat_rad), cos(lat_rad)
+
+        if self.count:
+            delta_lat = lat_rad - self._lat_rad
+            delta_lon = lon_rad - self._lon_rad
+            h = sin(delta_lat / 2)**2 + self._cos_lat * cos_lat * sin(delta_lon / 2)**2
+            distance = 2 * EARTH_RADIUS_METERS * asin(sqrt(min(h, 1.0)))
+            self.distance_meters += distance
+            if distance > 0:
+                self.heading_deg = degrees(atan2(sin(delta_lon) * cos_lat,
+                                                 self._cos_lat * sin_lat - self._sin_lat * cos_lat * cos(delta_lon))) % 360
+            if timestamp is not None and self._previous_timestamp is not None and timestamp > self._previous_timestamp:
+                self.speed_mps = distance / (timestamp - self._previous_timestamp)
+            if lat < self._min_lat:
+                self._min_lat = lat
+            elif lat > self._max_lat:
+                self._max_lat = lat
+            if lon < self._min_lon:
+                self._min_lon = lon
+            elif lon > self._max_lon:
+                self._max_lon = lon
+        else:
+            self._min_lat = self._max_lat = lat
+            self._min_lon = self._max_lon = lon
+
+        if timestamp is not None:
+            if self._first_timestamp is None:
+                self._first_timestamp = timestamp
+            self._timestamp = timestamp
+        self._previous_timestamp = timestamp
+
+        self._lat_rad, self._lon_rad, self._sin_lat, self._cos_lat = lat_rad, lon_rad, sin_lat, cos_lat
+        self.last = location
+        self.count += 1
+        self._history_lat[self._next] = lat
+        self._history_lon[self._next] = lon
+        self._history_time[self._next] = nan if timestamp is None else timestamp
+        self._next = (self._next + 1) % len(self._history_lat)
+
+    def add_many(self, locations, timestamps=None):
+        """
+        Adds a batch of fixes to the track, in order. Same as calling `add` on each of them, but vectorized.
+
+        Parameters:
+            locations (LocationArray): The fixes.
+            timestamps (np.ndarray): The time of each fix in seconds, needed for speeds.
+        """
+        lat = np.asarray(locations.lat, dtype=float)
+        lon = np.asarray(locations.lon, dtype=float)
+        if len(lat) == 0:
+            return
+        times = np.full(len(lat), nan) if timestamps is None else np.asarray(timestamps, dtype=float)
+        lat_rad, lon_rad = np.radians(lat), np.radians(lon)
+        sin_lat, cos_lat = np.sin(lat_rad), np.cos(lat_rad)
+
+        # segments from the previous fix, if any, through every new one
+        if self.count:
+            previous_time = nan if self._previous_timestamp is None else self._previous_timestamp
+            start_lat_rad = np.concatenate(([self._lat_rad], lat_rad[:-1]))
+            start_lon_rad = np.concatenate(([self._lon_rad], lon_rad[:-1]))
+            start_sin_lat = np.concatenate(([self._sin_lat], sin_lat[:-1]))
+            start_cos_lat = np.concatenate(([self._cos_lat], cos_lat[:-1]))
+            start_time = np.concatenate(([previous_time], times[:-1]))
+            end = slice(None)
+        else:
+            start_lat_rad, start_lon_rad = lat_rad[:-1], lon_rad[:-1]
+            start_sin_lat, start_cos_lat, start_time = sin_lat[:-1], cos_lat[:-1], times[:-1]
+            end = slice(1, None)
+
+        delta_lat = lat_rad[end] - start_lat_rad
+        delta_lon = lon_rad[end] - start_lon_rad
+        h = np.sin(delta_lat / 2)**2 + start_cos_lat * cos_lat[end] * np.sin(delta_lon / 2)**2
+        distances = 2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(np.minimum(h, 1.0)))
+        self.distance_meters += float(distances.sum())
+
+        moved = np.flatnonzero(distances > 0)
+        if len(moved):
+            i = moved[-1]
+            self.heading_deg = degrees(atan2(sin(delta_lon[i]) * cos_lat[end][i],
+                                             start_cos_lat[i] * sin_lat[end][i]
+                                             - start_sin_lat[i] * cos_lat[end][i] * cos(delta_lon[i]))) % 360
+        # speed of the last segment between two timestamped fixes with increasing time, as `add` keeps it
+        delta_time = times[end] - start_time
+        timed_segments = np.flatnonzero(delta_time > 0)
+        if len(timed_segments):
+            i = timed_segments[-1]
+            self.speed_mps = float(distances[i] / delta_time[i])
+
+        timed = np.flatnonzero(~np.isnan(times))
+        if len(timed):
+            if self._first_timestamp is None:
+                self._first_timestamp = float(times[timed[0]])
+            self._timestamp = float(times[timed[-1]])
+        self._previous_timestamp = None if np.isnan(times[-1]) else float(times[-1])
+
+        if self.count:
+            self._min_lat, self._min_lon = min(self._min_lat, float(lat.min())), min(self._min_lon, float(lon.min()))
+            self._max_lat, self._max_lon = max(self._max_lat, float(lat.max())), max(self._max_lon, float(lon.max()))
+        else:
+            self._min_lat, self._min_lon = float(lat.min()), float(lon.min())
+            self._max_lat, self._max_lon = float(lat.max()), float(lon.max())
+
+        self._lat_rad, self._lon_rad = float(lat_rad[-1]), float(lon_rad[-1])
+        self._sin_lat, self._cos_lat = float(sin_lat[-1]), float(cos_lat[-1])
+        self.last = locations[len(lat) - 1]
+        self.count += len(lat)
+
+        # only the fixes that fit in the ring buffer are written
+        size = len(self._history_lat)
+        kept = min(len(lat), size)
+        rows = (self._next + len(lat) - kept + np.arange(kept)) % size
+        self._history_lat[rows] = lat[-kept:]
+        self._history_lon[rows] = lon[-kept:]
+        self._history_time[rows] = times[-kept:]
+        self._next = (self._next + len(lat)) % size
+
+    def history(self) -> tuple:
+        """
+        Returns (tuple): A `LocationArray` of the most recent fixes, oldest first, and the array of their
+        timestamps, NaN for fixes added without one.
+        """
+        if self.count < len(self._history_lat):
+            rows = np.arange(self.count)
+        else:
+            rows = np.roll(np.arange(len(self._history_lat)), -self._next)
+        return LocationArray.from_gps(self._history_lat[rows], self._history_lon[rows]), self._history_time[rows]
@@ -1,5 +1,51 @@
+from functools import lru_cache
 from math import asin, atan2, cos, degrees, radians, sin, sqrt
-import utm
+
+from . import hooks
+from .conversion_cache import ConversionCache
+from .lazy_module import LazyModule
+
+
+# imported on first use, since utm pulls in NumPy
+utm = LazyModule("utm", globals())
+
+# Optional memo of the UTM projections done by `Location`. See `enable_conversion_cache`.
+_conversion_cache = None
+
+
+def enable_conversion_cache(maxsize: int=4096, eviction: str="lru", latlon_quantum: float=None,
+                            utm_quantum: float=None) -> ConversionCache:
+    """
+    Makes every `Location` reuse previous UTM projections of the same coordinates, which helps
+    workloads that keep rebuilding the same waypoints or pivots. Replaces any previous cache.
+
+    Parameters:
+        maxsize (int): The maximum number of cached conversions.
+        eviction (str): "lru" to evict the least recently used conversion, "fifo" to evict the oldest one.
+        latlon_quantum (float): Snap GPS coordinates to multiples of this many degrees, so close coordinates
+            share an entry. None (the default) only reuses exact matches.
+        utm_quantum (float): Snap UTM coordinates to multiples of this many meters. None only reuses exact matches.
+
+    Returns (ConversionCache): The new cache, which exposes hit/miss statistics through `stats()`.
+    """
+    global _conversion_cache
+    _conversion_cache = ConversionCache(maxsize, eviction, latlon_quantum, utm_quantum)
+    return _conversion_cache
+
+
+def disable_conversion_cache():
+    """
+    Stops caching UTM projections and drops the current cache.
+    """
+    global _conversion_cache
+    _conversion_cache = None
+
+
+def get_conversion_cache() -> ConversionCache:
+    """
+    Returns (ConversionCache): The cache in use, or None when caching is disabled.
+    """
+    return _conversion_cache
 
 
 class Location:
@@ -11,21 +57,89 @@ class Location:
         northing (float): northing in meters
         zone_number (int): the utm zone number
         zone_letter (str): the utm zone letter
+
+    Locations are immutable values: they compare equal when their UTM coordinates are equal
+    and can be used as dict keys and set members.
     """
-    def __init__(self):
+    __slots__ = ("_lat", "_lon", "_easting", "_northing", "_zone_number", "_zone_letter")
+
+    def __init__(self, lat: float=None, lon: float=None, easting: float=None, northing: float=None,
+                 zone_number: int=None, zone_letter: str=None):
         """
         WARNING: Do not use the constructor externally. Use the factory class methods `from_gps` and `from_utm`.
+
+        A `Location` only stores the representation it was built from. The other one is
+        computed the first time it is read and then cached, so chains of `translate` and
+        `rotate` never pay for projections whose results are not used.
+        """
+        self._lat = lat
+        self._lon = lon
+        self._easting = easting
+        self._northing = northing
+        self._zone_number = zone_number
+        self._zone_letter = zone_letter
+
+    def _compute_gps(self):
+        """
+        Fill in the GPS representation from the UTM one.
         """
-        self.lat = None
-        self.lon = None
-        self.easting = None
-        self.northing = None
-        self.zone_number = None
-        self.zone_letter = None
+        if _conversion_cache is None:
+            self._lat, self._lon = hooks.to_latlon("conversion.to_latlon", self._easting, self._northing,
+                                                   self._zone_number, self._zone_letter)
+        else:
+            self._lat, self._lon = _conversion_cache.to_latlon(self._easting, self._northing, self._zone_number, self._zone_letter)
 
+    def _compute_utm(self):
+        """
+        Fill in the UTM representation from the GPS one.
+        """
+        if _conversion_cache is None:
+            self._easting, self._northing, self._zone_number, self._zone_letter = \
+                hooks.from_latlon("conversion.from_latlon", self._lat, self._lon)
+        else:
+            self._easting, self._northing, self._zone_number, self._zone_letter = _conversion_cache.from_latlon(self._lat, self._lon)
+
+    @property
+    def lat(self) -> float:
+        if self._lat is None:
+            self._compute_gps()
+        return self._lat
+
+    @property
+    def lon(self) -> float:
+        if self._lon is None:
+            self._compute_gps()
+        return self._lon
+
+    @property
+    def easting(self) -> float:
+        if self._easting is None:
+            self._compute_utm()
+        return self._easting
+
+    @property
+    def northing(self) -> float:
+        if self._northing is None:
+            self._compute_utm()
+        return self._northing
+
+    @property
+    def zone_number(self) -> int:
+        if self._zone_number is None:
+            self._compute_utm()
+        return self._zone_number
+
+    @property
+    def zone_letter(self) -> str:
+        if self._zone_letter is None:
+            self._compute_utm()
+        return self._zone_letter
+
+    @hooks.instrumented("transform.translate")
     def translate(self, dx_meters: float, dy_meters: float):
         """
         Simple linear translation of the coordinate.
+        If the result lands outside of this location's UTM zone, it is reprojected into the right one.
 
         Parameters:
             dx_meters (float): The west to east delta.
@@ -33,11 +147,12 @@ class Location:
 
         Return a `Location` with the given deltas given this location.
         """
-        return Location.from_utm(easting=self.easting+dx_meters,
-                                 northing=self.northing+dy_meters,
-                                 zone_number=self.zone_number,
-                                 zone_letter=self.zone_letter)
+        return _location_from_offset_utm(easting=self.easting+dx_meters,
+                                         northing=self.northing+dy_meters,
+                                         zone_number=self.zone_number,
+                                         zone_letter=self.zone_letter)
     
+    @hooks.instrumented("transform.rotate")
     def rotate(self, pivot, angle_cw_deg: float):
         """
         Perrms a rotation in UTM space about the given pivot.
@@ -48,6 +163,8 @@ class Location:
             pivot (Location): The point to rotate about.
             angle_cw_deg (float): The angle in degrees to rotate clockwise. Use a negative number for counter-clockwise rotation.
 
+        If the result lands outside of this location's UTM zone, it is reprojected into the right one.
+
         Return a `Location` rotated around the given pivot.
         """
         angle_rad = radians(-angle_cw_deg) # Flips the angle to make rotatrion clockwise by default.
@@ -61,75 +178,229 @@ class Location:
         result_easting = pivot.easting + cos_angle * delta_easting - sin_angle * delta_norhting
         result_northing = pivot.northing + sin_angle * delta_easting + cos_angle * delta_norhting
 
-        return Location.from_utm(easting=result_easting,
-                                 northing=result_northing,
-                                 zone_number=self.zone_number,
-                                 zone_letter=self.zone_letter)
+        return _location_from_offset_utm(easting=result_easting,
+                                         northing=result_northing,
+                                         zone_number=self.zone_number,
+                                         zone_letter=self.zone_letter)
     
     @classmethod
     def from_gps(cls, lat: float, lon: float):
         """
         Returned a `Location` from the given GPS coordinates.
+        The UTM coordinates are only computed when they are first read.
         """
-        loc = cls()
-        loc.lat, loc.lon = lat, lon
-        loc.easting, loc.northing, loc.zone_number, loc.zone_letter = utm.from_latlon(lat, lon)
-        return loc 
+        return cls(lat, lon)
 
     @classmethod
     def from_utm(cls, easting: float, northing: float, zone_number: int, zone_letter: str):
         """
         Returned a `Location` from the given UTM coordinates.
+        The GPS coordinates are only computed when they are first read.
         """
-        loc = cls()
-        loc.easting, loc.northing, loc.zone_number, loc.zone_letter = easting, northing, zone_number, zone_letter
-        loc.lat, loc.lon = utm.to_latlon(easting, northing, zone_number, zone_letter)
-        return loc
+        return cls(None, None, easting, northing, zone_number, zone_letter)
     
+    def _utm_key(self) -> tuple:
+        return (self.easting, self.northing, self.zone_number, self.zone_letter.upper())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Location):
+            return NotImplemented
+        return self._utm_key() == other._utm_key()
+
+    def __hash__(self) -> int:
+        return hash(self._utm_key())
+
     def __str__(self) -> str:
         string = f"GPS(lat: {self.lat}, lon: {self.lon}) | "
         string += f"UTM(east: {self.easting}, north: {self.northing}, zone_num: {self.zone_number}, zone_let: {self.zone_letter})"
         return string
     
 
+# Zones and bands whose boundaries don't follow the regular 6º x 8º grid.
+_IRREGULAR_ZONES = {(31, "V"), (32, "V"), (31, "X"), (33, "X"), (35, "X"), (37, "X")}
+
+# Meters kept between a zone's boundaries and its safe box, to absorb the round-off of the projection.
+_ZONE_BOX_MARGIN_METERS = 1
+
+
+@lru_cache(maxsize=None)
+def _zone_box(zone_number: int, zone_letter: str):
+    """
+    Largest easting/northing box that lies entirely inside the given zone and latitude band.
+
+    Meridians and parallels are monotonic curves in UTM space, so the box is bounded by the projections
+    of the band's corners and of its central meridian.
+
+    Returns (tuple): (min_easting, max_easting, min_northing, max_northing), or None for irregular zones.
+    """
+    zone_letter = zone_letter.upper()
+    if (zone_number, zone_letter) in _IRREGULAR_ZONES:
+        return None
+    band = "CDEFGHJKLMNPQRSTUVWX".index(zone_letter)
+    south_lat = -80 + 8 * band
+    north_lat = 84 if zone_letter == "X" else south_lat + 8
+    west_lon = -180 + 6 * (zone_number - 1)
+    central_lon = west_lon + 3
+    east_lon = west_lon + 6
+
+    def project(lat, lon):
+        easting, northing, _, _ = hooks.from_latlon("conversion.from_latlon", lat, lon,
+                                                    force_zone_number=zone_number, force_zone_letter=zone_letter)
+        return easting, northing
+
+    west = [project(lat, west_lon)[0] for lat in (south_lat, north_lat)]
+    east = [project(lat, east_lon)[0] for lat in (south_lat, north_lat)]
+    south = [project(south_lat, lon)[1] for lon in (west_lon, central_lon, east_lon)]
+    north = [project(north_lat, lon)[1] for lon in (west_lon, central_lon, east_lon)]
+    return (max(west) + _ZONE_BOX_MARGIN_METERS, min(east) - _ZONE_BOX_MARGIN_METERS,
+            max(south) + _ZONE_BOX_MARGIN_METERS, min(north) - _ZONE_BOX_MARGIN_METERS)
+
+
+def _location_from_offset_utm(easting: float, northing: float, zone_number: int, zone_letter: str) -> Location:
+    """
+    Returns a `Location` for UTM coordinates obtained by moving a point of the given zone.
+
+    Coordinates inside the zone's safe box (see `_zone_box`) are used as is, which only costs a few comparisons.
+    Otherwise, the point is converted to GPS to find its actual zone and band: if it is still in the same zone
+    and hemisphere only the zone letter is updated, and if not it is reprojected into its new zone.
+    """
+    box = _zone_box(zone_number, zone_letter)
+    if box is not None and box[0] < easting < box[1] and box[2] < northing < box[3]:
+        return Location(None, None, easting, northing, zone_number, zone_letter)
+
+    northern = zone_letter.upper() >= "N"
+    lat, lon = hooks.to_latlon("conversion.to_latlon", easting, northing, zone_number, northern=northern, strict=False)
+    actual_letter = utm.latitude_to_zone_letter(lat)
+    if actual_letter is not None and (actual_letter >= "N") == northern \
+            and utm.latlon_to_zone_number(lat, lon) == zone_number:
+        return Location(lat, lon, easting, northing, zone_number, actual_letter)
+    return Location.from_gps(lat, lon)
+
+
+def _rotation_matrix(yaw_rad: float, pitch_rad: float, roll_rad: float) -> tuple:
+    """
+    Body (forward-right-down) to world (north-east-down) rotation matrix for Z-Y-X (yaw, pitch, roll) angles.
+
+    Returns (tuple): The three rows of the matrix.
+    """
+    sin_yaw, cos_yaw = sin(yaw_rad), cos(yaw_rad)
+    sin_pitch, cos_pitch = sin(pitch_rad), cos(pitch_rad)
+    sin_roll, cos_roll = sin(roll_rad), cos(roll_rad)
+    return (
+        (cos_yaw * cos_pitch,
+         cos_yaw * sin_pitch * sin_roll - sin_yaw * cos_roll,
+         cos_yaw * sin_pitch * cos_roll + sin_yaw * sin_roll),
+        (sin_yaw * cos_pitch,
+         sin_yaw * sin_pitch * sin_roll + cos_yaw * cos_roll,
+         sin_yaw * sin_pitch * cos_roll - cos_yaw * sin_roll),
+        (-sin_pitch,
+         cos_pitch * sin_roll,
+         cos_pitch * cos_roll),
+    )
+
+
 class Attitude:
-    def __init__(self):
+    """
+    Attributes:
+        yaw_deg (float): yaw in degrees
+        roll_deg (float): roll in degrees
+        pitch_deg (float): pitch in degrees
+        yaw_rad (float): yaw in radians
+        roll_rad (float): roll in radians
+        pitch_rad (float): pitch in radians
+        rotation_matrix (tuple): body to world rotation matrix
+
+    Attitudes are immutable values: they compare equal when their angles in radians are equal.
+
+    Angles follow the aerospace convention, applied in yaw, pitch, roll order (Z-Y-X): a positive yaw turns
+    the bow clockwise from north, a positive pitch raises the bow and a positive roll lowers the starboard side.
+    The body frame is forward-right-down and the world frame is north-east-down.
+    """
+    __slots__ = ("_yaw_deg", "_roll_deg", "_pitch_deg", "_yaw_rad", "_roll_rad", "_pitch_rad", "_rotation_matrix")
+
+    def __init__(self, yaw_deg: float, roll_deg: float, pitch_deg: float, yaw_rad: float, roll_rad: float, pitch_rad: float):
         """
         WARNING: Do not use the constructor externally. Use the factory class methods `from_deg` and `from_rad`.
         """
-        self.yaw_deg = None
-        self.roll_deg = None
-        self.pitch_deg = None
-        self.yaw_rad = None
-        self.roll_rad = None
-        self.pitch_rad = None
+        self._yaw_deg = yaw_deg
+        self._roll_deg = roll_deg
+        self._pitch_deg = pitch_deg
+        self._yaw_rad = yaw_rad
+        self._roll_rad = roll_rad
+        self._pitch_rad = pitch_rad
+        self._rotation_matrix = None
+
+    @property
+    def yaw_deg(self) -> float:
+        return self._yaw_deg
+
+    @property
+    def roll_deg(self) -> float:
+        return self._roll_deg
+
+    @property
+    def pitch_deg(self) -> float:
+        return self._pitch_deg
+
+    @property
+    def yaw_rad(self) -> float:
+        return self._yaw_rad
+
+    @property
+    def roll_rad(self) -> float:
+        return self._roll_rad
+
+    @property
+    def pitch_rad(self) -> float:
+        return self._pitch_rad
+
+    @property
+    def rotation_matrix(self) -> tuple:
+        """
+        The body to world rotation matrix, as a tuple of rows. It is computed on first use and then reused,
+        so every detection of a frame shares it.
+        """
+        if self._rotation_matrix is None:
+            self._rotation_matrix = _rotation_matrix(self._yaw_rad, self._pitch_rad, self._roll_rad)
+        return self._rotation_matrix
+
+    def body_to_world(self, forward, right, down) -> tuple:
+        """
+        Rotates offsets from the vehicle's body frame into the world frame. Works on floats and arrays.
+
+        Parameters:
+            forward (float): Offset towards the bow.
+            right (float): Offset towards starboard.
+            down (float): Offset towards the keel.
+
+        Returns (tuple): The (north, east, down) offsets, in the units of the inputs.
+        """
+        (r11, r12, r13), (r21, r22, r23), (r31, r32, r33) = self.rotation_matrix
+        return (r11 * forward + r12 * right + r13 * down,
+                r21 * forward + r22 * right + r23 * down,
+                r31 * forward + r32 * right + r33 * down)
 
     @classmethod
     def from_deg(cls, yaw: float=0, roll: float=0, pitch: float=0):
-        att = cls()
-        att.yaw_deg = yaw
-        att.roll_deg = roll
-        att.pitch_deg = pitch
-        att.yaw_rad = radians(yaw)
-        att.roll_rad = radians(roll)
-        att.pitch_rad = radians(pitch)
-        return att
+        return cls(yaw, roll, pitch, radians(yaw), radians(roll), radians(pitch))
 
     @classmethod
     def from_rad(cls, yaw: float=0, roll: float=0, pitch: float=0):
-        att = cls()
-        att.yaw_deg = degrees(yaw)
-        att.roll_deg = degrees(roll)
-        att.pitch_deg = degrees(pitch)
-        att.yaw_rad = yaw
-        att.roll_rad = roll
-        att.pitch_rad = pitch
-        return att
+        return cls(degrees(yaw), degrees(roll), degrees(pitch), yaw, roll, pitch)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Attitude):
+            return NotImplemented
+        return (self._yaw_rad, self._roll_rad, self._pitch_rad) == (other._yaw_rad, other._roll_rad, other._pitch_rad)
+
+    def __hash__(self) -> int:
+        return hash((self._yaw_rad, self._roll_rad, self._pitch_rad))
     
     def __str__(self) -> str:
         return f"YAW({self.yaw_deg}º) | ROLL({self.roll_deg}º) | PITCH({self.pitch_deg}º)"
    
 
+@hooks.instrumented("angle.normalize_angle")
 def normalize_angle(angle) -> float:
     """
     Will normalize any angle given to be within the [0º,360º) range.
@@ -141,6 +412,7 @@ def normalize_angle(angle) -> float:
     return angle % 360
 
 
+@hooks.instrumented("angle.relative_angle_to_cardinal_angle")
 def relative_angle_to_cardinal_angle(angle_relative_to_vehicle: float, yaw: float, rel_north=0) -> float:
     """
     Given the yaw of the vehicle and the angle of an object,
@@ -164,14 +436,13 @@ def relative_angle_to_cardinal_angle(angle_relative_to_vehicle: float, yaw: floa
     return normalize_angle((angle_relative_to_vehicle - rel_north) + yaw)
 
 
+@hooks.instrumented("transform.relative_radial_to_global_coordinates")
 def relative_radial_to_global_coordinates(location: Location, distance_of_object_meters: float, cardinal_angle_of_object_degrees: float) -> Location:
     """
     Given an object's distance to the vehicle and angle with respect to cardinal directions,
     computes the object's GPS coordinates.
 
-    WARNING:
-        This function is untested for cases where there is a UTM zone transition.
-        However, for our purposes that is extremely unlikely.
+    If the object lands outside of the vehicle's UTM zone, its location is reprojected into the right one.
 
     WARNING:
         This function likely fails in areas where the assumption that longitude
@@ -203,13 +474,15 @@ def relative_radial_to_global_coordinates(location: Location, distance_of_object
     object_easting = location.easting + delta_easting
     object_northing = location.northing + delta_northing
 
-    return Location.from_utm(object_easting, object_northing, location.zone_number, location.zone_letter) 
+    return _location_from_offset_utm(object_easting, object_northing, location.zone_number, location.zone_letter)
 
 
+@hooks.instrumented("distance.distance_between_locations")
 def distance_between_locations(locationA: Location, locationB: Location) -> float:
     """
     Compute the distance between two GPS coordinates.
-    This function is accurate to the centimeter.
+    Uses the Haversine formula on a sphere, which can be off by up to ~0.5% from the true (ellipsoidal) distance.
+    See `distances_between_locations` for batches and for more accurate or cheaper methods.
 
     Source: https://www.geeksforgeeks.org/program-distance-two-points-earth/
     """
@@ -0,0 +1,113 @@
+from math import ceil, cos, radians, sin
+
+import numpy as np
+
+from .detections import _offsets_to_locations
+from .location_array import LocationArray
+from .uprm_gps_utils import Location
+
+
+def _heading_offsets(location: Location, heading_deg: float, forward_meters, right_meters) -> LocationArray:
+    """
+    Rotates heading-relative offsets into easting/northing offsets and adds them to `location`.
+    """
+    sin_heading, cos_heading = sin(radians(heading_deg)), cos(radians(heading_deg))
+    forward_meters, right_meters = np.broadcast_arrays(np.asarray(forward_meters, dtype=float),
+                                                       np.asarray(right_meters, dtype=float))
+    easting = forward_meters * sin_heading + right_meters * cos_heading
+    northing = forward_meters * cos_heading - right_meters * sin_heading
+    return _offsets_to_locations(location, easting, northing)
+
+
+def offset_waypoints(location: Location, heading_deg: float, forward_meters, right_meters) -> LocationArray:
+    """
+    Waypoints at the given offsets from a location, relative to a heading. Replaces chains of
+    `translate(...).rotate(...)` calls with a single vectorized pass.
+
+    Parameters:
+        location (Location): The reference location, usually an object or the vehicle.
+        heading_deg (float): The cardinal angle of the pattern's front. North is 0º and angles sweep clockwise.
+        forward_meters (np.ndarray): Offset of each waypoint towards the front.
+        right_meters (np.ndarray): Offset of each waypoint towards the right.
+
+    Returns (LocationArray): The waypoints, in the order of the offsets.
+    """
+    return _heading_offsets(location, heading_deg, forward_meters, right_meters)
+
+
+def orbit_waypoints(center: Location, radius_meters: float, count: int, start_angle_deg: float=0,
+                    clockwise: bool=True) -> LocationArray:
+    """
+    Waypoints evenly spaced on a circle around a location.
+
+    Parameters:
+        center (Location): The center of the circle.
+        radius_meters (float): The radius of the circle.
+        count (int): The number of waypoints.
+        start_angle_deg (float): The cardinal angle of the first waypoint, seen from the center.
+        clockwise (bool): The direction in which the waypoints go around the center.
+
+    Returns (LocationArray): The waypoints, in order.
+    """
+    step = 360 / count if clockwise else -360 / count
+    angles = np.radians(start_angle_deg + step * np.arange(count))
+    return _offsets_to_locations(center, radius_meters * np.sin(angles), radius_meters * np.cos(angles))
+
+
+def gate_waypoints(left, right, distance_meters: float) -> LocationArray:
+    """
+    Waypoints to pass through gates, such as pairs of buoys: one before and one after the middle of each
+    gate, on the line perpendicular to it. Going from the first waypoint to the second one leaves `left`
+    on the left side and `right` on the right side.
+
+    Parameters:
+        left (Location or LocationArray): The left marker of each gate.
+        right (Location or LocationArray): The right marker of each gate, in the same UTM zone as `left`.
+        distance_meters (float): The distance of the waypoints to the middle of the gate.
+
+    Returns (LocationArray): The (before, after) waypoints of every gate, one gate after the other.
+    """
+    left_easting, left_northing = np.atleast_1d(left.easting), np.atleast_1d(left.northing)
+    delta_easting = np.atleast_1d(right.easting) - left_easting
+    delta_northing = np.atleast_1d(right.northing) - left_northing
+    width = np.hypot(delta_easting, delta_northing)
+
+    # the forward direction is the left-to-right direction rotated 90º counterclockwise
+    forward_easting = -delta_northing / width * distance_meters
+    forward_northing = delta_easting / width * distance_meters
+    middle_easting = left_easting + delta_easting / 2
+    middle_northing = left_northing + delta_northing / 2
+
+    easting = np.empty(2 * len(width))
+    northing = np.empty(2 * len(width))
+    easting[0::2], northing[0::2] = middle_easting - forward_easting, middle_northing - forward_northing
+    easting[1::2], northing[1::2] = middle_easting + forward_easting, middle_northing + forward_northing
+
+    reference = left if isinstance(left, Location) else left[0]
+    return _offsets_to_locations(reference, easting - reference.easting, northing - reference.northing)
+
+
+def lawnmower_waypoints(corner: Location, heading_deg: float, length_meters: float, width_meters: float,
+                        spacing_meters: float, points_per_lane: int=2) -> LocationArray:
+    """
+    Waypoints of a lawnmower (boustrophedon) survey of a rectangle.
+
+    Lanes run along the heading, starting at `corner`, and are `spacing_meters` apart towards the right
+    until the whole width is covered, the last one running along the far edge. Every other lane is run
+    backwards so the path is continuous.
+
+    Parameters:
+        corner (Location): The start of the first lane.
+        heading_deg (float): The cardinal angle of the first lane. North is 0º and angles sweep clockwise.
+        length_meters (float): The length of each lane.
+        width_meters (float): The width of the surveyed area.
+        spacing_meters (float): The distance between lanes.
+        points_per_lane (int): The number of waypoints on each lane, including both ends.
+
+    Returns (LocationArray): The waypoints, in order.
+    """
+    lanes = ceil(width_meters / spacing_meters) + 1
+    along = np.linspace(0, length_meters, points_per_lane)
+    forward_meters = np.tile(np.concatenate((along, along[::-1])), (lanes + 1) // 2)[:lanes * points_per_lane]
+    right_meters = np.repeat(np.minimum(spacing_meters * np.arange(lanes), width_meters), points_per_lane)
+    return _heading_offsets(corner, heading_deg, forward_meters, right_meters)